@@ -0,0 +1,94 @@
+"""
+Benchmark the compiled event indexers in zipline.pipeline.loaders.utils
+against the pure-Python loops they replaced.
+
+Usage: python etc/bench_event_indexers.py [--events N] [--sids N]
+"""
+from timeit import default_timer
+
+import click
+import numpy as np
+import pandas as pd
+
+from zipline.pipeline.loaders.utils import (
+    next_event_indexer,
+    previous_event_indexer,
+)
+
+
+def python_next_event_indexer(all_dates,
+                              all_sids,
+                              event_dates,
+                              event_timestamps,
+                              event_sids):
+    out = np.full((len(all_dates), len(all_sids)), -1, dtype=np.int64)
+    sid_ixs = all_sids.searchsorted(event_sids)
+    dt_ixs = all_dates.searchsorted(event_dates, side='right')
+    ts_ixs = all_dates.searchsorted(event_timestamps)
+    for i in range(len(event_sids) - 1, -1, -1):
+        out[ts_ixs[i]:dt_ixs[i], sid_ixs[i]] = i
+    return out
+
+
+def python_previous_event_indexer(all_dates,
+                                  all_sids,
+                                  event_dates,
+                                  event_timestamps,
+                                  event_sids):
+    out = np.full((len(all_dates), len(all_sids)), -1, dtype=np.int64)
+    eff_dts = np.maximum(event_dates, event_timestamps)
+    sid_ixs = all_sids.searchsorted(event_sids)
+    dt_ixs = all_dates.searchsorted(eff_dts)
+    last_written = {}
+    for i in range(len(event_dates) - 1, -1, -1):
+        sid_ix = sid_ixs[i]
+        dt_ix = dt_ixs[i]
+        out[dt_ix:last_written.get(sid_ix, None), sid_ix] = i
+        last_written[sid_ix] = dt_ix
+    return out
+
+
+def time_call(f, *args):
+    start = default_timer()
+    result = f(*args)
+    return default_timer() - start, result
+
+
+@click.command()
+@click.option('--events', default=1000000, help='Number of events.')
+@click.option('--sids', default=3000, help='Number of sids.')
+@click.option('--seed', default=0, help='Random seed.')
+def main(events, sids, seed):
+    rand = np.random.RandomState(seed)
+    all_dates = pd.date_range('2005', '2015', tz='UTC')
+    all_sids = pd.Int64Index(np.arange(sids))
+
+    event_dates = np.sort(rand.choice(all_dates.values, events))
+    event_timestamps = event_dates - rand.randint(
+        0,
+        60,
+        events,
+    ).astype('timedelta64[D]')
+    event_sids = rand.randint(0, sids, events)
+    args = (all_dates, all_sids, event_dates, event_timestamps, event_sids)
+
+    indexers = [
+        ('next', next_event_indexer, python_next_event_indexer),
+        ('previous', previous_event_indexer, python_previous_event_indexer),
+    ]
+    for name, compiled, python in indexers:
+        compiled_time, compiled_result = time_call(compiled, *args)
+        python_time, python_result = time_call(python, *args)
+        assert (compiled_result == python_result).all()
+        click.echo(
+            '%-8s python: %.3fs  compiled: %.3fs  speedup: %.1fx' % (
+                name,
+                python_time,
+                compiled_time,
+                python_time / compiled_time,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -82,6 +82,9 @@ ext_modules = [
     Extension('zipline.assets._assets', ['zipline/assets/_assets.pyx']),
     Extension('zipline.lib.adjustment', ['zipline/lib/adjustment.pyx']),
     Extension('zipline.lib._factorize', ['zipline/lib/_factorize.pyx']),
+    Extension(
+        'zipline.lib._float32window', ['zipline/lib/_float32window.pyx']
+    ),
     Extension(
         'zipline.lib._float64window', ['zipline/lib/_float64window.pyx']
     ),
@@ -91,6 +94,10 @@ ext_modules = [
     Extension('zipline.lib.rank', ['zipline/lib/rank.pyx']),
     Extension('zipline.data._equities', ['zipline/data/_equities.pyx']),
     Extension('zipline.data._adjustments', ['zipline/data/_adjustments.pyx']),
+    Extension(
+        'zipline.pipeline.loaders._events',
+        ['zipline/pipeline/loaders/_events.pyx'],
+    ),
     Extension('zipline._protocol', ['zipline/_protocol.pyx']),
     Extension('zipline.gens.sim_engine', ['zipline/gens/sim_engine.pyx']),
     Extension(
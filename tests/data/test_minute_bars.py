@@ -13,14 +13,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from datetime import timedelta
+from multiprocessing.pool import ThreadPool
 import os
+from unittest import skip
 
+from mock import patch
 from numpy import (
     arange,
     array,
     int64,
     float64,
     full,
+    isnan,
+    memmap,
     nan,
     transpose,
     zeros,
@@ -42,7 +47,12 @@ from zipline.data.minute_bars import (
     BcolzMinuteBarReader,
     BcolzMinuteOverlappingData,
     US_EQUITIES_MINUTES_PER_DAY,
-    BcolzMinuteWriterColumnMismatch
+    BcolzMinuteWriterColumnMismatch,
+    ConsolidatedMinuteBarReader,
+    ConsolidatedMinuteBarWriter,
+    MemmapMinuteBarReader,
+    MemmapMinuteBarWriter,
+    MinuteBarBlockCache,
 )
 
 from zipline.testing.fixtures import (
@@ -61,6 +71,8 @@ TEST_CALENDAR_STOP = Timestamp('2015-12-31', tz='UTC')
 class BcolzMinuteBarTestCase(WithTradingCalendars,
                              WithInstanceTmpDir,
                              ZiplineTestCase):
+    writer_class = BcolzMinuteBarWriter
+    reader_class = BcolzMinuteBarReader
 
     @classmethod
     def init_class_fixtures(cls):
@@ -81,14 +93,14 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
 
         self.dest = self.instance_tmpdir.getpath('minute_bars')
         os.makedirs(self.dest)
-        self.writer = BcolzMinuteBarWriter(
+        self.writer = self.writer_class(
             self.dest,
             self.trading_calendar,
             TEST_CALENDAR_START,
             TEST_CALENDAR_STOP,
             US_EQUITIES_MINUTES_PER_DAY,
         )
-        self.reader = BcolzMinuteBarReader(self.dest)
+        self.reader = self.reader_class(self.dest)
 
     def test_version(self):
         metadata = self.reader._get_metadata()
@@ -748,7 +760,7 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
             index=minutes)
         self.writer.write_sid(sids[1], data_2)
 
-        reader = BcolzMinuteBarReader(self.dest)
+        reader = self.reader_class(self.dest)
 
         columns = ['open', 'high', 'low', 'close', 'volume']
         sids = [sids[0], sids[1]]
@@ -800,7 +812,7 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
             index=minutes)
         self.writer.write_sid(sids[1], data_2)
 
-        reader = BcolzMinuteBarReader(self.dest)
+        reader = self.reader_class(self.dest)
 
         columns = ['open', 'high', 'low', 'close', 'volume']
         sids = [sids[0], sids[1]]
@@ -943,3 +955,248 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
         # Read the attributes
         for k, v in attrs.items():
             self.assertEqual(self.reader.get_sid_attr(sid, k), v)
+
+    def test_get_values(self):
+        start_minute = self.market_opens[TEST_CALENDAR_START]
+        minutes = date_range(start_minute, periods=30, freq='min')
+        for sid in 1, 2, 3:
+            values = arange(1.0, 31.0) + sid
+            values[sid::5] = nan
+            self.writer.write_sid(sid, DataFrame(
+                data={
+                    'open': values,
+                    'high': values + 1,
+                    'low': values - 1,
+                    'close': values,
+                    'volume': arange(30) * sid,
+                },
+                index=minutes,
+            ))
+
+        sids = [3, 1, 2]
+        end_minute = self.market_closes[TEST_CALENDAR_START]
+        for minute in minutes[0], minutes[3], minutes[-1], end_minute:
+            for field in 'open', 'high', 'low', 'close', 'volume':
+                result = self.reader.get_values(sids, minute, field)
+                expected = [
+                    self.reader.get_value(sid, minute, field) for sid in sids
+                ]
+                assert_array_equal(result, expected)
+
+        with self.assertRaises(NoDataOnDate):
+            self.reader.get_values(
+                sids,
+                start_minute - timedelta(minutes=1),
+                'close',
+            )
+
+    def test_load_raw_arrays_with_pool(self):
+        start_minute = self.market_opens[TEST_CALENDAR_START]
+        minutes = date_range(start_minute, periods=30, freq='min')
+        sids = [1, 2, 3, 4]
+        for sid in sids:
+            values = arange(1.0, 31.0) + sid
+            values[sid::5] = nan
+            self.writer.write_sid(sid, DataFrame(
+                data={
+                    'open': values,
+                    'high': values + 1,
+                    'low': values - 1,
+                    'close': values,
+                    'volume': arange(30) * sid,
+                },
+                index=minutes,
+            ))
+
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        # Include the day's close to read past the written minutes.
+        end_minute = self.market_closes[TEST_CALENDAR_START]
+        expected = self.reader.load_raw_arrays(
+            columns, minutes[0], end_minute, sids,
+        )
+        pool = ThreadPool(4)
+        try:
+            reader = self.reader_class(self.dest, pool=pool)
+            result = reader.load_raw_arrays(
+                columns, minutes[0], end_minute, sids,
+            )
+        finally:
+            pool.close()
+            pool.join()
+
+        for expected_array, result_array in zip(expected, result):
+            self.assertEqual(expected_array.dtype, result_array.dtype)
+            assert_array_equal(expected_array, result_array)
+
+    def test_block_cache(self):
+        start_minute = self.market_opens[TEST_CALENDAR_START]
+        minutes = date_range(start_minute, periods=30, freq='min')
+        sids = [1, 2]
+        for sid in sids:
+            values = arange(1.0, 31.0) + sid
+            self.writer.write_sid(sid, DataFrame(
+                data={
+                    'open': values,
+                    'high': values + 1,
+                    'low': values - 1,
+                    'close': values,
+                    'volume': arange(30) * sid,
+                },
+                index=minutes,
+            ))
+
+        cache = MinuteBarBlockCache()
+        reader = self.reader_class(self.dest, block_cache=cache)
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        end_minute = self.market_closes[TEST_CALENDAR_START]
+        expected = self.reader.load_raw_arrays(
+            columns, minutes[0], end_minute, sids,
+        )
+        for _ in range(2):
+            result = reader.load_raw_arrays(
+                columns, minutes[0], end_minute, sids,
+            )
+            for expected_array, result_array in zip(expected, result):
+                assert_array_equal(expected_array, result_array)
+
+        # Each (sid, field) fits in one block, which was loaded once.
+        self.assertEqual(cache.misses, len(sids) * len(columns))
+        self.assertEqual(cache.hits, len(sids) * len(columns))
+
+        for minute in minutes[0], minutes[-1], end_minute:
+            for sid in sids:
+                for field in columns:
+                    self.assertEqual(
+                        reader.get_value(sid, minute, field),
+                        self.reader.get_value(sid, minute, field),
+                    )
+        self.assertEqual(cache.misses, len(sids) * len(columns))
+
+        # Blocks larger than the budget aren't kept.
+        cache = MinuteBarBlockCache(max_bytes=0)
+        reader = self.reader_class(self.dest, block_cache=cache)
+        reader.get_value(1, minutes[0], 'close')
+        reader.get_value(1, minutes[0], 'close')
+        self.assertEqual((cache.hits, cache.misses, cache.nbytes), (0, 2, 0))
+
+
+class MemmapMinuteBarTestCase(BcolzMinuteBarTestCase):
+    writer_class = MemmapMinuteBarWriter
+    reader_class = MemmapMinuteBarReader
+
+    @skip('MemmapMinuteBarReader does not decompress blocks.')
+    def test_block_cache(self):
+        pass
+
+    def test_reads_are_mapped(self):
+        minute = self.market_opens[TEST_CALENDAR_START]
+        self.writer.write_sid(1, DataFrame(
+            data={
+                'open': [10.0],
+                'high': [20.0],
+                'low': [30.0],
+                'close': [40.0],
+                'volume': [50.0],
+            },
+            index=[minute],
+        ))
+        self.assertEqual(self.writer.last_date_in_output_for_sid(1),
+                         TEST_CALENDAR_START)
+        self.assertIsInstance(
+            self.reader._open_minute_file('close', 1),
+            memmap,
+        )
+        self.assertEqual(self.reader.get_value(1, minute, 'close'), 40.0)
+
+
+class ConsolidatedMinuteBarTestCase(BcolzMinuteBarTestCase):
+    writer_class = ConsolidatedMinuteBarWriter
+    reader_class = ConsolidatedMinuteBarReader
+
+    @skip('ConsolidatedMinuteBarReader does not decompress blocks.')
+    def test_block_cache(self):
+        pass
+
+    def test_files(self):
+        minute = self.market_opens[TEST_CALENDAR_START]
+        data = DataFrame(
+            data={
+                'open': [10.0],
+                'high': [20.0],
+                'low': [30.0],
+                'close': [40.0],
+                'volume': [50.0],
+            },
+            index=[minute],
+        )
+        for sid in 3, 1, 2:
+            self.writer.write_sid(sid, data)
+
+        # All sids share a file for each field.
+        self.assertEqual(
+            sorted(os.listdir(self.dest)),
+            sorted(['close', 'high', 'index', 'low', 'metadata.json', 'open',
+                    'volume']),
+        )
+
+        closes, volumes = self.reader.load_raw_arrays(
+            ['close', 'volume'], minute, minute, [1, 4, 2, 3],
+        )
+        assert_array_equal(closes, [[40.0, nan, 40.0, 40.0]])
+        assert_array_equal(volumes, [[50, 0, 50, 50]])
+
+    def test_append_after_read(self):
+        first_minute = self.market_opens[TEST_CALENDAR_START]
+        second_minute = first_minute + Timedelta(minutes=1)
+
+        def write(minute, close):
+            self.writer.write_sid(1, DataFrame(
+                data={
+                    'open': [close],
+                    'high': [close],
+                    'low': [close],
+                    'close': [close],
+                    'volume': [50.0],
+                },
+                index=[minute],
+            ))
+
+        write(first_minute, 40.0)
+        self.assertEqual(self.reader.get_value(1, first_minute, 'close'), 40.0)
+        write(second_minute, 7.0)
+
+        # Appending to a sid only changes the index's modification time, and
+        # filesystem timestamps can be coarser than the time between writes.
+        index_path = os.path.join(self.dest, 'index')
+        mtime = os.stat(index_path).st_mtime + 1
+        os.utime(index_path, (mtime, mtime))
+
+        self.assertEqual(self.reader.get_value(1, second_minute, 'close'), 7.0)
+
+    def test_index_not_reloaded_for_written_minutes(self):
+        first_minute = self.market_opens[TEST_CALENDAR_START]
+        minutes = [first_minute, first_minute + Timedelta(minutes=1)]
+        self.writer.write_sid(1, DataFrame(
+            data={
+                'open': [10.0, 11.0],
+                'high': [20.0, 21.0],
+                'low': [30.0, 31.0],
+                'close': [40.0, 41.0],
+                'volume': [50.0, 51.0],
+            },
+            index=minutes,
+        ))
+        reader = self.reader
+        self.assertEqual(reader.get_value(1, minutes[0], 'close'), 40.0)
+
+        with patch.object(
+            reader, '_load_index', wraps=reader._load_index,
+        ) as load_index:
+            self.assertEqual(reader.get_value(1, minutes[1], 'close'), 41.0)
+            self.assertEqual(reader.table_len(1), 2)
+            self.assertEqual(load_index.call_count, 0)
+
+            # Reading past the written minutes checks for appended data.
+            next_minute = minutes[1] + Timedelta(minutes=1)
+            self.assertTrue(isnan(reader.get_value(1, next_minute, 'close')))
+            self.assertEqual(load_index.call_count, 1)
@@ -32,6 +32,7 @@ from zipline.utils.numpy_utils import (
     coerce_to_dtype,
     datetime64ns_dtype,
     default_missing_value_for_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     object_dtype,
@@ -137,6 +138,7 @@ def _gen_multiplicative_adjustment_cases(dtype):
     We then build all legal windows over these buffers.
     """
     adjustment_type = {
+        float32_dtype: Float64Multiply,
         float64_dtype: Float64Multiply,
     }[dtype]
 
@@ -218,6 +220,7 @@ def _gen_overwrite_adjustment_cases(name,
     and our own LabelArray class for strings.
     """
     adjustment_type = {
+        float32_dtype: Float64Overwrite,
         float64_dtype: Float64Overwrite,
         datetime64ns_dtype: Datetime64Overwrite,
         bytes_dtype: ObjectOverwrite,
@@ -345,6 +348,12 @@ class AdjustedArrayTestCase(TestCase):
                 make_expected_output=as_dtype(float64_dtype),
                 missing_value=default_missing_value_for_dtype(float64_dtype),
             ),
+            _gen_unadjusted_cases(
+                'float32',
+                make_input=as_dtype(float32_dtype),
+                make_expected_output=as_dtype(float32_dtype),
+                missing_value=default_missing_value_for_dtype(float32_dtype),
+            ),
             _gen_unadjusted_cases(
                 'datetime',
                 make_input=as_dtype(datetime64ns_dtype),
@@ -403,13 +412,20 @@ class AdjustedArrayTestCase(TestCase):
                             missing_value,
                             expected_output):
 
-        array = AdjustedArray(data, NOMASK, adjustments, missing_value)
+        array = AdjustedArray(
+            data, NOMASK, adjustments, missing_value, dtype=data.dtype,
+        )
         for _ in range(2):  # Iterate 2x ensure adjusted_arrays are re-usable.
             in_out = zip(array.traverse(lookback), expected_output)
             for yielded, expected_yield in in_out:
                 check_arrays(yielded, expected_yield)
 
-    @parameterized.expand(_gen_multiplicative_adjustment_cases(float64_dtype))
+    @parameterized.expand(
+        chain(
+            _gen_multiplicative_adjustment_cases(float32_dtype),
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+        )
+    )
     def test_multiplicative_adjustments(self,
                                         name,
                                         data,
@@ -418,7 +434,9 @@ class AdjustedArrayTestCase(TestCase):
                                         missing_value,
                                         expected):
 
-        array = AdjustedArray(data, NOMASK, adjustments, missing_value)
+        array = AdjustedArray(
+            data, NOMASK, adjustments, missing_value, dtype=data.dtype,
+        )
         for _ in range(2):  # Iterate 2x ensure adjusted_arrays are re-usable.
             window_iter = array.traverse(lookback)
             for yielded, expected_yield in zip_longest(window_iter, expected):
@@ -433,6 +451,13 @@ class AdjustedArrayTestCase(TestCase):
                 dtype=float64_dtype,
                 missing_value=default_missing_value_for_dtype(float64_dtype),
             ),
+            _gen_overwrite_adjustment_cases(
+                'float32',
+                make_input=as_dtype(float32_dtype),
+                make_expected_output=as_dtype(float32_dtype),
+                dtype=float32_dtype,
+                missing_value=default_missing_value_for_dtype(float32_dtype),
+            ),
             _gen_overwrite_adjustment_cases(
                 'datetime',
                 make_input=as_dtype(datetime64ns_dtype),
@@ -498,7 +523,9 @@ class AdjustedArrayTestCase(TestCase):
                                         adjustments,
                                         missing_value,
                                         expected):
-        array = AdjustedArray(data, NOMASK, adjustments, missing_value)
+        array = AdjustedArray(
+            data, NOMASK, adjustments, missing_value, dtype=data.dtype,
+        )
         for _ in range(2):  # Iterate 2x ensure adjusted_arrays are re-usable.
             window_iter = array.traverse(lookback)
             for yielded, expected_yield in zip_longest(window_iter, expected):
@@ -507,6 +534,7 @@ class AdjustedArrayTestCase(TestCase):
     @parameter_space(
         __fail_fast=True,
         dtype=[
+            float32_dtype,
             float64_dtype,
             int64_dtype,
             datetime64ns_dtype,
@@ -526,6 +554,7 @@ class AdjustedArrayTestCase(TestCase):
             mask,
             adjustments={},
             missing_value=missing_value,
+            dtype=dtype,
         )
 
         gen_expected = moving_window(masked_baseline, window_length)
@@ -587,6 +616,23 @@ class AdjustedArrayTestCase(TestCase):
             with self.assertRaises(ValueError):
                 frame[0, 0] = 5.0
 
+    @parameter_space(
+        data_dtype=[float32_dtype, float64_dtype],
+        column_dtype=[None, float32_dtype, float64_dtype],
+    )
+    def test_float_data_coerced_to_column_dtype(self,
+                                                data_dtype,
+                                                column_dtype):
+        data = arange(30, dtype=data_dtype).reshape(6, 5)
+        adj_array = AdjustedArray(
+            data, NOMASK, {}, float('nan'), dtype=column_dtype,
+        )
+        expected_dtype = column_dtype or float64_dtype
+
+        self.assertEqual(adj_array.dtype, expected_dtype)
+        for frame in adj_array.traverse(3):
+            self.assertEqual(frame.dtype, expected_dtype)
+
     def test_bad_input(self):
         msg = "Mask shape \(2L?, 3L?\) != data shape \(5L?, 5L?\)"
         data = arange(25).reshape(5, 5)
@@ -0,0 +1,178 @@
+"""
+Tests for zipline.pipeline.cache
+"""
+import os
+import time
+
+from pandas.util.testing import assert_frame_equal
+
+from zipline.pipeline import CustomFactor, Pipeline
+from zipline.pipeline.cache import TermCache
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import SimpleMovingAverage
+from zipline.testing.fixtures import (
+    WithInstanceTmpDir,
+    WithSeededRandomPipelineEngine,
+    ZiplineTestCase,
+)
+
+
+class CountingFactor(CustomFactor):
+    inputs = [TestingDataSet.float_col]
+    window_length = 3
+    # The number of times the engine has computed this term.  ``compute`` is
+    # called once per date, so count calls to ``_compute`` instead.
+    calls = 0
+
+    def _compute(self, *args, **kwargs):
+        type(self).calls += 1
+        return super(CountingFactor, self)._compute(*args, **kwargs)
+
+    def compute(self, today, assets, out, floats):
+        out[:] = floats.sum(axis=0)
+
+
+class ParamFactor(CountingFactor):
+    params = ('param',)
+    calls = 0
+
+    def compute(self, today, assets, out, floats, param):
+        out[:] = floats.sum(axis=0)
+
+
+class Opaque(object):
+    """An object with the default repr, which includes its address.
+    """
+
+
+class TermCacheTestCase(WithInstanceTmpDir,
+                        WithSeededRandomPipelineEngine,
+                        ZiplineTestCase):
+
+    def init_instance_fixtures(self):
+        super(TermCacheTestCase, self).init_instance_fixtures()
+        CountingFactor.calls = 0
+        ParamFactor.calls = 0
+
+    def make_engine(self, cache):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            lambda column: loader,
+            self.trading_days,
+            self.asset_finder,
+            term_cache=cache,
+        )
+
+    def test_cached_terms_are_not_recomputed(self):
+        cache = TermCache(self.instance_tmpdir.path)
+        engine = self.make_engine(cache)
+        counting = CountingFactor()
+        pipeline = Pipeline(
+            columns={
+                'counting': counting,
+                'sma': SimpleMovingAverage(
+                    inputs=[counting],
+                    window_length=2,
+                ),
+            },
+            screen=counting > 0,
+        )
+        start_date, end_date = self.trading_days[[-10, -1]]
+
+        expected = self.run_pipeline(pipeline, start_date, end_date)
+        self.assertEqual(CountingFactor.calls, 1)
+
+        first = engine.run_pipeline(pipeline, start_date, end_date)
+        self.assertEqual(CountingFactor.calls, 2)
+        assert_frame_equal(first, expected)
+
+        second = engine.run_pipeline(pipeline, start_date, end_date)
+        self.assertEqual(CountingFactor.calls, 2)
+        assert_frame_equal(second, expected)
+
+        # A different date range is a different entry.
+        engine.run_pipeline(pipeline, start_date, self.trading_days[-2])
+        self.assertEqual(CountingFactor.calls, 3)
+
+    def test_new_outputs_reuse_cached_inputs(self):
+        cache = TermCache(self.instance_tmpdir.path)
+        engine = self.make_engine(cache)
+        counting = CountingFactor()
+        start_date, end_date = self.trading_days[[-10, -1]]
+
+        engine.run_pipeline(
+            Pipeline(columns={'counting': counting}),
+            start_date,
+            end_date,
+        )
+        self.assertEqual(CountingFactor.calls, 1)
+
+        pipeline = Pipeline(columns={'rank': counting.rank()})
+        result = engine.run_pipeline(pipeline, start_date, end_date)
+        self.assertEqual(CountingFactor.calls, 1)
+        assert_frame_equal(
+            result,
+            self.run_pipeline(pipeline, start_date, end_date),
+        )
+
+    def test_eviction(self):
+        cache = TermCache(self.instance_tmpdir.path, max_bytes=0)
+        engine = self.make_engine(cache)
+        start_date, end_date = self.trading_days[[-10, -1]]
+
+        pipeline = Pipeline(columns={'counting': CountingFactor()})
+        engine.run_pipeline(pipeline, start_date, end_date)
+        engine.run_pipeline(pipeline, start_date, end_date)
+
+        self.assertEqual(CountingFactor.calls, 2)
+        self.assertEqual(os.listdir(self.instance_tmpdir.path), [])
+
+    def test_unstable_params_are_not_cached(self):
+        cache = TermCache(self.instance_tmpdir.path)
+        engine = self.make_engine(cache)
+        start_date, end_date = self.trading_days[[-10, -1]]
+
+        # The key of a term with an Opaque param would change in every
+        # process, so it would never be read back.
+        pipeline = Pipeline(columns={'param': ParamFactor(param=Opaque())})
+        engine.run_pipeline(pipeline, start_date, end_date)
+        engine.run_pipeline(pipeline, start_date, end_date)
+        self.assertEqual(ParamFactor.calls, 2)
+
+        pipeline = Pipeline(columns={'param': ParamFactor(param=3)})
+        engine.run_pipeline(pipeline, start_date, end_date)
+        engine.run_pipeline(pipeline, start_date, end_date)
+        self.assertEqual(ParamFactor.calls, 3)
+
+    def test_reopened_cache_counts_existing_entries(self):
+        path = self.instance_tmpdir.path
+        engine = self.make_engine(TermCache(path))
+        start_date, end_date = self.trading_days[[-10, -1]]
+        engine.run_pipeline(
+            Pipeline(columns={'counting': CountingFactor()}),
+            start_date,
+            end_date,
+        )
+        entries = os.listdir(path)
+        nbytes = sum(
+            os.path.getsize(os.path.join(path, name)) for name in entries
+        )
+        # Make the existing entries unambiguously older than the next one,
+        # even on filesystems with coarse mtimes.
+        an_hour_ago = time.time() - 3600
+        for name in entries:
+            os.utime(os.path.join(path, name), (an_hour_ago, an_hour_ago))
+        cache = TermCache(path, max_bytes=nbytes)
+        self.assertEqual(cache._nbytes, nbytes)
+
+        # Adding a new entry pushes the cache over its limit, so older
+        # entries are evicted.
+        self.make_engine(cache).run_pipeline(
+            Pipeline(columns={'param': ParamFactor(param=3)}),
+            start_date,
+            end_date,
+        )
+        remaining = set(os.listdir(path))
+        self.assertFalse(set(entries) <= remaining)
+        self.assertTrue(remaining - set(entries))
@@ -3,7 +3,10 @@ Tests for SimplePipelineEngine
 """
 from __future__ import division
 from collections import OrderedDict
+from functools import partial
 from itertools import product
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
 from operator import add, sub
 
 from nose_parameterized import parameterized
@@ -23,6 +26,7 @@ from numpy import (
 from numpy.testing import assert_almost_equal
 from pandas import (
     Categorical,
+    concat,
     DataFrame,
     date_range,
     ewma,
@@ -39,14 +43,24 @@ from pandas.util.testing import assert_frame_equal
 from six import iteritems, itervalues
 from toolz import merge
 
+from zipline.assets import AssetFinder
 from zipline.assets.synthetic import make_rotating_equity_info
 from zipline.errors import NoFurtherDataError
 from zipline.lib.adjustment import MULTIPLY
 from zipline.lib.labelarray import LabelArray
 from zipline.pipeline import CustomFactor, Pipeline
-from zipline.pipeline.data import Column, DataSet, USEquityPricing
+from zipline.pipeline.data import (
+    Column,
+    DataSet,
+    USEquityPricing,
+    USEquityPricingFloat32,
+)
 from zipline.pipeline.data.testing import TestingDataSet
-from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.engine import (
+    SimplePipelineEngine,
+    run_sharded_pipeline,
+)
+from zipline.pipeline.filters import CustomFilter
 from zipline.pipeline.factors import (
     AverageDollarVolume,
     EWMA,
@@ -56,6 +70,7 @@ from zipline.pipeline.factors import (
     MaxDrawdown,
     SimpleMovingAverage,
 )
+from zipline.pipeline.hooks import ProfilingHooks
 from zipline.pipeline.loaders.equity_pricing_loader import (
     USEquityPricingLoader,
 )
@@ -65,11 +80,13 @@ from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
     expected_bar_values_2d,
 )
+from zipline.pipeline.loaders.testing import make_seeded_random_loader
 from zipline.pipeline.sentinels import NotSpecified
-from zipline.pipeline.term import InputDates
+from zipline.pipeline.term import AssetExists, InputDates
 from zipline.testing import (
     AssetID,
     AssetIDPlusDay,
+    check_allclose,
     check_arrays,
     make_alternating_boolean_array,
     make_cascading_boolean_array,
@@ -79,11 +96,17 @@ from zipline.testing import (
 from zipline.testing.fixtures import (
     WithAdjustmentReader,
     WithSeededRandomPipelineEngine,
+    WithTmpDir,
     WithTradingEnvironment,
     ZiplineTestCase,
 )
 from zipline.utils.memoize import lazyval
-from zipline.utils.numpy_utils import bool_dtype, datetime64ns_dtype
+from zipline.utils.numpy_utils import (
+    bool_dtype,
+    datetime64ns_dtype,
+    float32_dtype,
+)
+from zipline.utils.pool import SequentialPool
 
 
 class RollingSumDifference(CustomFactor):
@@ -116,6 +139,18 @@ class OpenCloseSumAndDiff(CustomFactor):
         out.diff[:] = open.sum(axis=0) - close.sum(axis=0)
 
 
+class OutsideDates(CustomFilter):
+    """
+    Filter that is True on sessions before ``lower`` or after ``upper``.
+    """
+    inputs = [TestingDataSet.float_col]
+    window_length = 1
+    params = ('lower', 'upper')
+
+    def compute(self, today, assets, out, floats, lower, upper):
+        out[:] = (today < lower) | (today > upper)
+
+
 def assert_multi_index_is_product(testcase, index, *levels):
     """Assert that a MultiIndex contains the product of `*levels`."""
     testcase.assertIsInstance(
@@ -422,6 +457,138 @@ class ConstantInputTestCase(WithTradingEnvironment, ZiplineTestCase):
             DataFrame(expected_avg, index=dates, columns=self.assets),
         )
 
+    def test_concurrent_execution(self):
+        loader = self.loader
+        dates = self.dates[10:15]
+        high, low = USEquityPricing.high, USEquityPricing.low
+        open, close = USEquityPricing.open, USEquityPricing.close
+
+        high_minus_low = RollingSumDifference(inputs=[high, low])
+        open_minus_close = RollingSumDifference(inputs=[open, close])
+        pipeline = Pipeline(
+            columns={
+                'high_low': high_minus_low,
+                'open_close': open_minus_close,
+                'avg': (high_minus_low + open_minus_close) / 2,
+                'long': RollingSumDifference(window_length=5),
+            },
+            screen=high_minus_low < 0,
+        )
+
+        expected = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        ).run_pipeline(pipeline, dates[0], dates[-1])
+
+        thread_pool = ThreadPool(4)
+        self.add_instance_callback(thread_pool.terminate)
+        for pool in SequentialPool(), thread_pool:
+            engine = SimplePipelineEngine(
+                lambda column: loader,
+                self.dates,
+                self.asset_finder,
+                pool=pool,
+            )
+            result = engine.run_pipeline(pipeline, dates[0], dates[-1])
+            assert_frame_equal(result, expected)
+
+    def test_concurrent_execution_reraises(self):
+        loader = self.loader
+        pool = ThreadPool(2)
+        self.add_instance_callback(pool.terminate)
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            pool=pool,
+        )
+
+        class SomeError(Exception):
+            pass
+
+        class Explodes(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 3
+
+            def compute(self, today, assets, out, closes):
+                raise SomeError()
+
+        pipeline = Pipeline(
+            columns={'ok': RollingSumDifference(), 'bad': Explodes()},
+        )
+        with self.assertRaises(SomeError):
+            engine.run_pipeline(pipeline, self.dates[10], self.dates[15])
+
+    def test_intermediate_terms_released(self):
+        loader = self.loader
+        workspaces = []
+
+        class RecordingEngine(SimplePipelineEngine):
+            @staticmethod
+            def _release_inputs(terms, workspace, graph, refcounts):
+                SimplePipelineEngine._release_inputs(
+                    terms, workspace, graph, refcounts,
+                )
+                workspaces.append(set(workspace))
+
+        intermediate = RollingSumDifference()
+        output = intermediate + 1
+        screen = intermediate < 0
+        pipeline = Pipeline(columns={'f': output}, screen=screen)
+
+        thread_pool = ThreadPool(2)
+        self.add_instance_callback(thread_pool.terminate)
+        for pool in None, thread_pool:
+            del workspaces[:]
+            engine = RecordingEngine(
+                lambda column: loader,
+                self.dates,
+                self.asset_finder,
+                pool=pool,
+            )
+            engine.run_pipeline(pipeline, self.dates[10], self.dates[15])
+
+            self.assertIn(intermediate, workspaces[1])
+            self.assertIn(AssetExists(), workspaces[1])
+            # Once everything is computed, only the outputs and the
+            # unused dates term should remain.
+            self.assertEqual(workspaces[-1], {output, screen, InputDates()})
+
+    def test_profiling_hooks(self):
+        loader = self.loader
+        hooks = ProfilingHooks()
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            hooks=hooks,
+        )
+        factor = RollingSumDifference()
+        engine.run_pipeline(
+            Pipeline(columns={'f': factor}),
+            self.dates[10],
+            self.dates[14],
+        )
+
+        report = hooks.report().set_index('term')
+        expected_terms = [USEquityPricing.open, USEquityPricing.close, factor]
+        self.assertEqual(set(report.index), set(map(repr, expected_terms)))
+
+        loaded = report.loc[repr(USEquityPricing.open)]
+        self.assertEqual(loaded['kind'], 'load')
+        self.assertEqual(loaded['window_length'], 0)
+        self.assertEqual(loaded['extra_rows'], 2)
+        self.assertEqual(loaded['shape'], (7, len(self.assets)))
+
+        computed = report.loc[repr(factor)]
+        self.assertEqual(computed['kind'], 'compute')
+        self.assertEqual(computed['window_length'], 3)
+        self.assertEqual(computed['extra_rows'], 0)
+        self.assertEqual(computed['nbytes'], 5 * len(self.assets) * 8)
+        self.assertGreaterEqual(computed['seconds'], 0)
+
+        hooks.clear()
+        self.assertEqual(len(hooks.report()), 0)
+
     def test_masked_factor(self):
         """
         Test that a Custom Factor computes the correct values when passed a
@@ -802,10 +969,12 @@ class ConstantInputTestCase(WithTradingEnvironment, ZiplineTestCase):
 
         assert_frame_equal(result, expected)
 
+        # Columns of the same loader are loaded together, even when they are
+        # needed for different window lengths.
         self.assertEqual(set(loader1.load_calls),
                          {ColumnArgs.sorted_by_ds(Loader1DataSet1.col1,
-                                                  Loader1DataSet2.col1),
-                          ColumnArgs.sorted_by_ds(Loader1DataSet1.col2,
+                                                  Loader1DataSet1.col2,
+                                                  Loader1DataSet2.col1,
                                                   Loader1DataSet2.col2)})
         self.assertEqual(set(loader2.load_calls),
                          {ColumnArgs.sorted_by_ds(Loader2DataSet.col1,
@@ -1028,6 +1197,103 @@ class SyntheticBcolzTestCase(WithAdjustmentReader,
         result = results['sma'].unstack()
         assert_frame_equal(result, expected)
 
+    @parameterized.expand([(1,), (3,), (10,)])
+    def test_chunked_engine(self, chunksize):
+        window_length = 5
+        dates = date_range(
+            self.first_asset_start + self.trading_calendar.day,
+            self.last_asset_end,
+            freq=self.trading_calendar.day,
+        )
+        pipeline = Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=(USEquityPricing.close,),
+                    window_length=window_length,
+                ),
+                'close': USEquityPricing.close.latest,
+            },
+        )
+        start_date, end_date = dates[[window_length, -1]]
+
+        expected = SimplePipelineEngine(
+            lambda column: self.pipeline_loader,
+            self.trading_calendar.all_sessions,
+            self.asset_finder,
+        ).run_pipeline(pipeline, start_date, end_date)
+
+        hooks = ProfilingHooks()
+        engine = SimplePipelineEngine(
+            lambda column: self.pipeline_loader,
+            self.trading_calendar.all_sessions,
+            self.asset_finder,
+            hooks=hooks,
+            chunksize=chunksize,
+        )
+        result = engine.run_pipeline(pipeline, start_date, end_date)
+        assert_frame_equal(result, expected)
+
+        # Each block is only computed over the assets alive in that block.
+        widths = hooks.report()['shape'].map(lambda shape: shape[1])
+        self.assertLess(widths.max(), len(self.all_asset_ids))
+
+    def test_chunked_engine_bad_chunksize(self):
+        with self.assertRaises(ValueError):
+            SimplePipelineEngine(
+                lambda column: self.pipeline_loader,
+                self.trading_calendar.all_sessions,
+                self.asset_finder,
+                chunksize=0,
+            )
+
+    def test_float32_pricing(self):
+        engine = SimplePipelineEngine(
+            lambda column: self.pipeline_loader,
+            self.trading_calendar.all_sessions,
+            self.asset_finder,
+        )
+        window_length = 5
+        dates = date_range(
+            self.first_asset_start + self.trading_calendar.day,
+            self.last_asset_end,
+            freq=self.trading_calendar.day,
+        )
+        start_date, end_date = dates[[window_length, -1]]
+
+        def make_pipeline(dataset):
+            sma = SimpleMovingAverage(
+                inputs=(dataset.close,),
+                window_length=window_length,
+                dtype=dataset.close.dtype,
+            )
+            return Pipeline(
+                columns={
+                    'close': dataset.close.latest,
+                    'sma': sma,
+                    'spread': (dataset.high.latest - dataset.low.latest) / sma,
+                },
+            )
+
+        result = engine.run_pipeline(
+            make_pipeline(USEquityPricingFloat32),
+            start_date,
+            end_date,
+        )
+        expected = engine.run_pipeline(
+            make_pipeline(USEquityPricing),
+            start_date,
+            end_date,
+        )
+
+        self.assertTrue(result.index.equals(expected.index))
+        for name in 'close', 'sma', 'spread':
+            self.assertEqual(result[name].dtype, float32_dtype)
+            check_allclose(
+                result[name].values,
+                expected[name].values.astype(float32),
+                rtol=1e-6,
+            )
+
     def test_drawdown(self):
         # The monotonically-increasing data produced by SyntheticDailyBarWriter
         # exercises two pathological cases for MaxDrawdown.  The actual
@@ -1303,3 +1569,252 @@ class StringColumnTestCase(WithSeededRandomPipelineEngine,
             columns=self.asset_finder.retrieve_all(self.asset_finder.sids),
         )
         assert_frame_equal(result.c.unstack(), expected_final_result)
+
+
+def make_chunked_pipeline(screen=None):
+    return Pipeline(
+        columns={
+            'sma': SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=5,
+            ),
+            'c': TestingDataSet.categorical_col.latest,
+        },
+        screen=screen,
+    )
+
+
+def make_seeded_random_engine(seed, calendar, asset_db_url):
+    """
+    Build an engine over a SeededRandomLoader in a pool worker.
+
+    This lives at module scope so that ``run_sharded_pipeline`` can send it to
+    a ``multiprocessing.Pool``.
+    """
+    finder = AssetFinder(asset_db_url)
+    loader = make_seeded_random_loader(seed, calendar, finder.sids)
+    return SimplePipelineEngine(lambda column: loader, calendar, finder)
+
+
+class ChunkedPipelineTestCase(WithSeededRandomPipelineEngine,
+                              WithTmpDir,
+                              ZiplineTestCase):
+
+    @classmethod
+    def make_asset_finder_db_url(cls):
+        # Worker processes open their own asset finder, so the db can't live
+        # in memory.
+        return 'sqlite:///' + cls.tmpdir.getpath('assets.db')
+
+    def make_pipeline(self, screen=None):
+        return make_chunked_pipeline(screen)
+
+    @parameterized.expand([(1,), (3,), (7,), (1000,)])
+    def test_matches_single_run(self, shards):
+        run_dates = self.trading_days[-30:]
+        start_date, end_date = run_dates[[0, -1]]
+        expected = self.run_pipeline(
+            self.make_pipeline(),
+            start_date,
+            end_date,
+        )
+
+        thread_pool = ThreadPool(2)
+        self.add_instance_callback(thread_pool.terminate)
+        for pool in SequentialPool(), thread_pool:
+            result = run_sharded_pipeline(
+                lambda: self.seeded_random_engine,
+                self.make_pipeline,
+                self.trading_days,
+                start_date,
+                end_date,
+                shards,
+                pool=pool,
+            )
+            assert_frame_equal(result[['sma']], expected[['sma']])
+            # Shards may order the categories differently.
+            assert_frame_equal(
+                result[['c']].astype(object),
+                expected[['c']].astype(object),
+            )
+
+    def test_sharded_pipeline_in_processes(self):
+        run_dates = self.trading_days[-30:]
+        start_date, end_date = run_dates[[0, -1]]
+        expected = self.run_pipeline(
+            self.make_pipeline(),
+            start_date,
+            end_date,
+        )
+
+        process_pool = Pool(2)
+        self.add_instance_callback(process_pool.terminate)
+        result = run_sharded_pipeline(
+            partial(
+                make_seeded_random_engine,
+                self.SEEDED_RANDOM_PIPELINE_SEED,
+                self.trading_days,
+                self.make_asset_finder_db_url(),
+            ),
+            make_chunked_pipeline,
+            self.trading_days,
+            start_date,
+            end_date,
+            3,
+            pool=process_pool,
+        )
+        assert_frame_equal(result[['sma']], expected[['sma']])
+        assert_frame_equal(
+            result[['c']].astype(object),
+            expected[['c']].astype(object),
+        )
+
+    @parameterized.expand([
+        ('first', 0, 9),
+        ('middle', 10, 19),
+        ('last', 20, 29),
+    ])
+    def test_sharded_pipeline_with_empty_shard(self, name, lower, upper):
+        run_dates = self.trading_days[-30:]
+        start_date, end_date = run_dates[[0, -1]]
+        # Screen out every session in one of the three shards.
+        screen = OutsideDates(lower=run_dates[lower], upper=run_dates[upper])
+        expected = self.run_pipeline(
+            self.make_pipeline(screen),
+            start_date,
+            end_date,
+        )
+
+        result = run_sharded_pipeline(
+            lambda: self.seeded_random_engine,
+            lambda: self.make_pipeline(screen),
+            self.trading_days,
+            start_date,
+            end_date,
+            3,
+        )
+        self.assertEqual(result['c'].dtype.name, 'category')
+        assert_frame_equal(result[['sma']], expected[['sma']])
+        assert_frame_equal(
+            result[['c']].astype(object),
+            expected[['c']].astype(object),
+        )
+
+    @parameterized.expand([
+        ('first', 0, 9),
+        ('middle', 10, 19),
+        ('last', 20, 29),
+    ])
+    def test_chunked_engine_with_empty_block(self, name, lower, upper):
+        run_dates = self.trading_days[-30:]
+        start_date, end_date = run_dates[[0, -1]]
+        # Screen out every session in one of the three blocks.
+        pipeline = self.make_pipeline(
+            OutsideDates(lower=run_dates[lower], upper=run_dates[upper]),
+        )
+        expected = self.run_pipeline(pipeline, start_date, end_date)
+
+        loader = self.seeded_random_loader
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.trading_days,
+            self.asset_finder,
+            chunksize=10,
+        )
+        result = engine.run_pipeline(pipeline, start_date, end_date)
+        self.assertEqual(result['c'].dtype.name, 'category')
+        assert_frame_equal(result[['sma']], expected[['sma']])
+        # Blocks may order the categories differently.
+        assert_frame_equal(
+            result[['c']].astype(object),
+            expected[['c']].astype(object),
+        )
+
+    @parameterized.expand([(1,), (4,), (30,), (1000,)])
+    def test_iter_pipeline(self, chunksize):
+        run_dates = self.trading_days[-30:]
+        start_date, end_date = run_dates[[0, -1]]
+        pipeline = self.make_pipeline()
+        expected = self.run_pipeline(pipeline, start_date, end_date)
+
+        chunks = list(
+            self.seeded_random_engine.iter_pipeline(
+                pipeline,
+                start_date,
+                end_date,
+                chunksize,
+            ),
+        )
+        self.assertEqual(len(chunks), -(-len(run_dates) // chunksize))
+        for chunk in chunks:
+            self.assertLessEqual(
+                len(chunk.index.get_level_values(0).unique()),
+                chunksize,
+            )
+            # Chunks may have seen different categories.
+            chunk['c'] = chunk['c'].astype(object)
+
+        result = concat(chunks)
+        assert_frame_equal(result[['sma']], expected[['sma']])
+        assert_frame_equal(result[['c']], expected[['c']].astype(object))
+
+    def test_run_pipelines(self):
+        loader = self.seeded_random_loader
+        hooks = ProfilingHooks()
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.trading_days,
+            self.asset_finder,
+            hooks=hooks,
+        )
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        )
+        pipelines = {
+            'top': Pipeline(
+                columns={'sma': sma, 'rank': sma.rank()},
+                screen=sma.top(3),
+            ),
+            'bottom': Pipeline(
+                columns={
+                    'sma': sma,
+                    'c': TestingDataSet.categorical_col.latest,
+                },
+                screen=sma.bottom(3),
+            ),
+            'empty': Pipeline(),
+        }
+        start_date, end_date = self.trading_days[[-10, -1]]
+
+        results = engine.run_pipelines(pipelines, start_date, end_date)
+        self.assertEqual(set(results), set(pipelines))
+        for name, pipeline in iteritems(pipelines):
+            assert_frame_equal(
+                results[name],
+                self.run_pipeline(pipeline, start_date, end_date),
+            )
+
+        # Terms shared between pipelines are only computed once.
+        computed = hooks.report()['term']
+        self.assertEqual((computed == repr(sma)).sum(), 1)
+
+    def test_bad_dates(self):
+        start_date, end_date = self.trading_days[[-1, -2]]
+        msg = "start_date must be before or equal to end_date .*"
+        with self.assertRaisesRegexp(ValueError, msg):
+            self.seeded_random_engine.iter_pipeline(
+                self.make_pipeline(),
+                start_date,
+                end_date,
+                2,
+            )
+        with self.assertRaisesRegexp(ValueError, msg):
+            run_sharded_pipeline(
+                lambda: self.seeded_random_engine,
+                self.make_pipeline,
+                self.trading_days,
+                start_date,
+                end_date,
+                2,
+            )
@@ -266,6 +266,36 @@ class EventIndexerTestCase(ZiplineTestCase):
                 # Neither event is eligible.  Return -1 as a sentinel.
                 self.assertEqual(computed_index, -1)
 
+    @parameterized.expand([
+        ('next', next_event_indexer),
+        ('previous', previous_event_indexer),
+    ])
+    def test_unknown_sid(self, name, indexer):
+        all_dates = pd.date_range('2014', '2014-01-31')
+        all_sids = np.array([1, 2, 3])
+        event_dates = pd.to_datetime(['2014-01-05', '2014-01-10']).values
+
+        with self.assertRaises(IndexError):
+            indexer(
+                all_dates,
+                all_sids,
+                event_dates,
+                event_dates,
+                np.array([1, 4]),
+            )
+
+        # Events with no sids produce an empty indexer.
+        assert_equal(
+            indexer(
+                all_dates,
+                all_sids,
+                event_dates[:0],
+                event_dates[:0],
+                np.array([], dtype=int64_dtype),
+            ),
+            np.full((len(all_dates), len(all_sids)), -1, dtype=int64_dtype),
+        )
+
 
 class EventsLoaderTestCase(WithAssetFinder,
                            WithTradingSessions,
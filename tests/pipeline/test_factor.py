@@ -20,12 +20,18 @@ from numpy import (
     rot90,
     where,
 )
-from numpy.random import randn, seed
+from numpy.random import randn, RandomState, seed
+from scipy.stats import rankdata
 
 from zipline.errors import UnknownRankMethod
 from zipline.lib.labelarray import LabelArray
-from zipline.lib.rank import masked_rankdata_2d
-from zipline.lib.normalize import naive_grouped_rowwise_apply as grouped_apply
+from zipline.lib.rank import masked_rankdata_2d, rankdata_1d_descending
+from zipline.lib.normalize import (
+    grouped_rowwise_demean,
+    grouped_rowwise_rank,
+    grouped_rowwise_zscore,
+    naive_grouped_rowwise_apply as grouped_apply,
+)
 from zipline.pipeline import Classifier, Factor, Filter
 from zipline.pipeline.factors import (
     Returns,
@@ -40,6 +46,7 @@ from zipline.testing import (
 from zipline.utils.numpy_utils import (
     categorical_dtype,
     datetime64ns_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     NaTns,
@@ -83,6 +90,7 @@ class Mask(Filter):
 for_each_factor_dtype = parameterized.expand([
     ('datetime64[ns]', datetime64ns_dtype),
     ('float', float64_dtype),
+    ('float32', float32_dtype),
 ])
 
 
@@ -617,6 +625,56 @@ class FactorTestCase(BasePipelineTestCase):
 
         check_arrays(float_result, datetime_result)
 
+    @parameter_space(
+        seed_value=range(3),
+        add_nulls=(False, True),
+        sparse_labels=(False, True),
+    )
+    def test_vectorized_grouped_transforms(self,
+                                           seed_value,
+                                           add_nulls,
+                                           sparse_labels):
+        rand = RandomState(seed_value)
+        shape = (6, 9)
+
+        # Draw from a small set of values so that we get ties to rank.
+        data = rand.randint(0, 4, size=shape).astype(float64_dtype)
+        if add_nulls:
+            data[rand.rand(*shape) < 0.2] = nan
+
+        labels = rand.randint(-1, 3, size=shape)
+        if sparse_labels:
+            # Labels too spread out to be used as codes directly.
+            labels = array([-5, 7, 42, 10 ** 12])[labels + 1]
+
+        check_allclose(
+            grouped_rowwise_demean(data, labels),
+            grouped_apply(data, labels, lambda row: row - nanmean(row)),
+        )
+        check_allclose(
+            grouped_rowwise_zscore(data, labels),
+            grouped_apply(
+                data,
+                labels,
+                lambda row: (row - nanmean(row)) / nanstd(row),
+            ),
+        )
+
+        for method in ('average', 'min', 'max', 'dense', 'ordinal'):
+            check_arrays(
+                grouped_rowwise_rank(data, labels, method),
+                grouped_apply(data, labels, rankdata, (method,)),
+            )
+            check_arrays(
+                grouped_rowwise_rank(data, labels, method, ascending=False),
+                grouped_apply(
+                    data,
+                    labels,
+                    rankdata_1d_descending,
+                    (method,),
+                ),
+            )
+
     def test_normalizations_hand_computed(self):
         """
         Test the hand-computed example in factor.demean.
@@ -23,15 +23,20 @@ from numpy import (
     rot90,
     sum as np_sum
 )
-from numpy.random import randn, seed as random_seed
+from numpy.random import RandomState, randn, seed as random_seed
 
 from zipline.errors import BadPercentileBounds
 from zipline.pipeline import Filter, Factor
 from zipline.pipeline.classifiers import Classifier
 from zipline.pipeline.factors import CustomFactor
-from zipline.pipeline.filters import All, Any, AtLeastN
-from zipline.testing import parameter_space, permute_rows
-from zipline.utils.numpy_utils import float64_dtype, int64_dtype
+from zipline.pipeline.filters import All, Any, AtLeastN, RankFilter
+from zipline.pipeline.graph import ExecutionPlan
+from zipline.testing import check_arrays, parameter_space, permute_rows
+from zipline.utils.numpy_utils import (
+    float32_dtype,
+    float64_dtype,
+    int64_dtype,
+)
 from .base import BasePipelineTestCase, with_default_shape
 
 
@@ -164,6 +169,62 @@ class FilterTestCase(BasePipelineTestCase):
             mask=self.build_mask(self.ones_mask()),
         )
 
+    @parameter_space(
+        seed=(1, 2, 3),
+        grouped={True, False},
+        dtype=(float32_dtype, float64_dtype),
+        __fail_fast=True,
+    )
+    def test_top_and_bottom_match_rank(self, seed, grouped, dtype):
+        rand = RandomState(seed)
+        shape = self.default_shape
+
+        # Use a handful of distinct values so that there are lots of ties.
+        data = rand.randint(0, 5, shape).astype(dtype)
+        data[rand.uniform(size=shape) < 0.2] = nan
+        mask_data = rand.uniform(size=shape) < 0.8
+        classifier_data = rand.randint(-1, 3, shape)
+
+        f = SomeFactor(dtype=dtype)
+        c = self.c
+        mask = Mask()
+
+        terms = {}
+        for N, masked in product((1, 3, 8, 100), (True, False)):
+            kwargs = {'mask': mask} if masked else {}
+            if grouped:
+                kwargs['groupby'] = c
+            name = '%d_%s' % (N, masked)
+
+            top = f.top(N, **kwargs)
+            bottom = f.bottom(N, **kwargs)
+            self.assertIsInstance(top, RankFilter)
+            self.assertIsInstance(bottom, RankFilter)
+
+            terms['top_' + name] = top
+            terms['bottom_' + name] = bottom
+            terms['rank_top_' + name] = f.rank(ascending=False, **kwargs) <= N
+            terms['rank_bottom_' + name] = f.rank(**kwargs) <= N
+
+        root_mask = self.build_mask(self.ones_mask())
+        results = self.run_graph(
+            ExecutionPlan(
+                terms,
+                all_dates=self.nyse_sessions,
+                start_date=root_mask.index[0],
+                end_date=root_mask.index[-1],
+            ),
+            initial_workspace={
+                f: data,
+                c: classifier_data,
+                mask: mask_data,
+            },
+            mask=root_mask,
+        )
+        for name in terms:
+            if not name.startswith('rank_'):
+                check_arrays(results[name], results['rank_' + name])
+
     def test_percentile_between(self):
 
         quintiles = range(5)
@@ -4,7 +4,7 @@ Tests for zipline.pipeline.loaders.frame.DataFrameLoader.
 from unittest import TestCase
 
 from mock import patch
-from numpy import arange, ones
+from numpy import arange, float32, float64, ones
 from numpy.testing import assert_array_equal
 from pandas import (
     DataFrame,
@@ -20,7 +20,7 @@ from zipline.lib.adjustment import (
     MULTIPLY,
     OVERWRITE,
 )
-from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.data import USEquityPricing, USEquityPricingFloat32
 from zipline.pipeline.loaders.frame import (
     DataFrameLoader,
 )
@@ -88,6 +88,22 @@ class DataFrameLoaderTestCase(TestCase):
             expected = baseline.values[dates_slice, sids_slice][idx:idx + 3]
             assert_array_equal(window, expected)
 
+    def test_float32_baseline_for_float64_column(self):
+        data = arange(100, dtype=float32).reshape(self.ndates, self.nsids)
+        baseline = DataFrame(data, index=self.dates, columns=self.sids)
+
+        for column, expected_dtype in ((USEquityPricing.close, float64),
+                                       (USEquityPricingFloat32.close,
+                                        float32)):
+            loader = DataFrameLoader(column, baseline)
+            [adj_array] = loader.load_adjusted_array(
+                [column], self.dates, self.sids, self.mask,
+            ).values()
+
+            self.assertEqual(adj_array.dtype, expected_dtype)
+            for window in adj_array.traverse(window_length=3):
+                self.assertEqual(window.dtype, expected_dtype)
+
     def test_adjustments(self):
         data = arange(100).reshape(self.ndates, self.nsids)
         baseline = DataFrame(data, index=self.dates, columns=self.sids)
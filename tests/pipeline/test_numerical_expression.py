@@ -18,6 +18,7 @@ from numpy import (
     arange,
     array,
     eye,
+    float32,
     float64,
     full,
     isnan,
@@ -35,7 +36,11 @@ from zipline.pipeline.expression import (
     NUMEXPR_MATH_FUNCS,
 )
 from zipline.testing import check_allclose
-from zipline.utils.numpy_utils import datetime64ns_dtype, float64_dtype
+from zipline.utils.numpy_utils import (
+    datetime64ns_dtype,
+    float32_dtype,
+    float64_dtype,
+)
 
 
 class F(Factor):
@@ -56,6 +61,12 @@ class H(Factor):
     window_length = 0
 
 
+class F32(Factor):
+    dtype = float32_dtype
+    inputs = ()
+    window_length = 0
+
+
 class NonExprFilter(Filter):
     inputs = ()
     window_length = 0
@@ -76,11 +87,13 @@ class NumericalExpressionTestCase(TestCase):
         self.g = G()
         self.h = H()
         self.d = DateFactor()
+        self.f32 = F32()
         self.fake_raw_data = {
             self.f: full((5, 5), 3, float),
             self.g: full((5, 5), 2, float),
             self.h: full((5, 5), 1, float),
             self.d: full((5, 5), 0, dtype='datetime64[ns]'),
+            self.f32: full((5, 5), 4, float32),
         }
         self.mask = DataFrame(True, index=self.dates, columns=self.assets)
 
@@ -191,7 +204,7 @@ class NumericalExpressionTestCase(TestCase):
         expected = (
             "Don't know how to compute datetime64[ns] + datetime64[ns].\n"
             "Arithmetic operators are only supported between Factors of dtype "
-            "'float64'."
+            "'float32' or 'float64'."
         )
         self.assertEqual(message, expected)
 
@@ -202,7 +215,7 @@ class NumericalExpressionTestCase(TestCase):
         expected = (
             "Don't know how to compute datetime64[ns] * datetime64[ns].\n"
             "Arithmetic operators are only supported between Factors of dtype "
-            "'float64'."
+            "'float32' or 'float64'."
         )
         self.assertEqual(message, expected)
 
@@ -216,7 +229,7 @@ class NumericalExpressionTestCase(TestCase):
                 expected = (
                     "Don't know how to compute float64 {sym} datetime64[ns].\n"
                     "Arithmetic operators are only supported between Factors"
-                    " of dtype 'float64'."
+                    " of dtype 'float32' or 'float64'."
                 ).format(sym=sym)
                 self.assertEqual(message, expected)
 
@@ -226,7 +239,7 @@ class NumericalExpressionTestCase(TestCase):
                 expected = (
                     "Don't know how to compute datetime64[ns] {sym} float64.\n"
                     "Arithmetic operators are only supported between Factors"
-                    " of dtype 'float64'."
+                    " of dtype 'float32' or 'float64'."
                 ).format(sym=sym)
                 self.assertEqual(message, expected)
 
@@ -238,7 +251,8 @@ class NumericalExpressionTestCase(TestCase):
         expected = (
             "Can't apply unary operator '-' to instance of "
             "'DateFactor' with dtype 'datetime64[ns]'.\n"
-            "'-' is only supported for Factors of dtype 'float64'."
+            "'-' is only supported for Factors of dtype 'float32' or "
+            "'float64'."
         )
         self.assertEqual(message, expected)
 
@@ -260,6 +274,36 @@ class NumericalExpressionTestCase(TestCase):
         self.check_constant_output((f + g) + -(f + g), 0.0)
         self.check_constant_output(-(f + g) + -(f + g), -10.0)
 
+    def test_float32(self):
+        f, f32 = self.f, self.f32
+
+        # float32 is preserved by operators and math functions on float32
+        # Factors, including when combined with Python scalars.
+        for expr in (-f32, f32 + f32, f32 * 2, 2.5 - f32, f32.sqrt()):
+            self.assertEqual(expr.dtype, float32_dtype)
+        self.assertEqual((f32 + 1 > f32).dtype, numpy.dtype(bool))
+
+        # Mixing float32 and float64 promotes to float64.
+        self.assertEqual((f32 + f).dtype, float64_dtype)
+        self.assertEqual((f - f32).dtype, float64_dtype)
+
+        result = (f32 * 2.5 + f32).sqrt()._compute(
+            [self.fake_raw_data[f32]],
+            self.mask.index,
+            self.mask.columns,
+            self.mask.values,
+        )
+        self.assertEqual(result.dtype, float32_dtype)
+        check_allclose(
+            result, full((5, 5), 14 ** 0.5, float32), rtol=1e-6,
+        )
+
+        self.check_constant_output(f32 / f, 4.0 / 3.0)
+
+        # float32 and float64 Factors can't be compared directly.
+        with self.assertRaises(TypeError):
+            f32 > f
+
     def test_add(self):
         f, g = self.f, self.g
 
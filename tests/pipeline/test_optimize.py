@@ -0,0 +1,184 @@
+"""
+Tests for zipline.pipeline.optimize
+"""
+from mock import patch
+from pandas.util.testing import assert_frame_equal
+
+from zipline.pipeline import Pipeline
+from zipline.pipeline.cache import _fingerprint
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.expression import NumericalExpression
+from zipline.pipeline.factors import SimpleMovingAverage
+from zipline.pipeline.hooks import ProfilingHooks
+from zipline.pipeline.optimize import eliminate_common_subexpressions
+from zipline.testing.fixtures import (
+    WithSeededRandomPipelineEngine,
+    ZiplineTestCase,
+)
+from zipline.utils.numpy_utils import float32_dtype
+
+
+class EliminateCommonSubexpressionsTestCase(WithSeededRandomPipelineEngine,
+                                            ZiplineTestCase):
+
+    def init_instance_fixtures(self):
+        super(
+            EliminateCommonSubexpressionsTestCase, self,
+        ).init_instance_fixtures()
+        col = TestingDataSet.float_col
+        self.a = col.latest
+        self.b = SimpleMovingAverage(inputs=[col], window_length=3)
+        self.c = SimpleMovingAverage(inputs=[col], window_length=5)
+        self.d = SimpleMovingAverage(inputs=[col], window_length=7)
+
+    def check_engine(self, pipeline, chunksize=None):
+        """
+        Run ``pipeline`` with and without expression optimization, check that
+        the results are the same and return the list of computed expressions.
+        """
+        hooks = ProfilingHooks()
+        loader = self.seeded_random_loader
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.trading_days,
+            self.asset_finder,
+            hooks=hooks,
+            chunksize=chunksize,
+            optimize_expressions=True,
+        )
+        start_date, end_date = self.trading_days[[-10, -1]]
+        result = engine.run_pipeline(pipeline, start_date, end_date)
+        assert_frame_equal(
+            result,
+            self.run_pipeline(pipeline, start_date, end_date),
+        )
+        return [
+            record['term'] for record in hooks.records
+            if isinstance(record['term'], NumericalExpression)
+        ]
+
+    def test_reuse_output(self):
+        a, b, c, d = self.a, self.b, self.c, self.d
+        total = a + b
+        terms = {
+            'total': total,
+            'ratio': (a + b) / c,
+            'product': (b + a) * d,
+        }
+        rewritten = eliminate_common_subexpressions(terms)
+
+        # ``total`` is left alone, and the other outputs read its result
+        # instead of recomputing it.
+        self.assertIs(rewritten['total'], total)
+        self.assertEqual(rewritten['ratio'].inputs, (total, c))
+        self.assertEqual(set(rewritten['product'].inputs), {total, d})
+
+        computed = self.check_engine(Pipeline(columns=terms))
+        self.assertEqual(len(computed), 3)
+        self.assertEqual(computed.count(total), 1)
+
+    def test_reuse_intermediate(self):
+        a, b, c = self.a, self.b, self.c
+        spread = (a - b) / c
+        terms = {'rank': spread.rank(), 'high': spread > 0.5}
+        rewritten = eliminate_common_subexpressions(terms)
+
+        # ``spread`` is computed for ``rank``, so the filter compares its
+        # result with 0.5 instead of recomputing it.
+        self.assertIs(rewritten['rank'], terms['rank'])
+        self.assertEqual(rewritten['high'].inputs, (spread,))
+
+        computed = self.check_engine(
+            Pipeline(columns={'rank': terms['rank']}, screen=terms['high']),
+        )
+        self.assertEqual(len(computed), 2)
+
+    def test_materialize_expensive_subexpression(self):
+        a, b, c, d = self.a, self.b, self.c, self.d
+        terms = {
+            'x': (a + b).log() / c,
+            'y': d * (b + a).log(),
+        }
+        rewritten = eliminate_common_subexpressions(terms)
+
+        shared, = rewritten['x'].inputs[:1]
+        self.assertIsInstance(shared, NumericalExpression)
+        self.assertEqual(set(shared.inputs), {a, b})
+        self.assertIn(shared, rewritten['y'].inputs)
+
+        computed = self.check_engine(Pipeline(columns=terms))
+        self.assertEqual(len(computed), 3)
+        self.assertEqual(computed.count(shared), 1)
+
+    def test_inline_cheap_subexpression(self):
+        a, b, c, d = self.a, self.b, self.c, self.d
+        terms = {'x': (a + b) / c, 'y': (a + b) * d}
+
+        # Two uses of a single addition aren't worth an extra pass over
+        # memory.
+        self.assertEqual(eliminate_common_subexpressions(terms), terms)
+
+    def test_equivalent_expressions(self):
+        a, b = self.a, self.b
+        terms = {'x': a * b, 'y': b * a, 'z': b < a, 'w': a > b}
+        rewritten = eliminate_common_subexpressions(terms)
+
+        self.assertIsNot(terms['x'], terms['y'])
+        self.assertIs(rewritten['x'], rewritten['y'])
+        self.assertIs(rewritten['z'], rewritten['w'])
+
+        computed = self.check_engine(
+            Pipeline(columns={k: v for k, v in terms.items() if k != 'w'},
+                     screen=terms['w']),
+        )
+        self.assertEqual(len(computed), 2)
+
+    def test_operand_order_is_stable(self):
+        a, b, c, d = self.a, self.b, self.c, self.d
+        terms = {
+            'x': (b + a).log() / c,
+            'y': d * (a + b).log(),
+        }
+        rewritten = eliminate_common_subexpressions(terms)
+
+        # Operands are ordered by a description of their terms rather than by
+        # their ids, so every process builds the same shared expression.
+        memo = {}
+        shared, = rewritten['x'].inputs[:1]
+        self.assertEqual(
+            shared.inputs,
+            tuple(sorted((a, b), key=lambda term: _fingerprint(term, memo))),
+        )
+
+    def test_float32_inputs_not_rewritten(self):
+        a, c, d = self.a, self.c, self.d
+        b = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=3,
+            dtype=float32_dtype,
+        )
+        terms = {
+            'x': (a + b).log() / c,
+            'y': d * (b + a).log(),
+        }
+
+        # Materializing ``a + b`` as float32 would round it before taking its
+        # log, so the outputs are left as they are.
+        self.assertEqual(eliminate_common_subexpressions(terms), terms)
+
+    def test_rewrite_once_per_run(self):
+        a, b, c, d = self.a, self.b, self.c, self.d
+        terms = {
+            'x': (a + b).log() / c,
+            'y': d * (b + a).log(),
+        }
+        with patch(
+            'zipline.pipeline.engine.eliminate_common_subexpressions',
+            side_effect=eliminate_common_subexpressions,
+        ) as rewrite:
+            computed = self.check_engine(Pipeline(columns=terms), chunksize=3)
+
+        self.assertEqual(rewrite.call_count, 1)
+        # The shared subexpression and the two outputs, once per chunk.
+        self.assertEqual(len(computed), 3 * 4)
@@ -6,6 +6,7 @@ from os.path import (
     join,
     realpath,
 )
+from threading import current_thread
 
 from nose_parameterized import parameterized
 from numpy import (
@@ -27,6 +28,7 @@ from pandas import (
     Timestamp,
 )
 from pandas.tseries.tools import normalize_date
+from pandas.util.testing import assert_frame_equal
 from six import iteritems, itervalues
 
 from zipline.algorithm import TradingAlgorithm
@@ -331,6 +333,142 @@ class ClosesOnly(WithDataPortal, ZiplineTestCase):
         # Run for a week in the middle of our data.
         algo.run(self.data_portal)
 
+    @parameterized.expand([('day', 1), ('week', 5), ('year', 252)])
+    def test_prefetch_pipeline(self, test_name, chunksize):
+        """
+        Assert that prefetching pipeline chunks in the background produces the
+        same results as computing them on demand.
+        """
+        main_thread = current_thread()
+
+        class RecordingAlgorithm(TradingAlgorithm):
+            threads = []
+
+            def _run_pipelines(self, start_session, chunksize):
+                self.threads.append(current_thread())
+                return super(RecordingAlgorithm, self)._run_pipelines(
+                    start_session,
+                    chunksize,
+                )
+
+        def run(prefetch):
+            outputs = []
+
+            def initialize(context):
+                p = attach_pipeline(Pipeline(), 'test', chunksize=chunksize)
+                p.add(USEquityPricing.close.latest, 'close')
+
+            def handle_data(context, data):
+                outputs.append(pipeline_output('test'))
+
+            RecordingAlgorithm.threads = []
+            algo = RecordingAlgorithm(
+                initialize=initialize,
+                handle_data=handle_data,
+                data_frequency='daily',
+                get_pipeline_loader=lambda column: self.pipeline_loader,
+                start=self.first_asset_start,
+                end=self.last_asset_end,
+                env=self.env,
+                prefetch_pipeline=prefetch,
+            )
+            algo.run(self.data_portal)
+            return outputs, RecordingAlgorithm.threads
+
+        expected, threads = run(prefetch=False)
+        self.assertTrue(all(t is main_thread for t in threads))
+
+        result, threads = run(prefetch=True)
+        self.assertEqual(len(result), len(expected))
+        for r, e in zip(result, expected):
+            assert_frame_equal(r, e)
+
+        # Only the first chunk is computed on the main thread.
+        self.assertIs(threads[0], main_thread)
+        self.assertTrue(all(t is not main_thread for t in threads[1:]))
+        if chunksize + 1 < len(expected):
+            self.assertGreater(len(threads), 1)
+
+    def test_prefetch_pipeline_stopped_on_error(self):
+        """
+        Assert that the prefetch thread is shut down if the simulation raises
+        before the last chunk is computed.
+        """
+        class Boom(Exception):
+            pass
+
+        def initialize(context):
+            p = attach_pipeline(Pipeline(), 'test', chunksize=1)
+            p.add(USEquityPricing.close.latest, 'close')
+
+        def handle_data(context, data):
+            pipeline_output('test')
+            raise Boom()
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start,
+            end=self.last_asset_end,
+            env=self.env,
+            prefetch_pipeline=True,
+        )
+        with self.assertRaises(Boom):
+            algo.run(self.data_portal)
+
+        self.assertIsNone(algo._pipeline_prefetch_pool)
+        self.assertIsNone(algo._pipeline_prefetch)
+
+    def test_multiple_pipelines(self):
+        """
+        Assert that several pipelines can be attached and that each produces
+        its own output.
+        """
+        def initialize(context):
+            close = USEquityPricing.close.latest
+            attach_pipeline(Pipeline({'close': close}), 'all')
+            attach_pipeline(
+                Pipeline({'close': close, 'double': close * 2}, close.top(1)),
+                'top',
+            )
+
+        def handle_data(context, data):
+            all_results = pipeline_output('all')
+            top_results = pipeline_output('top')
+            self.assertEqual(list(all_results.columns), ['close'])
+            self.assertEqual(list(top_results.columns), ['close', 'double'])
+
+            if all_results.empty:
+                self.assertTrue(top_results.empty)
+                return
+
+            self.assertEqual(
+                list(top_results.index),
+                [all_results['close'].idxmax()],
+            )
+            self.assertEqual(
+                top_results['close'].iloc[0],
+                all_results['close'].max(),
+            )
+            self.assertEqual(
+                top_results['double'].iloc[0],
+                2 * all_results['close'].max(),
+            )
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start,
+            end=self.last_asset_end,
+            env=self.env,
+        )
+
+        algo.run(self.data_portal)
+
 
 class MockDailyBarSpotReader(object):
     """
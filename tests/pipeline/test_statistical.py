@@ -2,12 +2,17 @@
 Tests for statistical pipeline terms.
 """
 from numpy import (
+    apply_along_axis,
     arange,
+    broadcast_arrays,
+    errstate,
     full,
     full_like,
     nan,
     where,
 )
+from numpy.random import RandomState
+from numpy.testing import assert_almost_equal
 from pandas import (
     DataFrame,
     date_range,
@@ -15,7 +20,7 @@ from pandas import (
     Timestamp,
 )
 from pandas.util.testing import assert_frame_equal
-from scipy.stats import linregress, pearsonr, spearmanr
+from scipy.stats import linregress, pearsonr, rankdata, spearmanr
 
 from zipline.assets import Equity
 from zipline.errors import IncompatibleTerms, NonExistentAssetInTimeFrame
@@ -29,6 +34,11 @@ from zipline.pipeline.factors import (
     RollingPearsonOfReturns,
     RollingSpearmanOfReturns,
 )
+from zipline.pipeline.factors.statistical import (
+    rankdata_columns,
+    vectorized_linregress,
+    vectorized_pearson_r,
+)
 from zipline.pipeline.loaders.frame import DataFrameLoader
 from zipline.pipeline.sentinels import NotSpecified
 from zipline.testing import (
@@ -802,3 +812,56 @@ class StatisticalMethodsTestCase(WithSeededRandomPipelineEngine,
                 columns=assets,
             )
             assert_frame_equal(output_result, expected_output_result)
+
+
+class VectorizedStatisticsTestCase(ZiplineTestCase):
+
+    def make_data(self, seed, nrows, ncols):
+        rand = RandomState(seed)
+        # Round so that we get ties to exercise average ranking.
+        return rand.randn(nrows, ncols).round(1)
+
+    @parameter_space(nrows=[3, 10], target_ncols=[1, 5])
+    def test_matches_scipy(self, nrows, target_ncols):
+        data = self.make_data(0, nrows, 5)
+        target = self.make_data(1, nrows, target_ncols)
+        broadcast_target = broadcast_arrays(target, data)[0]
+
+        expected_pearson = []
+        expected_spearman = []
+        expected_regression = []
+        for i in range(data.shape[1]):
+            expected_pearson.append(
+                pearsonr(data[:, i], broadcast_target[:, i])[0]
+            )
+            expected_spearman.append(
+                spearmanr(data[:, i], broadcast_target[:, i])[0]
+            )
+            expected_regression.append(
+                linregress(y=data[:, i], x=broadcast_target[:, i])
+            )
+
+        with errstate(divide='ignore', invalid='ignore'):
+            assert_almost_equal(
+                vectorized_pearson_r(data, target),
+                expected_pearson,
+            )
+            assert_almost_equal(
+                vectorized_pearson_r(
+                    rankdata_columns(data),
+                    rankdata_columns(target),
+                ),
+                expected_spearman,
+            )
+            for result, expected in zip(
+                    vectorized_linregress(y=data, x=target),
+                    zip(*expected_regression)):
+                assert_almost_equal(result, expected)
+
+    def test_rankdata_columns(self):
+        data = self.make_data(2, 20, 4)
+        data[[3, 7], 1] = nan
+        check_arrays(
+            rankdata_columns(data),
+            apply_along_axis(rankdata, 0, data),
+        )
@@ -7,17 +7,25 @@ import pandas as pd
 import talib
 
 from zipline.lib.adjusted_array import AdjustedArray
+from zipline.lib.adjustment import Float64Multiply
+from zipline.pipeline import CustomFactor
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.factors import (
+    AverageDollarVolume,
     BollingerBands,
     Aroon,
+    EWMA,
+    EWMSTD,
     FastStochasticOscillator,
     IchimokuKinkoHyo,
     LinearWeightedMovingAverage,
     RateOfChangePercentage,
+    SimpleMovingAverage,
     TrueRange,
+    VWAP,
 )
-from zipline.testing import parameter_space
+from zipline.pipeline.graph import ExecutionPlan
+from zipline.testing import check_allclose, parameter_space
 from zipline.testing.fixtures import ZiplineTestCase
 from zipline.testing.predicates import assert_equal
 
@@ -403,3 +411,180 @@ class TestTrueRange(ZiplineTestCase):
 
         tr.compute(today, assets, out, highs, lows, closes)
         assert_equal(out, np.full((3,), 2))
+
+
+class RollingSum(CustomFactor):
+    inputs = [USEquityPricing.close]
+    incremental = True
+    updates = 0
+
+    def compute(self, today, assets, out, closes):
+        out[:] = closes.sum(axis=0)
+
+    def reset(self, closes):
+        return closes.sum(axis=0)
+
+    def update(self, state, entering, leaving):
+        type(self).updates += 1
+        return state + entering[0] - leaving[0]
+
+    def emit(self, state, out):
+        out[:] = state
+
+
+class IncrementalFactorTestCase(BasePipelineTestCase):
+
+    def make_workspace(self, seed):
+        rand = np.random.RandomState(seed)
+        shape = self.default_shape
+        closes = rand.uniform(10, 100, shape)
+        closes[rand.uniform(size=shape) < 0.2] = np.nan
+        volumes = rand.randint(0, 1000, shape).astype(np.float64)
+        volumes[rand.uniform(size=shape) < 0.2] = np.nan
+
+        # A 2:1 split of the first five assets, known on the 15th day.
+        return {
+            USEquityPricing.close: AdjustedArray(
+                data=closes,
+                mask=np.ones(shape, dtype=bool),
+                adjustments={15: [Float64Multiply(0, 14, 0, 4, 0.5)]},
+                missing_value=np.nan,
+            ),
+            USEquityPricing.volume: AdjustedArray(
+                data=volumes,
+                mask=np.ones(shape, dtype=bool),
+                adjustments={15: [Float64Multiply(0, 14, 0, 4, 2.0)]},
+                missing_value=np.nan,
+            ),
+        }
+
+    def run_terms(self, terms, initial_workspace, mask):
+        start_date, end_date = mask.index[[0, -1]]
+        graph = ExecutionPlan(
+            terms,
+            all_dates=self.nyse_sessions,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return self.run_graph(graph, initial_workspace, mask)
+
+    @parameter_space(
+        factor_type=[
+            SimpleMovingAverage,
+            AverageDollarVolume,
+            VWAP,
+            EWMA,
+            EWMSTD,
+        ],
+        window_length=[2, 5, 10],
+        masked={True, False},
+        __fail_fast=True,
+    )
+    def test_matches_compute(self, factor_type, window_length, masked):
+        kwargs = {'window_length': window_length}
+        if factor_type in (SimpleMovingAverage, EWMA, EWMSTD):
+            kwargs['inputs'] = [USEquityPricing.close]
+        if factor_type in (EWMA, EWMSTD):
+            kwargs['decay_rate'] = 0.5
+
+        # The same factor, computed by calling ``compute`` on every window.
+        full_type = type(
+            'Full' + factor_type.__name__,
+            (factor_type,),
+            {'incremental': False},
+        )
+        mask = self.eye_mask() if masked else self.ones_mask()
+
+        results = self.run_terms(
+            terms={
+                'incremental': factor_type(**kwargs),
+                'full': full_type(**kwargs),
+            },
+            initial_workspace=self.make_workspace(seed=window_length),
+            mask=self.build_mask(mask),
+        )
+        check_allclose(results['incremental'], results['full'])
+
+    @parameter_space(
+        mean_and_std=[(5e6, 1.0), (1000.0, 0.001)],
+        window_length=[5, 10],
+        __fail_fast=True,
+    )
+    def test_ewmstd_large_mean(self, mean_and_std, window_length):
+        # The running sums lose precision if they're taken over the raw
+        # values of data with a large mean and a small spread.
+        mean, std = mean_and_std
+        rand = np.random.RandomState(window_length)
+        shape = self.default_shape
+        closes = mean + std * rand.randn(*shape)
+        closes[rand.uniform(size=shape) < 0.1] = np.nan
+
+        kwargs = {
+            'inputs': [USEquityPricing.close],
+            'window_length': window_length,
+            'decay_rate': 0.5,
+        }
+        full_type = type('FullEWMSTD', (EWMSTD,), {'incremental': False})
+        results = self.run_terms(
+            terms={
+                'incremental': EWMSTD(**kwargs),
+                'full': full_type(**kwargs),
+            },
+            initial_workspace={
+                USEquityPricing.close: AdjustedArray(
+                    data=closes,
+                    mask=np.ones(shape, dtype=bool),
+                    adjustments={},
+                    missing_value=np.nan,
+                ),
+            },
+            mask=self.build_mask(self.ones_mask()),
+        )
+        check_allclose(results['incremental'], results['full'], rtol=1e-9)
+
+    def test_compute_override_is_used(self):
+        class DoubledSMA(SimpleMovingAverage):
+            def compute(self, today, assets, out, data):
+                super(DoubledSMA, self).compute(today, assets, out, data)
+                out *= 2
+
+        kwargs = {'inputs': [USEquityPricing.close], 'window_length': 5}
+        results = self.run_terms(
+            terms={
+                'sma': SimpleMovingAverage(**kwargs),
+                'doubled': DoubledSMA(**kwargs),
+            },
+            initial_workspace=self.make_workspace(seed=5),
+            mask=self.build_mask(self.ones_mask()),
+        )
+        check_allclose(results['doubled'], results['sma'] * 2)
+
+    def test_update_is_used(self):
+        RollingSum.updates = 0
+        mask = self.build_mask(self.ones_mask())
+        closes = self.arange_data()
+
+        results = self.run_terms(
+            terms={'sum': RollingSum(window_length=5)},
+            initial_workspace={
+                USEquityPricing.close: AdjustedArray(
+                    data=closes,
+                    mask=self.ones_mask(),
+                    adjustments={},
+                    missing_value=np.nan,
+                ),
+            },
+            mask=mask,
+        )
+        ndates = len(results['sum'])
+
+        # After five updates in a row the state is rebuilt with ``reset``,
+        # so only the first of every six days is computed from scratch.
+        self.assertEqual(RollingSum.updates, ndates - (ndates + 5) // 6)
+        assert_equal(
+            results['sum'],
+            np.vstack([
+                closes[i:i + 5].sum(axis=0)
+                for i in range(len(closes) - 4)
+            ])[-ndates:],
+        )
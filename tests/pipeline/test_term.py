@@ -241,6 +241,64 @@ class DependencyResolutionTestCase(WithTradingSessions, ZiplineTestCase):
         self.assertEqual(len(set(resolution_order)), 6)
         self.check_dependency_order(resolution_order)
 
+    def test_with_dates(self):
+        """
+        Test that a plan rebuilt for new dates matches a new plan for those
+        dates.
+        """
+        terms = {
+            'f': SomeFactor(),
+            'monthly': SomeOtherFactor(window_length=3).downsample(
+                'month_start',
+            ),
+        }
+        template = self.make_execution_plan(terms)
+
+        for start, end in [('2014-06-01', '2014-06-30'),
+                           ('2014-07-15', '2014-08-15'),
+                           ('2014-09-30', '2014-10-01')]:
+            start = pd.Timestamp(start, tz='UTC')
+            end = pd.Timestamp(end, tz='UTC')
+            expected = ExecutionPlan(terms, self.nyse_sessions, start, end)
+            result = template.with_dates(self.nyse_sessions, start, end)
+
+            self.assertEqual(result.extra_rows, expected.extra_rows)
+            self.assertEqual(result.offset, expected.offset)
+            self.assertEqual(list(result.ordered()), list(template.ordered()))
+            self.assertEqual(set(result.edges()), set(expected.edges()))
+            self.assertEqual(result.outputs, terms)
+
+        # The template's own extra rows are unchanged.
+        self.assertEqual(
+            template.extra_rows,
+            self.make_execution_plan(terms).extra_rows,
+        )
+
+    def test_share_extra_rows(self):
+        """
+        Test that terms sharing extra rows are computed for the longest window
+        among them, and that their dependents skip the rows they don't need.
+        """
+        foo, bar, buzz = SomeDataSet.foo, SomeDataSet.bar, SomeDataSet.buzz
+        short = SomeFactor([foo], window_length=3)
+        long_ = SomeOtherFactor([bar], window_length=10)
+        graph = self.make_execution_plan(
+            to_dict([short, long_, SomeFactor([buzz], window_length=1)]),
+        )
+        graph.share_extra_rows(
+            [[foo, bar]],
+            self.nyse_sessions,
+            self.execution_plan_start,
+            self.execution_plan_end,
+        )
+
+        self.assertEqual(graph.extra_rows[foo], 9)
+        self.assertEqual(graph.extra_rows[bar], 9)
+        self.assertEqual(graph.extra_rows[buzz], 0)
+        self.assertEqual(graph.extra_rows[AssetExists()], 9)
+        self.assertEqual(graph.offset[short, foo], 7)
+        self.assertEqual(graph.offset[long_, bar], 0)
+
     def test_disallow_recursive_lookback(self):
 
         with self.assertRaises(NonWindowSafeInput):
@@ -15,6 +15,9 @@
 """
 Tests for USEquityPricingLoader and related classes.
 """
+from multiprocessing.pool import ThreadPool
+import sqlite3
+
 from numpy import (
     arange,
     datetime64,
@@ -44,12 +47,14 @@ from zipline.pipeline.loaders.equity_pricing_loader import (
     USEquityPricingLoader,
 )
 
+from zipline.data.us_equity_pricing import SQLiteAdjustmentReader
 from zipline.errors import WindowLengthTooLong
-from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.data import USEquityPricing, USEquityPricingFloat32
 from zipline.testing import (
     seconds_to_timestamp,
     str_to_seconds,
     MockDailyBarReader,
+    tmp_dir,
 )
 from zipline.testing.fixtures import (
     WithAdjustmentReader,
@@ -395,6 +400,84 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
                 self.assertEqual(adj.last_col, expected.last_col)
                 assert_allclose(adj.value, expected.value)
 
+    def test_get_adjustments_for_sid_in_memory(self):
+        in_memory_reader = SQLiteAdjustmentReader(
+            self.adjustment_reader.conn,
+            in_memory=True,
+        )
+        # Include a sid without any adjustments.
+        for sid in list(self.assets) + [max(self.assets) + 1]:
+            for table_name in 'splits', 'mergers', 'dividends':
+                self.assertEqual(
+                    in_memory_reader.get_adjustments_for_sid(table_name, sid),
+                    self.adjustment_reader.get_adjustments_for_sid(
+                        table_name,
+                        sid,
+                    ),
+                )
+
+    def test_get_adjustments_for_sids(self):
+        in_memory_reader = SQLiteAdjustmentReader(
+            self.adjustment_reader.conn,
+            in_memory=True,
+        )
+        # Include a sid without any adjustments, and ask out of order.
+        sids = sorted(self.assets, reverse=True) + [max(self.assets) + 1]
+        for table_name in 'splits', 'mergers', 'dividends':
+            for reader in self.adjustment_reader, in_memory_reader:
+                result = reader.get_adjustments_for_sids(table_name, sids)
+                self.assertEqual(sorted(result), sorted(sids))
+                for sid in sids:
+                    expected = self.adjustment_reader.get_adjustments_for_sid(
+                        table_name,
+                        sid,
+                    )
+                    effective_dates, ratios = result[sid]
+                    self.assertEqual(
+                        list(effective_dates),
+                        [date for date, _ in expected],
+                    )
+                    assert_array_equal(
+                        ratios,
+                        [ratio for _, ratio in expected],
+                    )
+
+    def test_load_adjustments_from_another_thread(self):
+        columns = ['close', 'volume']
+        query_days = self.calendar_days_between(
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+        )
+        expected = self.adjustment_reader.load_adjustments(
+            columns,
+            query_days,
+            self.assets,
+        )
+
+        with tmp_dir() as tmp:
+            path = tmp.getpath('adjustments.sqlite')
+            conn = sqlite3.connect(path)
+            conn.executescript(
+                '\n'.join(self.adjustment_reader.conn.iterdump()),
+            )
+            conn.close()
+
+            # The reader's own connection can't be used from the pool's
+            # thread, so it needs to open another one.
+            reader = SQLiteAdjustmentReader(path)
+            pool = ThreadPool(1)
+            try:
+                result = pool.apply(
+                    reader.load_adjustments,
+                    (columns, query_days, self.assets),
+                )
+            finally:
+                pool.close()
+                pool.join()
+                reader.conn.close()
+
+        self.assertEqual(result, expected)
+
     def test_read_no_adjustments(self):
         adjustment_reader = NullAdjustmentReader()
         columns = [USEquityPricing.close, USEquityPricing.volume]
@@ -558,3 +641,53 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
             highs.traverse(windowlen + 1)
         with self.assertRaises(WindowLengthTooLong):
             volumes.traverse(windowlen + 1)
+
+    def test_read_each_column_name_once(self):
+        reader = self.bcolz_equity_daily_bar_reader
+        reads = []
+
+        class CountingReader(object):
+            trading_calendar = reader.trading_calendar
+
+            def load_raw_arrays(self, columns, start_date, end_date, assets):
+                reads.append(list(columns))
+                return reader.load_raw_arrays(
+                    columns, start_date, end_date, assets,
+                )
+
+        loader = USEquityPricingLoader(
+            CountingReader(),
+            self.adjustment_reader,
+        )
+        fresh_loader = USEquityPricingLoader(reader, self.adjustment_reader)
+        query_days = self.calendar_days_between(
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+        )
+        assets = self.assets
+
+        def load(loader, columns):
+            return loader.load_adjusted_array(
+                columns,
+                dates=query_days,
+                assets=assets,
+                mask=ones((len(query_days), len(assets)), dtype=bool),
+            )
+
+        columns = [
+            USEquityPricing.close,
+            USEquityPricingFloat32.close,
+            USEquityPricing.volume,
+        ]
+        results = load(loader, columns)
+        # Columns with the same name are only read once.
+        self.assertEqual(reads, [['close', 'volume']])
+
+        for column, result in results.items():
+            expected = load(fresh_loader, [column])[column]
+            self.assertEqual(result.dtype, column.dtype)
+            for windowlen in 1, 3, len(query_days):
+                for window, expected_window in zip(
+                        result.traverse(windowlen),
+                        expected.traverse(windowlen)):
+                    assert_array_equal(window, expected_window)
@@ -23,6 +23,7 @@ import pandas as pd
 
 from zipline._protocol import handle_non_market_minutes
 
+from zipline.assets import Equity
 from zipline.data.data_portal import DataPortal
 from zipline.protocol import BarData
 from zipline.testing import (
@@ -647,6 +648,68 @@ class TestMinuteBarData(WithBarDataChecks,
             self.assertEqual(info[1], series.loc[nyse_asset])
             self.assertEqual(info[2], series.loc[ice_asset])
 
+    def test_can_trade_and_is_stale_multiple_assets(self):
+        assets = [
+            self.ASSET1,
+            self.ASSET2,
+            self.HILARIOUSLY_ILLIQUID_ASSET,
+            self.asset_finder.retrieve_asset(6),
+            self.asset_finder.retrieve_asset(7),
+        ]
+        cal = get_calendar("CME")
+        minutes = self.trading_calendar.minutes_for_session(
+            self.equity_minute_bar_days[0],
+        )
+        minutes_to_check = chain(
+            [minutes[0] - pd.Timedelta(minutes=1)],
+            minutes[:60:7],
+            [minutes[-1] + pd.Timedelta(minutes=1)],
+        )
+
+        for minute in minutes_to_check:
+            bar_data = BarData(
+                self.data_portal, lambda: minute, "minute", cal
+            )
+
+            can_trade = bar_data.can_trade(assets)
+            is_stale = bar_data.is_stale(assets)
+            for asset in assets:
+                self.assertEqual(
+                    can_trade.loc[asset],
+                    bar_data.can_trade(asset),
+                )
+                self.assertEqual(
+                    is_stale.loc[asset],
+                    bar_data.is_stale(asset),
+                )
+
+    def test_can_trade_and_is_stale_nat_end_date(self):
+        # Asset.is_alive_for_session treats a NaT end date as NaT.value, so
+        # such an asset is never alive.
+        nat_asset = Equity(
+            self.ASSET1.sid,
+            exchange=self.ASSET1.exchange,
+            start_date=self.ASSET1.start_date,
+            end_date=pd.NaT,
+        )
+        assets = [nat_asset, self.ASSET2]
+        minute = self.trading_calendar.minutes_for_session(
+            self.equity_minute_bar_days[0],
+        )[5]
+        bar_data = BarData(
+            self.data_portal,
+            lambda: minute,
+            "minute",
+            self.trading_calendar,
+        )
+
+        can_trade = bar_data.can_trade(assets)
+        is_stale = bar_data.is_stale(assets)
+        self.assertFalse(bar_data.can_trade(nat_asset))
+        for asset in assets:
+            self.assertEqual(can_trade.loc[asset], bar_data.can_trade(asset))
+            self.assertEqual(is_stale.loc[asset], bar_data.is_stale(asset))
+
     def test_is_stale_during_non_market_hours(self):
         bar_data = BarData(
             self.data_portal,
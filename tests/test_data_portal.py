@@ -14,12 +14,13 @@
 # limitations under the License.
 from collections import OrderedDict
 
+from mock import patch
 from numpy import array, append, nan, full
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_array_equal
 import pandas as pd
 from pandas.tslib import Timedelta
 
-from zipline.assets import Equity
+from zipline.assets import asset_date_bounds, Equity
 from zipline.testing.fixtures import (
     ZiplineTestCase,
     WithTradingSessions,
@@ -295,6 +296,59 @@ class TestDataPortal(WithDataPortal,
                   for field in expected.keys()]
         assert_almost_equal(array(list(expected.values())), result)
 
+    def test_get_spot_values_minute(self):
+        trading_calendar = self.trading_calendars[Equity]
+        assets = self.asset_finder.retrieve_all([1, 10000])
+        fields = ['open', 'high', 'low', 'close', 'volume', 'price']
+
+        for session in self.trading_days[:4]:
+            dts = trading_calendar.minutes_for_session(session)
+            for dt in list(dts[:7]) + [dts[100]]:
+                result = self.data_portal.get_spot_values(
+                    assets,
+                    fields,
+                    dt,
+                    'minute',
+                )
+                for field in fields:
+                    expected = [
+                        self.data_portal.get_spot_value(
+                            asset,
+                            field,
+                            dt,
+                            'minute',
+                        )
+                        for asset in assets
+                    ]
+                    assert_almost_equal(
+                        result[field].values,
+                        expected,
+                        err_msg='field=%s, dt=%s' % (field, dt),
+                    )
+                self.assertEqual(list(result.index), assets)
+
+    def test_get_asset_date_bounds_cached(self):
+        assets = self.asset_finder.retrieve_all([1, 10000])
+        expected_starts, expected_ends = asset_date_bounds(assets)
+
+        with patch(
+            'zipline.data.data_portal.asset_date_bounds',
+            wraps=asset_date_bounds,
+        ) as patched:
+            # Other tests may already have cached these assets.
+            self.data_portal.get_asset_date_bounds(assets)
+            call_count = patched.call_count
+            self.assertLessEqual(call_count, 1)
+
+            # A new list of the same assets is looked up in the cache.
+            starts, ends = self.data_portal.get_asset_date_bounds(
+                list(assets),
+            )
+            assert_array_equal(starts, expected_starts)
+            assert_array_equal(ends, expected_ends)
+            self.assertEqual(patched.call_count, call_count)
+            self.assertFalse(starts.flags.writeable)
+
     def test_bar_count_for_simple_transforms(self):
         # July 2015
         # Su Mo Tu We Th Fr Sa
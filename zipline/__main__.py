@@ -151,6 +151,13 @@ def ipython_only(option):
     help='The date to lookup data on or before.\n'
     '[default: <current-time>]'
 )
+@click.option(
+    '--adjustments-in-memory/--no-adjustments-in-memory',
+    is_flag=True,
+    default=False,
+    help="Read the bundle's adjustments into memory on first use instead of"
+    " querying them for every asset.",
+)
 @click.option(
     '-s',
     '--start',
@@ -193,6 +200,7 @@ def run(ctx,
         capital_base,
         bundle,
         bundle_timestamp,
+        adjustments_in_memory,
         start,
         end,
         output,
@@ -232,6 +240,7 @@ def run(ctx,
         data=None,
         bundle=bundle,
         bundle_timestamp=bundle_timestamp,
+        adjustments_in_memory=adjustments_in_memory,
         start=start,
         end=end,
         output=output,
@@ -25,6 +25,7 @@ from cpython cimport bool
 from collections import Iterable
 
 from zipline.assets import Asset, Future
+from zipline.utils.calendars import get_calendar
 from zipline.zipline_warnings import ZiplineDeprecationWarning
 
 
@@ -371,17 +372,37 @@ cdef class BarData:
                 # assume assets is iterable
                 # return a Series indexed by asset
                 if not self._adjust_minutes:
+                    return self.data_portal.get_spot_values(
+                        assets,
+                        [field],
+                        self._get_current_minute(),
+                        self.data_frequency
+                    )[field]
+                else:
                     return pd.Series(data={
-                        asset: self.data_portal.get_spot_value(
+                        asset: self.data_portal.get_adjusted_value(
                                     asset,
                                     field,
                                     self._get_current_minute(),
+                                    self.simulation_dt_func(),
                                     self.data_frequency
                                )
                         for asset in assets
                         }, index=assets, name=fields)
-                else:
-                    return pd.Series(data={
+
+            else:
+                # both assets and fields are iterable
+                if not self._adjust_minutes:
+                    return self.data_portal.get_spot_values(
+                        assets,
+                        fields,
+                        self._get_current_minute(),
+                        self.data_frequency
+                    )
+
+                data = {}
+                for field in fields:
+                    series = pd.Series(data={
                         asset: self.data_portal.get_adjusted_value(
                                     asset,
                                     field,
@@ -390,37 +411,8 @@ cdef class BarData:
                                     self.data_frequency
                                )
                         for asset in assets
-                        }, index=assets, name=fields)
-
-            else:
-                # both assets and fields are iterable
-                data = {}
-
-                if not self._adjust_minutes:
-                    for field in fields:
-                        series = pd.Series(data={
-                            asset: self.data_portal.get_spot_value(
-                                        asset,
-                                        field,
-                                        self._get_current_minute(),
-                                        self.data_frequency
-                                   )
-                            for asset in assets
-                            }, index=assets, name=field)
-                        data[field] = series
-                else:
-                    for field in fields:
-                        series = pd.Series(data={
-                            asset: self.data_portal.get_adjusted_value(
-                                        asset,
-                                        field,
-                                        self._get_current_minute(),
-                                        self.simulation_dt_func(),
-                                        self.data_frequency
-                                   )
-                            for asset in assets
-                            }, index=assets, name=field)
-                        data[field] = series
+                        }, index=assets, name=field)
+                    data[field] = series
 
                 return pd.DataFrame(data)
 
@@ -471,12 +463,13 @@ cdef class BarData:
                 assets, dt, adjusted_dt, data_portal
             )
         else:
-            return pd.Series(data={
-                asset: self._can_trade_for_asset(
-                    asset, dt, adjusted_dt, data_portal
-                )
-                for asset in assets
-            })
+            assets = list(assets)
+            return pd.Series(data=dict(zip(
+                assets,
+                self._can_trade_for_assets(
+                    assets, dt, adjusted_dt, data_portal
+                ),
+            )), dtype=bool)
 
     cdef bool _can_trade_for_asset(self, asset, dt, adjusted_dt, data_portal):
         cdef object session_label
@@ -507,6 +500,53 @@ cdef class BarData:
             )
         )
 
+    cdef _can_trade_for_assets(self, assets, dt, adjusted_dt, data_portal):
+        """
+        ``_can_trade_for_asset`` for a list of assets, checking lifetimes with
+        arrays of start and end dates, exchanges once per exchange and prices
+        with one ``get_spot_values`` call.
+        """
+        session_label = self._trading_calendar.minute_to_session_label(dt)
+
+        # Match the NaT handling of Asset.is_alive_for_session, which is
+        # used for single assets.
+        starts, ends = data_portal.get_asset_date_bounds(
+            assets,
+            nat_is_unbounded=False,
+        )
+        can_trade = (
+            (starts <= session_label.value) & (session_label.value <= ends)
+        )
+
+        if not self._daily_mode:
+            if self._trading_calendar.is_open_on_minute(dt):
+                dt_to_use_for_exchange_check = dt
+            else:
+                dt_to_use_for_exchange_check = \
+                    self._trading_calendar.next_open(dt)
+
+            exchanges = np.array(
+                [asset.exchange for asset in assets],
+                dtype=object,
+            )
+            for exchange in set(exchanges[can_trade]):
+                if not get_calendar(exchange).is_open_on_minute(
+                        dt_to_use_for_exchange_check):
+                    can_trade &= exchanges != exchange
+
+        # is there a last price?
+        candidates = np.flatnonzero(can_trade)
+        if len(candidates):
+            prices = data_portal.get_spot_values(
+                [assets[i] for i in candidates],
+                ["price"],
+                adjusted_dt,
+                self.data_frequency,
+            )["price"]
+            can_trade[candidates] = pd.notnull(prices.values)
+
+        return can_trade
+
     @check_parameters(('assets',), (Asset,))
     def is_stale(self, assets):
         """
@@ -540,12 +580,13 @@ cdef class BarData:
                 assets, dt, adjusted_dt, data_portal
             )
         else:
-            return pd.Series(data={
-                asset: self._is_stale_for_asset(
-                    asset, dt, adjusted_dt, data_portal
-                )
-                for asset in assets
-            })
+            assets = list(assets)
+            return pd.Series(data=dict(zip(
+                assets,
+                self._is_stale_for_assets(
+                    assets, dt, adjusted_dt, data_portal
+                ),
+            )), dtype=bool)
 
     cdef bool _is_stale_for_asset(self, asset, dt, adjusted_dt, data_portal):
         session_label = normalize_date(dt) # FIXME
@@ -569,6 +610,46 @@ cdef class BarData:
 
             return not (last_traded_dt is pd.NaT)
 
+    cdef _is_stale_for_assets(self, assets, dt, adjusted_dt, data_portal):
+        """
+        ``_is_stale_for_asset`` for a list of assets, checking lifetimes with
+        arrays of start and end dates and volumes with one
+        ``get_spot_values`` call.
+        """
+        session_label = normalize_date(dt) # FIXME
+
+        # Match the NaT handling of Asset.is_alive_for_session, which is
+        # used for single assets.
+        starts, ends = data_portal.get_asset_date_bounds(
+            assets,
+            nat_is_unbounded=False,
+        )
+        alive = np.flatnonzero(
+            (starts <= session_label.value) & (session_label.value <= ends)
+        )
+
+        is_stale = np.zeros(len(assets), dtype=bool)
+        if not len(alive):
+            return is_stale
+
+        current_volumes = data_portal.get_spot_values(
+            [assets[i] for i in alive],
+            ["volume"],
+            adjusted_dt,
+            self.data_frequency,
+        )["volume"].values
+
+        # Assets with a current volume aren't stale. For the rest, we need to
+        # distinguish between if the asset has ever traded (stale = True) or
+        # has never traded (stale = False)
+        for i in alive[~(current_volumes > 0)]:
+            last_traded_dt = data_portal.get_spot_value(
+                assets[i], "last_traded", adjusted_dt, self.data_frequency
+            )
+            is_stale[i] = not (last_traded_dt is pd.NaT)
+
+        return is_stale
+
     @check_parameters(('assets', 'fields', 'bar_count',
                        'frequency'),
                       ((Asset,) + string_types, string_types, int,
@@ -24,6 +24,7 @@ from pandas.tseries.tools import normalize_date
 import numpy as np
 
 from itertools import chain, repeat
+from multiprocessing.pool import ThreadPool
 from numbers import Integral
 
 from six import (
@@ -191,6 +192,11 @@ class TradingAlgorithm(object):
         equities_metadata, but will be traded by this TradingAlgorithm.
     get_pipeline_loader : callable[BoundColumn -> PipelineLoader], optional
         The function that maps pipeline columns to their loaders.
+    prefetch_pipeline : bool, optional
+        Whether to compute the next chunk of pipeline results in a background
+        thread while the algorithm consumes the current one. The pipeline
+        loaders must be safe to call from another thread. The thread is shut
+        down when ``run`` returns or raises. default: False
     create_event_context : callable[BarData -> context manager], optional
         A function used to create a context mananger that wraps the
         execution of all events that are scheduled for a bar.
@@ -309,6 +315,11 @@ class TradingAlgorithm(object):
         # Create an always-expired cache so that we compute the first time data
         # is requested.
         self._pipeline_cache = CachedObject(None, pd.Timestamp(0, tz='UTC'))
+        self._prefetch_pipeline = kwargs.pop('prefetch_pipeline', False)
+        self._pipeline_prefetch_pool = None
+        # (start_session, AsyncResult) for the chunk being computed in the
+        # background, if any.
+        self._pipeline_prefetch = None
 
         self.blotter = kwargs.pop('blotter', None)
         self.cancel_policy = kwargs.pop('cancel_policy', NeverCancel())
@@ -693,6 +704,7 @@ class TradingAlgorithm(object):
 
             self.analyze(daily_stats)
         finally:
+            self._stop_pipeline_prefetch()
             self.data_portal = None
 
         return daily_stats
@@ -2267,12 +2279,17 @@ class TradingAlgorithm(object):
         pipeline : Pipeline
             Returns the pipeline that was attached unchanged.
 
+        Notes
+        -----
+        All attached pipelines are computed together, so terms shared between
+        pipelines are only computed once.  When the cached results run out,
+        the next chunk is sized by the ``chunksize`` of the pipeline whose
+        output was requested.
+
         See Also
         --------
         :func:`zipline.api.pipeline_output`
         """
-        if self._pipelines:
-            raise NotImplementedError("Multiple pipelines are not supported.")
         if chunksize is None:
             # Make the first chunk smaller to get more immediate results:
             # (one week, then every half year)
@@ -2312,8 +2329,6 @@ class TradingAlgorithm(object):
         :func:`zipline.api.attach_pipeline`
         :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
         """
-        # NOTE: We don't currently support multiple pipelines, but we plan to
-        # in the future.
         try:
             p, chunks = self._pipelines[name]
         except KeyError:
@@ -2321,9 +2336,9 @@ class TradingAlgorithm(object):
                 name=name,
                 valid=list(self._pipelines.keys()),
             )
-        return self._pipeline_output(p, chunks)
+        return self._pipeline_output(name, chunks)
 
-    def _pipeline_output(self, pipeline, chunks):
+    def _pipeline_output(self, name, chunks):
         """
         Internal implementation of `pipeline_output`.
         """
@@ -2331,12 +2346,13 @@ class TradingAlgorithm(object):
         try:
             data = self._pipeline_cache.unwrap(today)
         except Expired:
-            data, valid_until = self._run_pipeline(
-                pipeline, today, next(chunks),
-            )
+            data, valid_until = self._next_pipeline_chunk(today, chunks)
             self._pipeline_cache = CachedObject(data, valid_until)
+            if self._prefetch_pipeline:
+                self._start_pipeline_prefetch(valid_until, chunks)
 
         # Now that we have a cached result, try to return the data for today.
+        data = data[name]
         try:
             return data.loc[today]
         except KeyError:
@@ -2344,23 +2360,74 @@ class TradingAlgorithm(object):
             # day.
             return pd.DataFrame(index=[], columns=data.columns)
 
-    def _run_pipeline(self, pipeline, start_session, chunksize):
+    def _next_pipeline_chunk(self, today, chunks):
+        """
+        Get the pipeline results for the chunk starting on `today`, using the
+        prefetched chunk if it covers `today`.
+        """
+        prefetch, self._pipeline_prefetch = self._pipeline_prefetch, None
+        if prefetch is not None:
+            start_session, result = prefetch
+            # Wait for the prefetch even if we can't use it so that we never
+            # run more than one chunk at a time.  Errors raised while
+            # computing the chunk are re-raised here.
+            data, valid_until = result.get()
+            if start_session <= today <= valid_until:
+                return data, valid_until
+        return self._run_pipelines(today, next(chunks))
+
+    def _start_pipeline_prefetch(self, valid_until, chunks):
+        """
+        Start computing the chunk after the one ending on `valid_until` in a
+        background thread.
         """
-        Compute `pipeline`, providing values for at least `start_date`.
+        sessions = self.trading_calendar.all_sessions
+        next_loc = sessions.get_loc(valid_until) + 1
+        if (next_loc >= len(sessions) or
+                sessions[next_loc] > self.sim_params.end_session):
+            # This was the last chunk of the simulation.
+            self._stop_pipeline_prefetch()
+            return
 
-        Produces a DataFrame containing data for days between `start_date` and
-        `end_date`, where `end_date` is defined by:
+        if self._pipeline_prefetch_pool is None:
+            self._pipeline_prefetch_pool = ThreadPool(1)
+
+        start_session = sessions[next_loc]
+        self._pipeline_prefetch = start_session, \
+            self._pipeline_prefetch_pool.apply_async(
+                self._run_pipelines,
+                (start_session, next(chunks)),
+            )
+
+    def _stop_pipeline_prefetch(self):
+        """
+        Shut down the background pipeline thread, if any, after waiting for
+        the chunk it is computing to finish.
+        """
+        self._pipeline_prefetch = None
+        pool, self._pipeline_prefetch_pool = self._pipeline_prefetch_pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def _run_pipelines(self, start_session, chunksize):
+        """
+        Compute all attached pipelines, providing values for at least
+        `start_date`.
+
+        Produces a DataFrame for each pipeline containing data for days between
+        `start_date` and `end_date`, where `end_date` is defined by:
 
             `end_date = min(start_date + chunksize trading days,
                             simulation_end)`
 
         Returns
         -------
-        (data, valid_until) : tuple (pd.DataFrame, pd.Timestamp)
+        (data, valid_until) : tuple (dict[str -> pd.DataFrame], pd.Timestamp)
 
         See Also
         --------
-        PipelineEngine.run_pipeline
+        PipelineEngine.run_pipelines
         """
         sessions = self.trading_calendar.all_sessions
 
@@ -2378,8 +2445,12 @@ class TradingAlgorithm(object):
 
         end_session = sessions[end_loc]
 
+        pipelines = {
+            name: pipeline
+            for name, (pipeline, _) in iteritems(self._pipelines)
+        }
         return \
-            self.engine.run_pipeline(pipeline, start_session, end_session), \
+            self.engine.run_pipelines(pipelines, start_session, end_session), \
             end_session
 
     ##################
@@ -17,6 +17,7 @@ from ._assets import (
     Asset,
     Equity,
     Future,
+    asset_date_bounds,
     make_asset_array,
     CACHE_FILE_TEMPLATE
 )
@@ -35,6 +36,7 @@ __all__ = [
     'Future',
     'AssetFinder',
     'AssetConvertible',
+    'asset_date_bounds',
     'make_asset_array',
     'CACHE_FILE_TEMPLATE'
 ]
@@ -31,6 +31,7 @@ from cpython cimport bool
 
 import numpy as np
 from numpy cimport int64_t
+import pandas as pd
 import warnings
 cimport numpy as np
 
@@ -393,3 +394,50 @@ def make_asset_array(int size, Asset asset):
     cdef np.ndarray out = np.empty([size], dtype=object)
     out.fill(asset)
     return out
+
+
+def asset_date_bounds(assets, bint nat_is_unbounded=True):
+    """
+    Get the start and end dates of each of ``assets`` as nanoseconds since
+    the epoch, so that lifetimes can be checked for many assets at once.
+
+    Parameters
+    ----------
+    assets : iterable[Asset]
+        The assets whose dates are desired.
+    nat_is_unbounded : bool, optional
+        Whether NaT dates are treated as missing, as comparisons with NaT in
+        ``DataPortal.get_spot_value`` do. If False, NaT dates are
+        ``NaT.value``, as in ``Asset.is_alive_for_session``, so an asset with
+        a NaT end date is never alive.
+
+    Returns
+    -------
+    starts, ends : np.ndarray[int64]
+        The start and end dates of ``assets``. Missing start dates are the
+        minimum int64 and missing end dates are the maximum int64, so assets
+        without them are treated as unbounded.
+    """
+    cdef Asset asset
+    cdef Py_ssize_t i
+    cdef int64_t unbounded_start = np.iinfo(np.int64).min
+    cdef int64_t unbounded_end = np.iinfo(np.int64).max
+    cdef np.ndarray[int64_t] starts
+    cdef np.ndarray[int64_t] ends
+
+    assets = list(assets)
+    starts = np.empty(len(assets), dtype=np.int64)
+    ends = np.empty(len(assets), dtype=np.int64)
+
+    for i, asset in enumerate(assets):
+        if asset.start_date is None or asset.start_date is pd.NaT:
+            starts[i] = unbounded_start
+        else:
+            starts[i] = asset.start_date.value
+        if asset.end_date is None or (
+                nat_is_unbounded and asset.end_date is pd.NaT):
+            ends[i] = unbounded_end
+        else:
+            ends[i] = asset.end_date.value
+
+    return starts, ends
@@ -498,7 +498,10 @@ def _make_bundle_core():
                 ),
             )
 
-    def load(name, environ=os.environ, timestamp=None):
+    def load(name,
+             environ=os.environ,
+             timestamp=None,
+             adjustments_in_memory=False):
         """Loads a previously ingested bundle.
 
         Parameters
@@ -510,6 +513,10 @@ def _make_bundle_core():
         timestamp : datetime, optional
             The timestamp of the data to lookup.
             Defaults to the current time.
+        adjustments_in_memory : bool, optional
+            Read the adjustment tables into memory on first use instead of
+            querying them for every lookup. See
+            :class:`zipline.data.us_equity_pricing.SQLiteAdjustmentReader`.
 
         Returns
         -------
@@ -531,6 +538,7 @@ def _make_bundle_core():
             ),
             adjustment_reader=SQLiteAdjustmentReader(
                 adjustment_db_path(name, timestr, environ=environ),
+                in_memory=adjustments_in_memory,
             ),
         )
 
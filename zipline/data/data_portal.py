@@ -15,6 +15,7 @@
 from operator import mul
 
 from logbook import Logger
+from lru import LRU
 
 import numpy as np
 import pandas as pd
@@ -22,7 +23,7 @@ from pandas.tslib import normalize_date
 from six import iteritems
 from six.moves import reduce
 
-from zipline.assets import Asset, Future, Equity
+from zipline.assets import Asset, Future, Equity, asset_date_bounds
 from zipline.data.dispatch_bar_reader import (
     AssetDispatchMinuteBarReader,
     AssetDispatchSessionBarReader
@@ -128,6 +129,10 @@ class DataPortal(object):
         self._asset_start_dates = {}
         self._asset_end_dates = {}
 
+        # Cache of (assets, nat_is_unbounded) -> arrays of start and end
+        # dates. Algorithms tend to ask about the same assets every bar.
+        self._asset_date_bounds = LRU(16)
+
         # Handle extra sources, like Fetcher.
         self._augmented_sources_map = {}
         self._extra_source_df = None
@@ -414,6 +419,135 @@ class DataPortal(object):
             else:
                 return self._get_minute_spot_value(asset, field, dt)
 
+    def get_asset_date_bounds(self, assets, nat_is_unbounded=True):
+        """
+        Get the start and end dates of each of ``assets`` as nanoseconds since
+        the epoch.
+
+        The bounds of the last few lists of assets are cached, so checking
+        the lifetimes of the same assets every bar doesn't read each asset's
+        dates again.
+
+        Parameters
+        ----------
+        assets : list[Asset]
+            The assets whose dates are desired.
+        nat_is_unbounded : bool, optional
+            See :func:`zipline.assets.asset_date_bounds`.
+
+        Returns
+        -------
+        starts, ends : np.ndarray[int64]
+            Read-only arrays of the start and end dates of ``assets``.
+        """
+        # Assets hash and compare by sid.
+        key = tuple(assets), nat_is_unbounded
+        try:
+            return self._asset_date_bounds[key]
+        except KeyError:
+            pass
+
+        starts, ends = asset_date_bounds(assets, nat_is_unbounded)
+        starts.setflags(write=False)
+        ends.setflags(write=False)
+        self._asset_date_bounds[key] = starts, ends
+        return starts, ends
+
+    def get_spot_values(self, assets, fields, dt, data_frequency):
+        """
+        Public API method that returns a DataFrame of the values of the
+        desired fields of each of the desired assets at the given dt.
+
+        Parameters
+        ----------
+        assets : iterable[Asset]
+            The assets whose data is desired.
+        fields : iterable[str]
+            The desired fields of the assets.  See ``get_spot_value``.
+        dt : pd.Timestamp
+            The timestamp for the desired values.
+        data_frequency : str
+            The frequency of the data to query; i.e. whether the data is
+            'daily' or 'minute' bars
+
+        Returns
+        -------
+        values : pd.DataFrame
+            A frame indexed by ``assets`` with a column for each of
+            ``fields``, holding the values ``get_spot_value`` would return.
+
+        Notes
+        -----
+        In minute mode, the OHLCV fields and 'price' are read for all of the
+        assets with one call to the minute reader per field, finding the
+        position of ``dt`` once.  Other fields, daily data, and the prices of
+        assets which did not trade at ``dt`` are looked up one asset at a
+        time.
+        """
+        assets = list(assets)
+        return pd.DataFrame(
+            {
+                field: self._get_spot_values(
+                    assets,
+                    field,
+                    dt,
+                    data_frequency,
+                )
+                for field in fields
+            },
+            index=assets,
+        )
+
+    def _get_spot_values(self, assets, field, dt, data_frequency):
+        if (data_frequency != 'minute' or
+                field not in OHLCVP_FIELDS or
+                not all(isinstance(asset, Asset) for asset in assets)):
+            return [
+                self.get_spot_value(asset, field, dt, data_frequency)
+                for asset in assets
+            ]
+
+        reader = self._get_pricing_reader('minute')
+        sids = [asset.sid for asset in assets]
+        try:
+            values = reader.get_values(
+                sids,
+                dt,
+                'close' if field == 'price' else field,
+            )
+        except NoDataOnDate:
+            # dt isn't a market minute, so there are no values to batch.
+            return [
+                self.get_spot_value(asset, field, dt, data_frequency)
+                for asset in assets
+            ]
+
+        # Assets which haven't started or have ended have no value.
+        starts, ends = self.get_asset_date_bounds(assets)
+        session_label = self.trading_calendar.minute_to_session_label(dt)
+        alive = (starts <= dt.value) & (ends >= session_label.value)
+
+        if field == 'volume':
+            values = values.astype(np.int64)
+            values[~alive] = 0
+            return values
+
+        values = values.astype(np.float64)
+        values[~alive] = np.nan
+        if field == 'price':
+            # The close is the price of assets which traded at dt.  The rest
+            # have to be forward filled.
+            volumes = reader.get_values(sids, dt, 'volume')
+            for i in np.flatnonzero(
+                    alive & ((volumes == 0) | np.isnan(values))):
+                values[i] = self._get_minute_spot_value(
+                    assets[i],
+                    'close',
+                    dt,
+                    ffill=True,
+                )
+        return values
+
     def get_adjustments(self, assets, field, dt, perspective_dt):
         """
         Returns a list of adjustments between the dt and perspective_dt for the
@@ -123,6 +123,32 @@ class AssetDispatchMinuteBarReader(AssetDispatchBarReader):
     def _dt_window_size(self, start_dt, end_dt):
         return len(self.trading_calendar.minutes_in_range(start_dt, end_dt))
 
+    def get_values(self, sids, dt, field):
+        sid_groups = {t: [] for t in self._asset_types}
+        out_pos = {t: [] for t in self._asset_types}
+
+        assets = self._asset_finder.retrieve_all(sids)
+
+        for i, asset in enumerate(assets):
+            t = type(asset)
+            sid_groups[t].append(asset.sid)
+            out_pos[t].append(i)
+
+        out = self._make_raw_array_out(field, len(assets))
+        for t, group in iteritems(sid_groups):
+            if not group:
+                continue
+            reader = self._readers[t]
+            try:
+                get_values = reader.get_values
+            except AttributeError:
+                # Not every reader used for minute data is a MinuteBarReader.
+                values = [reader.get_value(sid, dt, field) for sid in group]
+            else:
+                values = get_values(group, dt, field)
+            out[out_pos[t]] = values
+        return out
+
 
 class AssetDispatchSessionBarReader(AssetDispatchBarReader):
 
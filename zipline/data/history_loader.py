@@ -106,7 +106,45 @@ class HistoryLoader(with_metaclass(ABCMeta)):
     def _array(self, start, end, assets, field):
         pass
 
-    def _get_adjustments_in_range(self, asset, dts, field,
+    def _get_adjustments_for_assets(self, assets, field):
+        """
+        Read the adjustments that apply to ``field`` for all of ``assets``.
+
+        Parameters
+        ----------
+        assets : iterable of Assets
+            The assets for which to get adjustments.
+        field : str
+            OHLCV field for which to get the adjustments.
+
+        Returns
+        -------
+        out : dict[int -> list[(pd.DatetimeIndex, np.ndarray)]]
+            Map from sid to the effective dates and ratios of its mergers,
+            dividends and splits, in that order.  Volume is only adjusted for
+            splits, so the ratios are inverted and the other tables skipped.
+        """
+        if field == 'volume':
+            table_names = ('splits',)
+        else:
+            table_names = ('mergers', 'dividends', 'splits')
+        tables = [
+            self._adjustments_reader.get_adjustments_for_sids(
+                table_name,
+                assets,
+            )
+            for table_name in table_names
+        ]
+        out = {}
+        for asset in assets:
+            sid = int(asset)
+            out[sid] = adjustments = [table[sid] for table in tables]
+            if field == 'volume':
+                effective_dates, ratios = adjustments[0]
+                adjustments[0] = effective_dates, 1.0 / ratios
+        return out
+
+    def _get_adjustments_in_range(self, adjustments, dts,
                                   is_perspective_after):
         """
         Get the Float64Multiply objects to pass to an AdjustedArrayWindow.
@@ -124,12 +162,11 @@ class HistoryLoader(with_metaclass(ABCMeta)):
 
         Parameters
         ----------
-        asset : Asset
-            The assets for which to get adjustments.
+        adjustments : list[(pd.DatetimeIndex, np.ndarray)]
+            The effective dates and ratios of an asset's adjustments, as
+            returned by ``_get_adjustments_for_assets``.
         days : iterable of datetime64-like
             The days for which adjustment data is needed.
-        field : str
-            OHLCV field for which to get the adjustments.
         is_perspective_after : bool
             see: `PricingHistoryLoader.history`
             If True, the index at which the Multiply object is registered to
@@ -141,63 +178,14 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         -------
         out : The adjustments as a dict of loc -> Float64Multiply
         """
-        sid = int(asset)
         start = normalize_date(dts[0])
         end = normalize_date(dts[-1])
         adjs = {}
-        if field != 'volume':
-            mergers = self._adjustments_reader.get_adjustments_for_sid(
-                'mergers', sid)
-            for m in mergers:
-                dt = m[0]
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
-                    adj_loc = end_loc
-                    if is_perspective_after:
-                        # Set adjustment pop location so that it applies
-                        # to last value if adjustment occurs immediately after
-                        # the last slot.
-                        adj_loc -= 1
-                    mult = Float64Multiply(0,
-                                           end_loc - 1,
-                                           0,
-                                           0,
-                                           m[1])
-                    try:
-                        adjs[adj_loc].append(mult)
-                    except KeyError:
-                        adjs[adj_loc] = [mult]
-            divs = self._adjustments_reader.get_adjustments_for_sid(
-                'dividends', sid)
-            for d in divs:
-                dt = d[0]
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
-                    adj_loc = end_loc
-                    if is_perspective_after:
-                        # Set adjustment pop location so that it applies
-                        # to last value if adjustment occurs immediately after
-                        # the last slot.
-                        adj_loc -= 1
-                    mult = Float64Multiply(0,
-                                           end_loc - 1,
-                                           0,
-                                           0,
-                                           d[1])
-                    try:
-                        adjs[adj_loc].append(mult)
-                    except KeyError:
-                        adjs[adj_loc] = [mult]
-        splits = self._adjustments_reader.get_adjustments_for_sid(
-            'splits', sid)
-        for s in splits:
-            dt = s[0]
-            if start < dt <= end:
-                if field == 'volume':
-                    ratio = 1.0 / s[1]
-                else:
-                    ratio = s[1]
-                end_loc = dts.searchsorted(dt)
+        for effective_dates, ratios in adjustments:
+            in_range = (effective_dates > start) & (effective_dates <= end)
+            end_locs = dts.searchsorted(effective_dates[in_range].values)
+            for end_loc, ratio in zip(end_locs.tolist(),
+                                      ratios[in_range].tolist()):
                 adj_loc = end_loc
                 if is_perspective_after:
                     # Set adjustment pop location so that it applies
@@ -274,10 +262,19 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             if field == 'volume':
                 array = array.astype(float64_dtype)
 
+            if self._adjustments_reader:
+                adjustments = self._get_adjustments_for_assets(
+                    needed_assets,
+                    field,
+                )
+
             for i, asset in enumerate(needed_assets):
                 if self._adjustments_reader:
                     adjs = self._get_adjustments_in_range(
-                        asset, prefetch_dts, field, is_perspective_after)
+                        adjustments[int(asset)],
+                        prefetch_dts,
+                        is_perspective_after,
+                    )
                 else:
                     adjs = {}
                 window = Float64Window(
@@ -14,7 +14,9 @@
 import json
 import os
 from os.path import join
+from collections import OrderedDict
 from textwrap import dedent
+from threading import Lock
 
 from lru import LRU
 import bcolz
@@ -58,6 +60,31 @@ class MinuteBarReader(BarReader):
     def data_frequency(self):
         return "minute"
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the pricing info for each of the given sids at the given dt.
+
+        Parameters:
+        -----------
+        sids : iterable[int]
+            Asset identifiers.
+        dt : datetime-like
+            The datetime at which the trades occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns:
+        --------
+        out : np.ndarray
+            The value of ``field`` for each sid, as returned by
+            ``get_value``.  OHLC values are float64 and volumes are uint32.
+        """
+        return np.array(
+            [self.get_value(sid, dt, field) for sid in sids],
+            dtype=np.uint32 if field == 'volume' else np.float64,
+        )
+
 
 def _calc_minute_index(market_opens, minutes_per_day):
     minutes = np.zeros(len(market_opens) * minutes_per_day,
@@ -72,7 +99,7 @@ def _calc_minute_index(market_opens, minutes_per_day):
     return pd.to_datetime(minutes, utc=True, box=True)
 
 
-def _sid_subdir_path(sid):
+def _sid_subdir_path(sid, extension='bcolz'):
     """
     Format subdir path to limit the number directories in any given
     subdirectory to 100.
@@ -84,6 +111,8 @@ def _sid_subdir_path(sid):
     -----------
     sid : int
         Asset identifier.
+    extension : str, optional
+        The extension of the sid's directory. Default is 'bcolz'.
 
     Returns:
     --------
@@ -99,7 +128,7 @@ def _sid_subdir_path(sid):
         padded_sid[0:2],
         # subdir 2 XX/00
         padded_sid[2:4],
-        "{0}.bcolz".format(str(padded_sid))
+        "{0}.{1}".format(str(padded_sid), extension)
     )
 
 
@@ -438,18 +467,28 @@ class BcolzMinuteBarWriter(object):
             The midnight of the last date written in to the output for the
             given sid.
         """
-        sizes_path = "{0}/close/meta/sizes".format(self.sidpath(sid))
-        if not os.path.exists(sizes_path):
+        num_minutes = self._num_minutes_in_output(sid)
+        if num_minutes is None:
             return pd.NaT
-        with open(sizes_path, mode='r') as f:
-            sizes = f.read()
-        data = json.loads(sizes)
-        num_days = data['shape'][0] / self._minutes_per_day
+        num_days = num_minutes / self._minutes_per_day
         if num_days == 0:
             # empty container
             return pd.NaT
         return self._session_labels[num_days - 1]
 
+    def _num_minutes_in_output(self, sid):
+        """
+        The number of minutes written for ``sid``, or None if nothing has
+        been written.
+        """
+        sizes_path = "{0}/close/meta/sizes".format(self.sidpath(sid))
+        if not os.path.exists(sizes_path):
+            return None
+        with open(sizes_path, mode='r') as f:
+            sizes = f.read()
+        data = json.loads(sizes)
+        return data['shape'][0]
+
     def _init_ctable(self, path):
         """
         Create empty ctable for given path.
@@ -740,6 +779,89 @@ class BcolzMinuteBarWriter(object):
         table.flush()
 
 
+class MinuteBarBlockCache(object):
+    """
+    A least-recently-used cache of decompressed blocks of minute bar data,
+    bounded by the number of bytes it holds.
+
+    A single cache may be shared by several readers and threads.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        The maximum number of bytes of blocks to hold.  When this is
+        exceeded, the least recently used blocks are dropped.
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups served from the cache.
+    misses : int
+        The number of lookups which had to load their block.
+    nbytes : int
+        The number of bytes of blocks currently held.
+
+    See Also
+    --------
+    zipline.data.minute_bars.BcolzMinuteBarReader
+    """
+    def __init__(self, max_bytes=2 ** 28):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._blocks = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, load):
+        """
+        Get the block stored under ``key``, calling ``load`` to produce and
+        store it if it isn't cached.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the block.
+        load : callable[() -> np.ndarray]
+            A function producing the block.
+
+        Returns
+        -------
+        block : np.ndarray
+            The block.  It must not be modified.
+        """
+        with self._lock:
+            try:
+                # Re-insert the block to mark it as the most recently used.
+                block = self._blocks[key] = self._blocks.pop(key)
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                return block
+
+        block = load()
+        if block.nbytes > self.max_bytes:
+            return block
+
+        with self._lock:
+            if key not in self._blocks:
+                self._blocks[key] = block
+                self.nbytes += block.nbytes
+                while self.nbytes > self.max_bytes:
+                    _, evicted = self._blocks.popitem(last=False)
+                    self.nbytes -= evicted.nbytes
+        return block
+
+    def clear(self):
+        """
+        Drop all blocks and reset the counters.
+        """
+        with self._lock:
+            self._blocks.clear()
+            self.hits = self.misses = self.nbytes = 0
+
+
 class BcolzMinuteBarReader(MinuteBarReader):
     """
     Reader for data written by BcolzMinuteBarWriter
@@ -749,6 +871,17 @@ class BcolzMinuteBarReader(MinuteBarReader):
     rootdir : string
         The root directory containing the metadata and asset bcolz
         directories.
+    sid_cache_size : int, optional
+        The number of open carrays to keep per field.
+    pool : multiprocessing.pool.ThreadPool, optional
+        A pool used by ``load_raw_arrays`` to read and decompress the carrays
+        for each (field, sid) pair concurrently.  Blosc releases the GIL while
+        decompressing, so a thread pool is sufficient.  If not provided, the
+        carrays are read serially.
+    block_cache : MinuteBarBlockCache, optional
+        A cache of decompressed blocks, each holding ``chunklen`` values of
+        one field for one sid, used by ``get_value`` and ``load_raw_arrays``.
+        If not provided, every read decompresses the chunks it touches.
 
     See Also
     --------
@@ -756,8 +889,14 @@ class BcolzMinuteBarReader(MinuteBarReader):
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume')
 
-    def __init__(self, rootdir, sid_cache_size=1000):
+    def __init__(self,
+                 rootdir,
+                 sid_cache_size=1000,
+                 pool=None,
+                 block_cache=None):
         self._rootdir = rootdir
+        self._pool = pool
+        self._block_cache = block_cache
 
         metadata = self._get_metadata()
 
@@ -920,6 +1059,39 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
         return carray
 
+    def _read_values(self, field, sid, start, stop):
+        """
+        Read the raw values of ``field`` for ``sid`` at positions
+        ``start:stop``, going through the block cache if we have one.
+
+        The result is truncated to the data written for ``sid``, and may be a
+        view of a cached block, so it must not be modified.
+        """
+        carray = self._open_minute_file(field, sid)
+        cache = self._block_cache
+        if cache is None:
+            return carray[start:stop]
+
+        stop = min(stop, len(carray))
+        if start >= stop:
+            return np.empty(0, dtype=carray.dtype)
+
+        blocklen = carray.chunklen
+        first_block = start // blocklen
+        blocks = [
+            cache.get(
+                (self._rootdir, int(sid), field, block),
+                lambda block=block: carray[
+                    block * blocklen:(block + 1) * blocklen
+                ],
+            )
+            for block in range(first_block, (stop - 1) // blocklen + 1)
+        ]
+        offset = first_block * blocklen
+        if len(blocks) == 1:
+            return blocks[0][start - offset:stop - offset]
+        return np.concatenate(blocks)[start - offset:stop - offset]
+
     def table_len(self, sid):
         """Returns the length of the underlying table for this sid."""
         return len(self._open_minute_file('close', sid))
@@ -961,21 +1133,10 @@ class BcolzMinuteBarReader(MinuteBarReader):
             Returns the integer value of the volume.
             (A volume of 0 signifies no trades for the given dt.)
         """
-        if self._last_get_value_dt_value == dt.value:
-            minute_pos = self._last_get_value_dt_position
-        else:
-            try:
-                minute_pos = self._find_position_of_minute(dt)
-            except ValueError:
-                raise NoDataOnDate()
-
-            self._last_get_value_dt_value = dt.value
-            self._last_get_value_dt_position = minute_pos
+        minute_pos = self._minute_pos_for_value(dt)
 
-        try:
-            value = self._open_minute_file(field, sid)[minute_pos]
-        except IndexError:
-            value = 0
+        values = self._read_values(field, sid, minute_pos, minute_pos + 1)
+        value = values[0] if len(values) else 0
         if value == 0:
             if field == 'volume':
                 return 0
@@ -986,6 +1147,53 @@ class BcolzMinuteBarReader(MinuteBarReader):
             value *= self._ohlc_ratio_inverse_for_sid(sid)
         return value
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the pricing info for each of the given sids at the given dt,
+        finding the position of ``dt`` once for all sids.
+
+        See Also
+        --------
+        zipline.data.minute_bars.MinuteBarReader.get_values
+        """
+        minute_pos = self._minute_pos_for_value(dt)
+        sids = list(sids)
+        values = np.zeros(len(sids), dtype=np.uint32)
+        for i, sid in enumerate(sids):
+            found = self._read_values(field, sid, minute_pos, minute_pos + 1)
+            if len(found):
+                values[i] = found[0]
+        return self._convert_values(values, sids, field)
+
+    def _minute_pos_for_value(self, dt):
+        """
+        The position of ``dt``, which must be a market minute, remembering
+        the last one looked up.
+        """
+        if self._last_get_value_dt_value == dt.value:
+            return self._last_get_value_dt_position
+
+        try:
+            minute_pos = self._find_position_of_minute(dt)
+        except ValueError:
+            raise NoDataOnDate()
+
+        self._last_get_value_dt_value = dt.value
+        self._last_get_value_dt_position = minute_pos
+        return minute_pos
+
+    def _convert_values(self, values, sids, field):
+        """
+        Convert raw uint32 values of ``field`` for ``sids`` to the values
+        returned by ``get_values``.
+        """
+        if field == 'volume':
+            return values
+        ratios = np.array([
+            self._ohlc_ratio_inverse_for_sid(sid) for sid in sids
+        ])
+        return np.where(values == 0, np.nan, values * ratios)
+
     def get_last_traded_dt(self, asset, dt):
         minute_pos = self._find_last_traded_position(asset, dt)
         if minute_pos == -1:
@@ -1101,29 +1309,643 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
         shape = num_minutes, len(sids)
 
+        tasks = []
         for field in fields:
             if field != 'volume':
                 out = np.full(shape, np.nan)
             else:
                 out = np.zeros(shape, dtype=np.uint32)
+            results.append(out)
+            tasks.extend(
+                (field, sid, out[:, i]) for i, sid in enumerate(sids)
+            )
 
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                values = carray[start_idx:end_idx + 1]
-                if indices_to_exclude is not None:
-                    for excl_start, excl_stop in indices_to_exclude[::-1]:
-                        excl_slice = np.s_[
-                            excl_start - start_idx:excl_stop - start_idx + 1]
-                        values = np.delete(values, excl_slice)
+        def read(task):
+            field, sid, out = task
+            self._read_minutes(
+                field,
+                sid,
+                start_idx,
+                end_idx,
+                indices_to_exclude,
+                out,
+            )
 
-                where = values != 0
-                # first slice down to len(where) because we might not have
-                # written data for all the minutes requested
-                if field != 'volume':
-                    out[:len(where), i][where] = (
-                        values[where] * self._ohlc_ratio_inverse_for_sid(sid))
-                else:
-                    out[:len(where), i][where] = values[where]
+        if self._pool is None:
+            for task in tasks:
+                read(task)
+        else:
+            # Each task writes to its own column of the outputs.
+            self._pool.map(read, tasks)
+        return results
+
+    def _read_minutes(self,
+                      field,
+                      sid,
+                      start_idx,
+                      end_idx,
+                      indices_to_exclude,
+                      out):
+        """
+        Read the values of ``field`` for ``sid`` between ``start_idx`` and
+        ``end_idx``, writing the non-zero values into ``out``.
+        """
+        values = self._read_values(field, sid, start_idx, end_idx + 1)
+        if indices_to_exclude is not None:
+            for excl_start, excl_stop in indices_to_exclude[::-1]:
+                excl_slice = np.s_[
+                    excl_start - start_idx:excl_stop - start_idx + 1]
+                values = np.delete(values, excl_slice)
+
+        where = values != 0
+        # first slice down to len(where) because we might not have
+        # written data for all the minutes requested
+        if field != 'volume':
+            out[:len(where)][where] = (
+                values[where] * self._ohlc_ratio_inverse_for_sid(sid))
+        else:
+            out[:len(where)][where] = values[where]
+
+
+# The on-disk type of each value written by MemmapMinuteBarWriter.
+MEMMAP_DTYPE = np.dtype('<u4')
+
+MEMMAP_EXTENSION = 'mmap'
+
+
+class _MemmapMinuteTable(object):
+    """
+    The parts of the ``bcolz.ctable`` interface used by
+    ``BcolzMinuteBarWriter``, backed by a flat file of ``MEMMAP_DTYPE``
+    values for each column.
+
+    Parameters
+    ----------
+    path : str
+        The directory holding the column files.
+    names : tuple[str]
+        The names of the columns.
+    """
+    def __init__(self, path, names):
+        self._path = path
+        self._names = names
+
+    @property
+    def size(self):
+        try:
+            nbytes = os.path.getsize(join(self._path, 'close'))
+        except OSError:
+            return 0
+        return nbytes // MEMMAP_DTYPE.itemsize
+
+    def __len__(self):
+        return self.size
+
+    def append(self, columns):
+        if not os.path.exists(self._path):
+            os.makedirs(self._path)
+        for name, column in zip(self._names, columns):
+            with open(join(self._path, name), 'ab') as f:
+                f.write(np.asarray(column, dtype=MEMMAP_DTYPE).tobytes())
+
+    def flush(self):
+        # Each append closes its files.
+        pass
+
+
+class MemmapMinuteBarWriter(BcolzMinuteBarWriter):
+    """
+    Class capable of writing minute OHLCV data to disk as uncompressed flat
+    files which can be memory-mapped by a MemmapMinuteBarReader.
+
+    Parameters
+    ----------
+    rootdir : string
+        Path to the root directory into which to write the metadata and
+        per-sid subdirectories.
+    calendar : zipline.utils.calendars.trading_calendar.TradingCalendar
+        The trading calendar on which to base the minute bars.
+    start_session : datetime
+        The first trading session in the data set.
+    end_session : datetime
+        The last trading session in the data set.
+    minutes_per_day : int
+        The number of minutes per each period.
+    default_ohlc_ratio : int, optional
+        The default ratio by which to multiply the pricing data to
+        convert from floats to integers that fit within np.uint32.
+        Default is OHLC_RATIO (1000).
+    ohlc_ratios_per_sid : dict, optional
+        A dict mapping each sid in the output to the ratio by which to
+        multiply the pricing data to convert the floats from floats to
+        an integer to fit within the np.uint32.
+
+    Notes
+    -----
+    The metadata, minute index and value encoding are the same as for
+    BcolzMinuteBarWriter.  Instead of a bcolz ctable, each sid's data is
+    written to a directory (e.g. ``00/00/000001.mmap``) holding a file of
+    little-endian uint32 values for each of the open, high, low, close and
+    volume fields, and an ``attrs.json`` file for attributes written with
+    ``set_sid_attrs``.
+
+    Reading these files costs no decompression, and processes which map the
+    same files share their pages through the OS page cache, at the price of
+    four bytes per minute per field on disk.
+
+    See Also
+    --------
+    zipline.data.minute_bars.MemmapMinuteBarReader
+    zipline.data.minute_bars.BcolzMinuteBarWriter
+    """
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 minutes_per_day,
+                 default_ohlc_ratio=OHLC_RATIO,
+                 ohlc_ratios_per_sid=None):
+        super(MemmapMinuteBarWriter, self).__init__(
+            rootdir,
+            calendar,
+            start_session,
+            end_session,
+            minutes_per_day,
+            default_ohlc_ratio=default_ohlc_ratio,
+            ohlc_ratios_per_sid=ohlc_ratios_per_sid,
+        )
+
+    def sidpath(self, sid):
+        """
+        Parameters:
+        -----------
+        sid : int
+            Asset identifier.
+
+        Returns:
+        --------
+        out : string
+            Full path to the directory of field files for the given sid.
+        """
+        return join(self._rootdir, _sid_subdir_path(sid, MEMMAP_EXTENSION))
+
+    def _num_minutes_in_output(self, sid):
+        path = join(self.sidpath(sid), 'close')
+        if not os.path.exists(path):
+            return None
+        return os.path.getsize(path) // MEMMAP_DTYPE.itemsize
+
+    def _ensure_ctable(self, sid):
+        return _MemmapMinuteTable(self.sidpath(sid), self.COL_NAMES)
+
+    def set_sid_attrs(self, sid, **kwargs):
+        """Write all the supplied kwargs as attributes of the sid's file.
+        """
+        sidpath = self.sidpath(sid)
+        if not os.path.exists(sidpath):
+            os.makedirs(sidpath)
+        attrs = _read_memmap_attrs(sidpath)
+        attrs.update(kwargs)
+        with open(join(sidpath, 'attrs.json'), 'w') as f:
+            json.dump(attrs, f)
+
+
+class MemmapMinuteBarReader(BcolzMinuteBarReader):
+    """
+    Reader for data written by MemmapMinuteBarWriter.
+
+    Field files are opened with ``numpy.memmap``, so reads are slices of the
+    mapped files rather than decompressed copies.
+
+    Parameters:
+    -----------
+    rootdir : string
+        The root directory containing the metadata and per-sid
+        subdirectories.
+    sid_cache_size : int, optional
+        The number of mapped field files to keep per field.
+    pool : multiprocessing.pool.ThreadPool, optional
+        A pool used by ``load_raw_arrays`` to read each (field, sid) pair
+        concurrently.
+
+    See Also
+    --------
+    zipline.data.minute_bars.MemmapMinuteBarWriter
+    zipline.data.minute_bars.BcolzMinuteBarReader
+    """
+    def _get_carray_path(self, sid, field):
+        return os.path.join(
+            self._rootdir,
+            _sid_subdir_path(sid, MEMMAP_EXTENSION),
+            field,
+        )
 
+    def _open_minute_file(self, field, sid):
+        sid = int(sid)
+
+        try:
+            values = self._carrays[field][sid]
+        except KeyError:
+            path = self._get_carray_path(sid, field)
+            if os.path.getsize(path) == 0:
+                # Empty files can't be mapped.
+                values = np.empty(0, dtype=MEMMAP_DTYPE)
+            else:
+                values = np.memmap(path, dtype=MEMMAP_DTYPE, mode='r')
+            self._carrays[field][sid] = values
+
+        return values
+
+    def _read_values(self, field, sid, start, stop):
+        # Mapped files are read without decompression, so there is nothing
+        # worth caching.
+        return self._open_minute_file(field, sid)[start:stop]
+
+    def get_sid_attr(self, sid, name):
+        sid_path = os.path.join(
+            self._rootdir,
+            _sid_subdir_path(sid, MEMMAP_EXTENSION),
+        )
+        return _read_memmap_attrs(sid_path).get(name)
+
+
+def _read_memmap_attrs(sidpath):
+    try:
+        with open(join(sidpath, 'attrs.json')) as f:
+            return json.load(f)
+    except IOError:
+        return {}
+
+
+# The type of the (sid, minutes written) pairs in a consolidated index.
+CONSOLIDATED_INDEX_DTYPE = np.dtype('<i8')
+
+
+class _ConsolidatedMinuteTable(object):
+    """
+    The parts of the ``bcolz.ctable`` interface used by
+    ``BcolzMinuteBarWriter``, backed by one sid's row of the field files of a
+    ConsolidatedMinuteBarWriter.
+    """
+    def __init__(self, writer, sid):
+        self._writer = writer
+        self._sid = sid
+
+    @property
+    def size(self):
+        return self._writer._num_minutes_in_output(self._sid) or 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, columns):
+        self._writer._append(self._sid, columns)
+
+    def flush(self):
+        # Each append closes its files.
+        pass
+
+
+class ConsolidatedMinuteBarWriter(MemmapMinuteBarWriter):
+    """
+    Class capable of writing minute OHLCV data for all sids into one
+    uncompressed file per field, which can be memory-mapped by a
+    ConsolidatedMinuteBarReader.
+
+    Parameters
+    ----------
+    rootdir : string
+        Path to the root directory into which to write the metadata, index
+        and field files.
+    calendar : zipline.utils.calendars.trading_calendar.TradingCalendar
+        The trading calendar on which to base the minute bars.
+    start_session : datetime
+        The first trading session in the data set.
+    end_session : datetime
+        The last trading session in the data set.
+    minutes_per_day : int
+        The number of minutes per each period.
+    default_ohlc_ratio : int, optional
+        The default ratio by which to multiply the pricing data to
+        convert from floats to integers that fit within np.uint32.
+        Default is OHLC_RATIO (1000).
+    ohlc_ratios_per_sid : dict, optional
+        A dict mapping each sid in the output to the ratio by which to
+        multiply the pricing data to convert the floats from floats to
+        an integer to fit within the np.uint32.
+
+    Notes
+    -----
+    The metadata, minute index and value encoding are the same as for
+    BcolzMinuteBarWriter, but instead of a directory per sid the root
+    directory holds:
+
+    - A file for each of the open, high, low, close and volume fields,
+      holding a row of little-endian uint32 values for every minute in the
+      minute index for each sid, in the order the sids were first written.
+      Rows are allocated by growing the files, so the unwritten parts of a
+      row are zero.  They take no space on filesystems supporting sparse
+      files, but on others each new sid costs a full row in every file.
+    - ``index``: a little-endian int64 (sid, minutes written) pair for each
+      row.
+    - ``attrs.json``: attributes written with ``set_sid_attrs``, by sid.
+
+    A reader therefore opens six files regardless of the number of sids.
+
+    See Also
+    --------
+    zipline.data.minute_bars.ConsolidatedMinuteBarReader
+    zipline.data.minute_bars.MemmapMinuteBarWriter
+    """
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 minutes_per_day,
+                 default_ohlc_ratio=OHLC_RATIO,
+                 ohlc_ratios_per_sid=None):
+        super(ConsolidatedMinuteBarWriter, self).__init__(
+            rootdir,
+            calendar,
+            start_session,
+            end_session,
+            minutes_per_day,
+            default_ohlc_ratio=default_ohlc_ratio,
+            ohlc_ratios_per_sid=ohlc_ratios_per_sid,
+        )
+        self._minutes_per_sid = len(self._minute_index)
+        index = _read_consolidated_index(self._rootdir)
+        self._rows = {sid: row for row, sid in enumerate(index[:, 0])}
+        self._lengths = index[:, 1].tolist()
+
+    def _field_path(self, field):
+        return join(self._rootdir, field)
+
+    def _num_minutes_in_output(self, sid):
+        try:
+            row = self._rows[sid]
+        except KeyError:
+            return None
+        return self._lengths[row]
+
+    def _ensure_ctable(self, sid):
+        return _ConsolidatedMinuteTable(self, sid)
+
+    def _row_for_sid(self, sid):
+        try:
+            return self._rows[sid]
+        except KeyError:
+            pass
+
+        row = len(self._lengths)
+        nbytes = (row + 1) * self._minutes_per_sid * MEMMAP_DTYPE.itemsize
+        for field in self.COL_NAMES:
+            with open(self._field_path(field), 'ab') as f:
+                f.truncate(nbytes)
+        self._rows[sid] = row
+        self._lengths.append(0)
+        self._write_index_entry(sid, row)
+        return row
+
+    def _write_index_entry(self, sid, row):
+        path = join(self._rootdir, 'index')
+        with open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+            f.seek(row * 2 * CONSOLIDATED_INDEX_DTYPE.itemsize)
+            f.write(
+                np.array(
+                    [sid, self._lengths[row]],
+                    dtype=CONSOLIDATED_INDEX_DTYPE,
+                ).tobytes(),
+            )
+
+    def _append(self, sid, columns):
+        row = self._row_for_sid(sid)
+        start = self._lengths[row]
+        offset = (row * self._minutes_per_sid + start) * MEMMAP_DTYPE.itemsize
+        for field, column in zip(self.COL_NAMES, columns):
+            with open(self._field_path(field), 'r+b') as f:
+                f.seek(offset)
+                f.write(np.asarray(column, dtype=MEMMAP_DTYPE).tobytes())
+        self._lengths[row] = start + len(columns[0])
+        self._write_index_entry(sid, row)
+
+    def set_sid_attrs(self, sid, **kwargs):
+        """Write all the supplied kwargs as attributes of the sid.
+        """
+        attrs = _read_memmap_attrs(self._rootdir)
+        attrs.setdefault(str(sid), {}).update(kwargs)
+        with open(join(self._rootdir, 'attrs.json'), 'w') as f:
+            json.dump(attrs, f)
+
+
+class ConsolidatedMinuteBarReader(MemmapMinuteBarReader):
+    """
+    Reader for data written by ConsolidatedMinuteBarWriter.
+
+    Each field file is mapped once, and ``load_raw_arrays`` gathers the
+    requested minutes for all sids with a single indexing operation per
+    field.  Sids which were never written are treated as never trading.
+
+    Parameters:
+    -----------
+    rootdir : string
+        The root directory containing the metadata, index and field files.
+    sid_cache_size : int, optional
+        Accepted for compatibility with BcolzMinuteBarReader.  Unused, since
+        each field file is mapped only once.
+    pool : multiprocessing.pool.ThreadPool, optional
+        Accepted for compatibility with BcolzMinuteBarReader.  Unused, since
+        ``load_raw_arrays`` reads all sids at once.
+    block_cache : MinuteBarBlockCache, optional
+        Accepted for compatibility with BcolzMinuteBarReader.  Unused, since
+        mapped files aren't decompressed.
+
+    Notes
+    -----
+    The index is only read again when a sid is missing from it, or when a
+    read runs past the minutes known to be written for a sid, so data
+    appended by a writer in another process is picked up without checking
+    the index on every read.
+
+    Every sid written grows each field file by a row covering the whole
+    minute index, however few minutes it trades.  On filesystems without
+    sparse files, the unwritten parts of these rows take up disk space, so
+    rootdirs holding many short-lived sids can be much larger than the
+    equivalent bcolz data.
+
+    See Also
+    --------
+    zipline.data.minute_bars.ConsolidatedMinuteBarWriter
+    """
+    def __init__(self,
+                 rootdir,
+                 sid_cache_size=1000,
+                 pool=None,
+                 block_cache=None):
+        super(ConsolidatedMinuteBarReader, self).__init__(
+            rootdir,
+            sid_cache_size=sid_cache_size,
+            pool=pool,
+            block_cache=block_cache,
+        )
+        self._index_version = None
+        self._load_index()
+
+    def _load_index(self):
+        """
+        Map the field files for the sids currently in the index, if it has
+        changed since it was last read.
+        """
+        path = join(self._rootdir, 'index')
+        try:
+            stat = os.stat(path)
+        except OSError:
+            version = 0, 0
+        else:
+            # Appending to a sid which is already in the index rewrites its
+            # length in place, which only changes the modification time.
+            version = (
+                stat.st_size,
+                getattr(stat, 'st_mtime_ns', stat.st_mtime),
+            )
+        if version == self._index_version:
+            return
+        self._index_version = version
+
+        index = _read_consolidated_index(self._rootdir)
+        self._rows = {sid: row for row, sid in enumerate(index[:, 0])}
+        self._row_lengths = index[:, 1]
+
+        shape = len(index), len(self._market_opens) * self._minutes_per_day
+        if len(index):
+            self._fields = {
+                field: np.memmap(
+                    join(self._rootdir, field),
+                    dtype=MEMMAP_DTYPE,
+                    mode='r',
+                    shape=shape,
+                )
+                for field in self.FIELDS
+            }
+        else:
+            self._fields = {
+                field: np.empty(shape, dtype=MEMMAP_DTYPE)
+                for field in self.FIELDS
+            }
+
+    def _row_for_sid(self, sid):
+        """
+        The row holding ``sid``'s data, or -1 if ``sid`` was never written.
+        """
+        sid = int(sid)
+        try:
+            return self._rows[sid]
+        except KeyError:
+            # The sid may have been written since we read the index.
+            self._load_index()
+            return self._rows.get(sid, -1)
+
+    def _open_minute_file(self, field, sid):
+        row = self._row_for_sid(sid)
+        if row == -1:
+            return np.empty(0, dtype=MEMMAP_DTYPE)
+        return self._fields[field][row, :self._row_lengths[row]]
+
+    def _read_values(self, field, sid, start, stop):
+        values = self._open_minute_file(field, sid)
+        if stop > len(values):
+            # Minutes may have been appended to the sid since we read the
+            # index.
+            self._load_index()
+            values = self._open_minute_file(field, sid)
+        return values[start:stop]
+
+    def _find_last_traded_position(self, asset, dt):
+        row = self._row_for_sid(asset)
+        if row != -1:
+            length = self._row_lengths[row]
+            if not length or self._pos_to_minute(length - 1) < dt:
+                # Minutes up to ``dt`` may have been appended to the sid
+                # since we read the index.
+                self._load_index()
+        return super(
+            ConsolidatedMinuteBarReader, self,
+        )._find_last_traded_position(asset, dt)
+
+    def get_sid_attr(self, sid, name):
+        return _read_memmap_attrs(self._rootdir).get(str(sid), {}).get(name)
+
+    def get_values(self, sids, dt, field):
+        minute_pos = self._minute_pos_for_value(dt)
+        sids = list(sids)
+        rows = np.array([self._row_for_sid(sid) for sid in sids], dtype=int)
+        values = np.zeros(len(sids), dtype=np.uint32)
+        written = np.flatnonzero(rows != -1)
+        # Minutes after the last one written for a sid are zero.
+        values[written] = self._fields[field][rows[written], minute_pos]
+        return self._convert_values(values, sids, field)
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        """
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (minutes in range, sids) with a dtype of float64, containing the
+            values for the respective field over start and end dt range.
+        """
+        start_idx = self._find_position_of_minute(start_dt)
+        end_idx = self._find_position_of_minute(end_dt)
+
+        positions = np.arange(start_idx, end_idx + 1)
+        indices_to_exclude = self._exclusion_indices_for_range(
+            start_idx, end_idx)
+        if indices_to_exclude is not None:
+            keep = np.ones(len(positions), dtype=bool)
+            for excl_start, excl_stop in indices_to_exclude:
+                keep[max(excl_start - start_idx, 0):
+                     excl_stop - start_idx + 1] = False
+            positions = positions[keep]
+
+        sids = list(sids)
+        rows = np.array([self._row_for_sid(sid) for sid in sids], dtype=int)
+        written = np.flatnonzero(rows != -1)
+        rows = rows[written]
+        ratios = np.array([
+            self._ohlc_ratio_inverse_for_sid(sids[i]) for i in written
+        ])
+
+        shape = len(positions), len(sids)
+        results = []
+        for field in fields:
+            # Minutes after the last one written for a sid are zero.
+            values = self._fields[field][rows[:, np.newaxis], positions].T
+            if field != 'volume':
+                out = np.full(shape, np.nan)
+                where = values != 0
+                out[:, written] = np.where(where, values * ratios, np.nan)
+            else:
+                out = np.zeros(shape, dtype=np.uint32)
+                out[:, written] = values
             results.append(out)
         return results
+
+
+def _read_consolidated_index(rootdir):
+    path = join(rootdir, 'index')
+    if not os.path.exists(path):
+        return np.empty((0, 2), dtype=CONSOLIDATED_INDEX_DTYPE)
+    return np.fromfile(path, dtype=CONSOLIDATED_INDEX_DTYPE).reshape(-1, 2)
@@ -639,6 +639,9 @@ class ReindexMinuteBarReader(ReindexBarReader, MinuteBarReader):
     See: ``ReindexBarReader``
     """
 
+    def get_values(self, sids, dt, field):
+        return self._reader.get_values(sids, dt, field)
+
     def _outer_dts(self, start_dt, end_dt):
         return self._trading_calendar.minutes_in_range(start_dt, end_dt)
 
@@ -15,6 +15,7 @@ from errno import ENOENT
 from functools import partial
 from os import remove
 import sqlite3
+from threading import local
 import warnings
 
 from bcolz import (
@@ -1214,6 +1215,40 @@ StockDividend = namedtuple(
     ['asset', 'payment_asset', 'ratio', 'pay_date'])
 
 
+ADJUSTMENT_INDEX_DTYPE = np.dtype([
+    ('sid', 'i8'),
+    ('effective_date', 'i8'),
+    ('ratio', 'f8'),
+])
+
+
+class _SidAdjustmentIndex(object):
+    """
+    The rows of an adjustments table sorted by sid, with the offset of each
+    sid's first row, so that the rows for a sid are a slice.
+
+    Parameters
+    ----------
+    rows : np.ndarray[ADJUSTMENT_INDEX_DTYPE]
+        The rows of the table, sorted by sid.
+    """
+    def __init__(self, rows):
+        self._sids, starts = np.unique(rows['sid'], return_index=True)
+        self._offsets = np.append(starts, len(rows))
+        self._effective_dates = rows['effective_date']
+        self._ratios = rows['ratio']
+
+    def get(self, sid):
+        """
+        The effective dates, in seconds, and ratios of the rows for ``sid``.
+        """
+        i = self._sids.searchsorted(sid)
+        if i == len(self._sids) or self._sids[i] != sid:
+            return self._effective_dates[:0], self._ratios[:0]
+        start, stop = self._offsets[i], self._offsets[i + 1]
+        return self._effective_dates[start:stop], self._ratios[start:stop]
+
+
 class SQLiteAdjustmentReader(object):
     """
     Loads adjustments based on corporate actions from a SQLite database.
@@ -1224,6 +1259,21 @@ class SQLiteAdjustmentReader(object):
     ----------
     conn : str or sqlite3.Connection
         Connection from which to load data.
+    in_memory : bool, optional
+        Whether to read each of the splits, mergers and dividends tables into
+        memory the first time ``get_adjustments_for_sid`` or
+        ``get_adjustments_for_sids`` needs it, instead of querying the
+        database for every lookup. The rows are sorted by sid and indexed by
+        the offset of each sid's first row. The database must not be written
+        to after a table has been read.
+
+    Notes
+    -----
+    sqlite3 connections may only be used by the thread that created them, so
+    ``load_adjustments`` opens a separate connection to the same file when it
+    is called from another thread, e.g. while pipeline results are prefetched
+    in the background. In-memory databases can only be read from the thread
+    that created ``conn``.
 
     See Also
     --------
@@ -1231,18 +1281,44 @@ class SQLiteAdjustmentReader(object):
     """
 
     @preprocess(conn=coerce_string_to_conn)
-    def __init__(self, conn):
+    def __init__(self, conn, in_memory=False):
         self.conn = conn
+        self._in_memory = in_memory
+        self._sid_indices = {}
+        # The file backing the main database, or '' if it is in memory.
+        self._path = conn.execute('PRAGMA database_list').fetchone()[2]
+        self._thread_conns = local()
+        self._thread_conns.conn = conn
+
+    def _thread_conn(self):
+        """
+        Get a connection to the database which can be used by the current
+        thread.
+        """
+        try:
+            return self._thread_conns.conn
+        except AttributeError:
+            pass
+        if not self._path:
+            return self.conn
+        conn = self._thread_conns.conn = sqlite3.connect(self._path)
+        return conn
 
     def load_adjustments(self, columns, dates, assets):
         return load_adjustments_from_sqlite(
-            self.conn,
+            self._thread_conn(),
             list(columns),
             dates,
             assets,
         )
 
     def get_adjustments_for_sid(self, table_name, sid):
+        if self._in_memory:
+            effective_dates, ratios = self._sid_index(table_name).get(sid)
+            return [[Timestamp(effective_date, unit='s', tz='UTC'), ratio]
+                    for effective_date, ratio in
+                    zip(effective_dates.tolist(), ratios.tolist())]
+
         t = (sid,)
         c = self.conn.cursor()
         adjustments_for_sid = c.execute(
@@ -1254,6 +1330,73 @@ class SQLiteAdjustmentReader(object):
                 for adjustment in
                 adjustments_for_sid]
 
+    def get_adjustments_for_sids(self, table_name, sids):
+        """
+        Get the adjustments in ``table_name`` for each of ``sids`` as arrays.
+
+        Parameters
+        ----------
+        table_name : {'splits', 'mergers', 'dividends'}
+            The table to read.
+        sids : iterable[int]
+            The sids to look up.
+
+        Returns
+        -------
+        adjustments : dict[int -> (pd.DatetimeIndex, np.ndarray[float64])]
+            Map from sid to the effective dates and ratios of its
+            adjustments, in the order ``get_adjustments_for_sid`` returns
+            them.  Sids without adjustments map to empty arrays.
+        """
+        sids = [int(sid) for sid in sids]
+        if self._in_memory:
+            index = self._sid_index(table_name)
+        else:
+            rows = []
+            c = self.conn.cursor()
+            # Query in sid order so that the chunks' rows stay sorted by sid.
+            for chunk in group_into_chunks(sorted(set(sids))):
+                rows.extend(c.execute(
+                    "SELECT sid, effective_date, ratio FROM %s "
+                    "WHERE sid IN (%s) ORDER BY sid, rowid" % (
+                        table_name,
+                        ",".join('?' for _ in chunk),
+                    ),
+                    chunk,
+                ).fetchall())
+            c.close()
+            index = _SidAdjustmentIndex(
+                np.array(rows, dtype=ADJUSTMENT_INDEX_DTYPE),
+            )
+
+        out = {}
+        for sid in sids:
+            effective_dates, ratios = index.get(sid)
+            out[sid] = (
+                DatetimeIndex(effective_dates * int(1e9), tz='UTC'),
+                ratios,
+            )
+        return out
+
+    def _sid_index(self, table_name):
+        try:
+            return self._sid_indices[table_name]
+        except KeyError:
+            pass
+
+        c = self.conn.cursor()
+        # Rows for the same sid are kept in the order the per-sid query
+        # returns them.
+        rows = c.execute(
+            "SELECT sid, effective_date, ratio FROM %s "
+            "ORDER BY sid, rowid" % table_name).fetchall()
+        c.close()
+
+        index = self._sid_indices[table_name] = _SidAdjustmentIndex(
+            np.array(rows, dtype=ADJUSTMENT_INDEX_DTYPE),
+        )
+        return index
+
     def get_dividends_with_ex_date(self, assets, date, asset_finder):
         seconds = date.value / int(1e9)
         c = self.conn.cursor()
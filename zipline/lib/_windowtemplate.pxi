@@ -28,12 +28,17 @@ cdef class AdjustedArrayWindow:
 
     The arrays yielded by this iterator are always views over the underlying
     data.
+
+    The ``adjusted`` attribute is True if any adjustments were applied while
+    producing the most recently yielded window.  When it is False, every row
+    the new window shares with the previous one is unchanged.
     """
     cdef:
         # ctype must be defined by the file into which this is being copied.
         readonly databuffer data
         readonly dict view_kwargs
         readonly Py_ssize_t window_length
+        readonly bint adjusted
         Py_ssize_t anchor, next_anchor, max_anchor, next_adj
         dict adjustments
         list adjustment_indices
@@ -57,6 +62,7 @@ cdef class AdjustedArrayWindow:
 
         self.next_adj = self.pop_next_adj()
         self.last_out = None
+        self.adjusted = False
 
     cdef pop_next_adj(self):
         """
@@ -84,7 +90,9 @@ cdef class AdjustedArrayWindow:
         # Apply any adjustments that occured before our current anchor.
         # Equivalently, apply any adjustments known **on or before** the date
         # for which we're calculating a window.
+        self.adjusted = False
         while self.next_adj < anchor:
+            self.adjusted = True
 
             for adjustment in self.adjustments[self.next_adj]:
                 adjustment.mutate(self.data)
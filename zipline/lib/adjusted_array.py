@@ -20,6 +20,7 @@ from zipline.errors import (
 from zipline.lib.labelarray import LabelArray
 from zipline.utils.numpy_utils import (
     datetime64ns_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     uint8_dtype,
@@ -27,6 +28,7 @@ from zipline.utils.numpy_utils import (
 from zipline.utils.memoize import lazyval
 
 # These class names are all the same because of our bootleg templating system.
+from ._float32window import AdjustedArrayWindow as Float32Window
 from ._float64window import AdjustedArrayWindow as Float64Window
 from ._int64window import AdjustedArrayWindow as Int64Window
 from ._labelwindow import AdjustedArrayWindow as LabelWindow
@@ -74,19 +76,21 @@ def is_categorical(dtype):
 
 
 CONCRETE_WINDOW_TYPES = {
+    float32_dtype: Float32Window,
     float64_dtype: Float64Window,
     int64_dtype: Int64Window,
     uint8_dtype: UInt8Window,
 }
 
 
-def _normalize_array(data, missing_value):
+def _normalize_array(data, missing_value, copy=True, column_dtype=None):
     """
     Coerce buffer data for an AdjustedArray into a standard scalar
     representation, returning the coerced array and a dict of argument to pass
     to np.view to use when providing a user-facing view of the underlying data.
 
-    - float* data is coerced to float64 with viewtype float64.
+    - float* data is coerced to ``column_dtype`` if it is float32 or float64,
+      and to float64 otherwise, with the same viewtype.
     - int32, int64, and uint32 are converted to int64 with viewtype int64.
     - datetime[*] data is coerced to int64 with a viewtype of datetime64[ns].
     - bool_ data is coerced to uint8 with a viewtype of bool_.
@@ -94,6 +98,11 @@ def _normalize_array(data, missing_value):
     Parameters
     ----------
     data : np.ndarray
+    missing_value : object
+    copy : bool, optional
+        Whether to copy ``data`` when it is already in its coerced form.
+    column_dtype : np.dtype, optional
+        The declared dtype of the column held by the array.
 
     Returns
     -------
@@ -106,9 +115,11 @@ def _normalize_array(data, missing_value):
     if data_dtype == bool_:
         return data.astype(uint8), {'dtype': dtype(bool_)}
     elif data_dtype in FLOAT_DTYPES:
-        return data.astype(float64), {'dtype': dtype(float64)}
+        if column_dtype is None or column_dtype not in FLOAT_DTYPES:
+            column_dtype = float64_dtype
+        return data.astype(column_dtype, copy=copy), {'dtype': column_dtype}
     elif data_dtype in INT_DTYPES:
-        return data.astype(int64), {'dtype': dtype(int64)}
+        return data.astype(int64, copy=copy), {'dtype': dtype(int64)}
     elif is_categorical(data_dtype):
         if not isinstance(missing_value, LabelArray.SUPPORTED_SCALAR_TYPES):
             raise TypeError(
@@ -152,6 +163,14 @@ class AdjustedArray(object):
     missing_value : object
         A value to use to fill missing data in yielded windows.
         Should be a value coercible to `data.dtype`.
+    copy : bool, optional
+        Whether to copy ``data``.  If False, ``data`` is used as our buffer
+        when it already has a supported dtype, and locations where ``mask`` is
+        False are filled with ``missing_value`` in place.  Default is True.
+    dtype : np.dtype, optional
+        The declared dtype of the column held by this array.  Floating point
+        data is stored as float32 only if this is float32, and as float64
+        otherwise, regardless of the dtype of ``data``.
     """
     __slots__ = (
         '_data',
@@ -161,8 +180,19 @@ class AdjustedArray(object):
         '__weakref__',
     )
 
-    def __init__(self, data, mask, adjustments, missing_value):
-        self._data, self._view_kwargs = _normalize_array(data, missing_value)
+    def __init__(self,
+                 data,
+                 mask,
+                 adjustments,
+                 missing_value,
+                 copy=True,
+                 dtype=None):
+        self._data, self._view_kwargs = _normalize_array(
+            data,
+            missing_value,
+            copy,
+            dtype,
+        )
 
         self.adjustments = adjustments
         self.missing_value = missing_value
@@ -243,12 +273,14 @@ class AdjustedArray(object):
         )
 
 
-def ensure_adjusted_array(ndarray_or_adjusted_array, missing_value):
+def ensure_adjusted_array(ndarray_or_adjusted_array,
+                          missing_value,
+                          dtype=None):
     if isinstance(ndarray_or_adjusted_array, AdjustedArray):
         return ndarray_or_adjusted_array
     elif isinstance(ndarray_or_adjusted_array, ndarray):
         return AdjustedArray(
-            ndarray_or_adjusted_array, NOMASK, {}, missing_value,
+            ndarray_or_adjusted_array, NOMASK, {}, missing_value, dtype=dtype,
         )
     else:
         raise TypeError(
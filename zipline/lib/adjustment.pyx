@@ -1,5 +1,6 @@
 # cython: embedsignature=True
 from cpython cimport Py_EQ
+from cython cimport floating
 
 from pandas import isnull, Timestamp
 from numpy cimport float64_t, uint8_t, int64_t
@@ -250,7 +251,10 @@ cdef class Adjustment:
 
 cdef class Float64Adjustment(Adjustment):
     """
-    Base class for adjustments that operate on Float64 data.
+    Base class for adjustments that operate on floating point data.
+
+    Adjustments hold a float64 value, but they can be applied to either
+    float32 or float64 arrays.
     """
     cdef:
         readonly float64_t value
@@ -314,9 +318,9 @@ cdef class Float64Multiply(Float64Adjustment):
            [  6.,  28.,  32.]])
     """
 
-    cpdef mutate(self, float64_t[:, :] data):
+    cpdef mutate(self, floating[:, :] data):
         cdef Py_ssize_t row, col
-        cdef float64_t value = self.value
+        cdef floating value = self.value
 
         # last_col + 1 because last_col should also be affected.
         for col in range(self.first_col, self.last_col + 1):
@@ -353,9 +357,9 @@ cdef class Float64Overwrite(Float64Adjustment):
            [ 6.,  0.,  0.]])
     """
 
-    cpdef mutate(self, float64_t[:, :] data):
+    cpdef mutate(self, floating[:, :] data):
         cdef Py_ssize_t row, col
-        cdef float64_t value = self.value
+        cdef floating value = self.value
 
         # last_col + 1 because last_col should also be affected.
         for col in range(self.first_col, self.last_col + 1):
@@ -392,9 +396,9 @@ cdef class Float64Add(Float64Adjustment):
            [ 6.,  8.,  9.]])
     """
 
-    cpdef mutate(self, float64_t[:, :] data):
+    cpdef mutate(self, floating[:, :] data):
         cdef Py_ssize_t row, col
-        cdef float64_t value = self.value
+        cdef floating value = self.value
 
         # last_col + 1 because last_col should also be affected.
         for col in range(self.first_col, self.last_col + 1):
@@ -1,5 +1,7 @@
 import numpy as np
 
+from zipline.lib.rank import rowwise_smallest_n
+
 
 def naive_grouped_rowwise_apply(data,
                                 group_labels,
@@ -49,3 +51,351 @@ def naive_grouped_rowwise_apply(data,
             locs = (label_row == label)
             out_row[locs] = func(row[locs], *func_args)
     return out
+
+
+def _row_group_codes(group_labels):
+    """
+    Convert ``group_labels`` into small non-negative integer codes.
+
+    Returns
+    -------
+    codes : ndarray[ndim=2, dtype=int64]
+        An array of the same shape as ``group_labels`` in which equal labels
+        have equal codes.
+    ngroups : int
+        One more than the largest code.
+    """
+    ncols = group_labels.shape[1]
+    if not group_labels.size:
+        return group_labels.astype(np.int64), 0
+
+    low, high = group_labels.min(), group_labels.max()
+    if int(high) - int(low) < ncols:
+        # OPTIMIZATION: Labels are usually small, densely-packed codes, so
+        # they can be used as offsets directly without sorting.
+        return (group_labels - low).astype(np.int64), int(high) - int(low) + 1
+
+    _, codes = np.unique(group_labels, return_inverse=True)
+    return codes.reshape(group_labels.shape), int(codes.max()) + 1
+
+
+def _row_group_segments(group_labels):
+    """
+    Assign a segment number to each (row, label) pair in ``group_labels``.
+
+    Returns
+    -------
+    segments : ndarray[ndim=1, dtype=int64]
+        The segment of each entry of ``group_labels.ravel()``.
+    nsegments : int
+        An upper bound on the values in ``segments``, suitable for use as
+        ``minlength`` in ``np.bincount``.
+    """
+    nrows, ncols = group_labels.shape
+    codes, ngroups = _row_group_codes(group_labels)
+    segments = (codes + (np.arange(nrows) * ngroups)[:, np.newaxis]).ravel()
+    if ngroups > ncols:
+        # Renumber so that the number of segments is bounded by the size of
+        # the data rather than by nrows * ngroups.
+        _, segments = np.unique(segments, return_inverse=True)
+        return segments, int(segments.max()) + 1
+    return segments, nrows * ngroups
+
+
+def _segment_nanmean(values, segments, nsegments):
+    """
+    Compute the mean of the non-nan entries of ``values`` in each segment.
+    """
+    isnan = np.isnan(values)
+    sums = np.bincount(
+        segments,
+        weights=np.where(isnan, 0.0, values),
+        minlength=nsegments,
+    )
+    counts = np.bincount(segments[~isnan], minlength=nsegments)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return sums / counts, counts
+
+
+def grouped_rowwise_demean(data, group_labels, out=None):
+    """
+    Vectorized equivalent of::
+
+        naive_grouped_rowwise_apply(
+            data,
+            group_labels,
+            lambda row: row - nanmean(row),
+        )
+
+    Parameters
+    ----------
+    data : ndarray[ndim=2, dtype=float64]
+        Input array to demean.
+    group_labels : ndarray[ndim=2, dtype=int64]
+        Labels to use to bucket inputs from array.
+        Should be the same shape as array.
+    out : ndarray, optional
+        Array into which to write output.
+
+    Example
+    -------
+    >>> data = np.array([[1., 2., 3.],
+    ...                  [2., 3., 4.],
+    ...                  [5., 6., np.nan]])
+    >>> labels = np.array([[0, 0, 1],
+    ...                    [0, 1, 0],
+    ...                    [1, 0, 1]])
+    >>> grouped_rowwise_demean(data, labels)
+    array([[-0.5,  0.5,  0. ],
+           [-1. ,  0. ,  1. ],
+           [ 0. ,  0. ,  nan]])
+    """
+    if out is None:
+        out = np.empty_like(data)
+
+    segments, nsegments = _row_group_segments(group_labels)
+    values = data.ravel()
+    means, _ = _segment_nanmean(values, segments, nsegments)
+    out[...] = (values - means[segments]).reshape(data.shape)
+    return out
+
+
+def grouped_rowwise_zscore(data, group_labels, out=None):
+    """
+    Vectorized equivalent of::
+
+        naive_grouped_rowwise_apply(
+            data,
+            group_labels,
+            lambda row: (row - nanmean(row)) / nanstd(row),
+        )
+
+    Parameters
+    ----------
+    data : ndarray[ndim=2, dtype=float64]
+        Input array to normalize.
+    group_labels : ndarray[ndim=2, dtype=int64]
+        Labels to use to bucket inputs from array.
+        Should be the same shape as array.
+    out : ndarray, optional
+        Array into which to write output.
+    """
+    if out is None:
+        out = np.empty_like(data)
+
+    segments, nsegments = _row_group_segments(group_labels)
+    values = data.ravel()
+    means, counts = _segment_nanmean(values, segments, nsegments)
+    centered = values - means[segments]
+    sums_of_squares = np.bincount(
+        segments,
+        weights=np.where(np.isnan(centered), 0.0, centered * centered),
+        minlength=nsegments,
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stds = np.sqrt(sums_of_squares / counts)
+        out[...] = (centered / stds[segments]).reshape(data.shape)
+    return out
+
+
+_RANK_METHODS = frozenset(['average', 'min', 'max', 'dense', 'ordinal'])
+
+
+def grouped_rowwise_rank(data, group_labels, method, ascending=True, out=None):
+    """
+    Vectorized equivalent of::
+
+        naive_grouped_rowwise_apply(
+            data,
+            group_labels,
+            scipy.stats.rankdata,
+            (method,),
+        )
+
+    or, if ``ascending`` is False, of the same call with
+    ``zipline.lib.rank.rankdata_1d_descending``.
+
+    Parameters
+    ----------
+    data : ndarray[ndim=2]
+        Input array to rank.
+    group_labels : ndarray[ndim=2, dtype=int64]
+        Labels to use to bucket inputs from array.
+        Should be the same shape as array.
+    method : {'average', 'min', 'max', 'dense', 'ordinal'}
+        The method used to assign ranks to tied elements.
+    ascending : bool, optional
+        Whether to rank in ascending or descending order.
+    out : ndarray, optional
+        Array into which to write output.
+
+    Notes
+    -----
+    As with ``scipy.stats.rankdata``, NaNs are ranked after all other values
+    in their group, and are never considered to be tied.
+    """
+    if method not in _RANK_METHODS:
+        raise ValueError('unknown method "%s"' % method)
+    if out is None:
+        out = np.empty(data.shape, dtype=np.float64)
+    if not data.size:
+        return out
+
+    nrows, ncols = data.shape
+    codes, ngroups = _row_group_codes(group_labels)
+    if data.dtype == np.float32:
+        data = data.astype(np.float64)
+    if not ascending:
+        data = -(data.view(np.float64))
+
+    # Sort each row by value, then stably by group code, so that each group
+    # is contiguous and sorted by value.  Both sorts are stable, so ties are
+    # ordered by position, matching the mergesort used by rankdata.
+    row_starts = (np.arange(nrows) * ncols)[:, np.newaxis]
+    by_value = np.argsort(data, axis=1, kind='mergesort') + row_starts
+    by_value = by_value.ravel()
+    if ngroups <= np.iinfo(np.uint16).max:
+        codes = codes.astype(np.uint16)
+    sorted_codes = codes.ravel()[by_value].reshape(nrows, ncols)
+    by_code = np.argsort(sorted_codes, axis=1, kind='mergesort') + row_starts
+    order = by_value[by_code.ravel()]
+
+    sorted_codes = codes.ravel()[order]
+    sorted_values = data.ravel()[order]
+
+    positions = np.arange(data.size)
+    new_segment = np.empty(data.size, dtype=bool)
+    new_segment[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    new_segment[::ncols] = True
+    segment_starts = np.maximum.accumulate(
+        np.where(new_segment, positions, 0),
+    )
+
+    if method == 'ordinal':
+        ranks = positions - segment_starts + 1
+    else:
+        # A new block of tied values starts wherever the segment or the value
+        # changes.  NaN != NaN, so every NaN starts its own block.
+        new_block = new_segment.copy()
+        new_block[1:] |= sorted_values[1:] != sorted_values[:-1]
+        if method == 'dense':
+            block_numbers = np.cumsum(new_block)
+            ranks = block_numbers - block_numbers[segment_starts] + 1
+        else:
+            block_starts = np.maximum.accumulate(
+                np.where(new_block, positions, 0),
+            )
+            block_ids = np.cumsum(new_block) - 1
+            block_ends = np.append(
+                np.flatnonzero(new_block)[1:],
+                data.size,
+            )[block_ids] - 1
+            if method == 'min':
+                ranks = block_starts - segment_starts + 1
+            elif method == 'max':
+                ranks = block_ends - segment_starts + 1
+            else:
+                ranks = (block_starts + block_ends) / 2.0 - segment_starts + 1
+
+    result = np.empty(data.size, dtype=np.float64)
+    result[order] = ranks
+    out[...] = result.reshape(data.shape)
+    return out
+
+
+# The largest amount of padding, relative to the number of selected entries,
+# that grouped_rowwise_top_n will allocate before falling back to sorting.
+_MAX_TOP_N_PADDING = 4
+
+
+def grouped_rowwise_top_n(data, group_labels, n, ascending=True, mask=None):
+    """
+    Compute a mask of the entries in each row of ``data`` whose ordinal rank
+    within their group is at most ``n``.
+
+    Equivalent to::
+
+        grouped_rowwise_rank(
+            data, group_labels, 'ordinal', ascending,
+        ) <= n
+
+    but each (row, group) pair is partitioned around its ``n``th value rather
+    than sorted.
+
+    Parameters
+    ----------
+    data : ndarray[ndim=2]
+        Input array to select from.
+    group_labels : ndarray[ndim=2, dtype=int64]
+        Labels to use to bucket inputs from array.
+        Should be the same shape as array.
+    n : int
+        The number of entries to select from each group in each row.
+    ascending : bool, optional
+        Whether to select the smallest or the largest entries.
+    mask : ndarray[ndim=2, dtype=bool], optional
+        Entries to consider.  Entries for which ``mask`` is False are never
+        selected, and don't count towards any group.
+
+    Notes
+    -----
+    Each (row, group) pair is laid out as a row of a NaN-padded array so that
+    all of them can be partitioned at once.  If one group is much larger than
+    the others that array would be mostly padding, so we fall back to
+    ``grouped_rowwise_rank``.
+    """
+    if mask is None:
+        mask = np.ones(data.shape, dtype=bool)
+
+    out = np.zeros(data.shape, dtype=bool)
+    if not mask.any():
+        return out
+
+    if data.dtype == np.float32:
+        data = data.astype(np.float64)
+    if not ascending:
+        data = -(data.view(np.float64))
+    elif data.dtype.kind == 'M':
+        data = data.view(np.int64)
+
+    segments, nsegments = _row_group_segments(group_labels)
+    selected = mask.ravel()
+    segments = segments[selected]
+    values = data.ravel()[selected]
+
+    # Renumber the segments which contain selected entries, and find the
+    # position of each entry within its segment.  The sort is stable, so
+    # positions follow column order.
+    counts = np.bincount(segments, minlength=nsegments)
+    nonempty = counts > 0
+    segments = (np.cumsum(nonempty) - 1)[segments]
+    counts = counts[nonempty]
+    width = counts.max()
+
+    if len(counts) * width > _MAX_TOP_N_PADDING * len(values):
+        ranks = grouped_rowwise_rank(
+            np.where(mask, data, data.dtype.type(0)),
+            np.where(mask, group_labels, group_labels.min() - 1),
+            'ordinal',
+        )
+        return mask & (ranks <= n)
+
+    order = np.argsort(segments, kind='mergesort')
+    sorted_segments = segments[order]
+    positions = (
+        np.arange(len(values)) - (np.cumsum(counts) - counts)[sorted_segments]
+    )
+
+    # Padding is placed after the real entries of each segment, so it's never
+    # selected ahead of them, even when they're NaN.
+    if values.dtype.kind == 'f':
+        fill = np.nan
+    else:
+        fill = np.iinfo(values.dtype).max
+    padded = np.full((len(counts), width), fill, dtype=values.dtype)
+    padded[sorted_segments, positions] = values[order]
+
+    found = np.empty(len(values), dtype=bool)
+    found[order] = rowwise_smallest_n(padded, n)[sorted_segments, positions]
+    out.ravel()[selected] = found
+    return out
@@ -14,7 +14,16 @@ from numpy cimport (
     PyArray_DIMS,
     PyArray_EMPTY,
 )
-from numpy import apply_along_axis, float64, isnan, nan
+from numpy import (
+    apply_along_axis,
+    bool_,
+    float64,
+    isnan,
+    nan,
+    ones,
+    partition,
+    zeros,
+)
 from scipy.stats import rankdata
 
 from zipline.utils.numpy_utils import (
@@ -41,6 +50,8 @@ def rankdata_1d_descending(ndarray data, str method):
     """
     1D descending version of scipy.stats.rankdata.
     """
+    if data.dtype.name == 'float32':
+        data = data.astype(float64)
     return rankdata(-(data.view(float64)), method=method)
 
 
@@ -50,21 +61,16 @@ def masked_rankdata_2d(ndarray data,
                        str method,
                        bool ascending):
     """
-    Compute masked rankdata on data on float64, int64, or datetime64 data.
+    Compute masked rankdata on data on float32, float64, int64, or datetime64
+    data.
     """
-    cdef str dtype_name = data.dtype.name
-    if dtype_name not in ('float64', 'int64', 'datetime64[ns]'):
-        raise TypeError(
-            "Can't compute rankdata on array of dtype %r." % dtype_name
-        )
-
-    cdef ndarray missing_locations = (~mask | is_missing(data, missing_value))
-
-    # Interpret the bytes of integral data as floats for sorting.
-    data = data.copy().view(float64)
-    data[missing_locations] = nan
-    if not ascending:
-        data = -data
+    cdef ndarray missing_locations
+    data, missing_locations = _prepare_masked_rank_data(
+        data,
+        mask,
+        missing_value,
+        ascending,
+    )
 
     # OPTIMIZATION: Fast path the default case with our own specialized
     # Cython implementation.
@@ -87,6 +93,107 @@ def masked_rankdata_2d(ndarray data,
     return result
 
 
+def masked_top_n_2d(ndarray data,
+                    ndarray mask,
+                    object missing_value,
+                    object n,
+                    bool ascending):
+    """
+    Compute a mask of the entries in each row of ``data`` whose ordinal rank
+    is at most ``n``.
+
+    Equivalent to::
+
+        masked_rankdata_2d(
+            data, mask, missing_value, 'ordinal', ascending,
+        ) <= n
+
+    but uses ``rowwise_smallest_n`` rather than sorting each row.
+    """
+    cdef ndarray missing_locations
+    data, missing_locations = _prepare_masked_rank_data(
+        data,
+        mask,
+        missing_value,
+        ascending,
+    )
+    return rowwise_smallest_n(data, n) & ~missing_locations
+
+
+def _prepare_masked_rank_data(ndarray data,
+                              ndarray mask,
+                              object missing_value,
+                              bool ascending):
+    """
+    Build the float64 array sorted by masked_rankdata_2d and masked_top_n_2d,
+    along with the locations of its missing values.
+    """
+    cdef str dtype_name = data.dtype.name
+    if dtype_name not in ('float32', 'float64', 'int64', 'datetime64[ns]'):
+        raise TypeError(
+            "Can't compute rankdata on array of dtype %r." % dtype_name
+        )
+
+    cdef ndarray missing_locations = (~mask | is_missing(data, missing_value))
+
+    if dtype_name == 'float32':
+        # Widen float32 data so that it has the same itemsize as the others.
+        data = data.astype(float64)
+    else:
+        # Interpret the bytes of integral data as floats for sorting.
+        data = data.copy().view(float64)
+    data[missing_locations] = nan
+    if not ascending:
+        data = -data
+    return data, missing_locations
+
+
+def rowwise_smallest_n(ndarray data, object n):
+    """
+    Compute a mask of the entries in each row of ``data`` whose ordinal rank
+    is at most ``n``.
+
+    Equivalent to ``rankdata_2d_ordinal(data) <= n``: NaNs are ranked after
+    all other values, and ties are broken by column position.  Rather than
+    sorting each row, this partitions each row around its ``n``th smallest
+    value, which is O(ncols) instead of O(ncols * log(ncols)).
+
+    Parameters
+    ----------
+    data : np.ndarray[ndim=2]
+        The values to select from.
+    n : int
+        The number of entries to select from each row.
+
+    Returns
+    -------
+    selected : np.ndarray[bool, ndim=2]
+        A mask of the same shape as ``data``.
+    """
+    cdef Py_ssize_t nrows = data.shape[0], ncols = data.shape[1], kth
+
+    if n < 1 or ncols == 0:
+        return zeros((nrows, ncols), dtype=bool_)
+    if n >= ncols:
+        return ones((nrows, ncols), dtype=bool_)
+
+    kth = int(n) - 1
+    thresholds = partition(data, kth, axis=1)[:, kth:kth + 1]
+
+    # The threshold is NaN if the row has fewer than n non-NaN values.  NaNs
+    # sort after everything else and tie with each other.
+    nan_thresholds = isnan(thresholds)
+    nans = isnan(data)
+    below = (data < thresholds) | (nan_thresholds & ~nans)
+
+    # Every entry equal to the threshold is tied for the last selected places,
+    # and the sort used by rankdata_2d_ordinal is stable, so take as many of
+    # them as fit in column order.
+    ties = (data == thresholds) | (nan_thresholds & nans)
+    remaining = (kth + 1) - below.sum(axis=1, keepdims=True)
+    return below | (ties & (ties.cumsum(axis=1) <= remaining))
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.embedsignature(True)
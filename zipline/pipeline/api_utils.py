@@ -15,8 +15,8 @@ def restrict_to_dtype(dtype, message_template):
 
     Parameters
     ----------
-    dtype : numpy.dtype
-        The dtype on which the decorated method may be called.
+    dtype : numpy.dtype or tuple[numpy.dtype]
+        The dtype, or dtypes, on which the decorated method may be called.
     message_template : str
         A template for the error message to be raised.
         `message_template.format` will be called with keyword arguments
@@ -35,13 +35,16 @@ def restrict_to_dtype(dtype, message_template):
     def some_factor_method(self, ...):
         self.stuff_that_requires_being_float64(...)
     """
+    dtypes = dtype if isinstance(dtype, tuple) else (dtype,)
+    expected_dtype = ' or '.join(d.name for d in dtypes)
+
     def processor(term_method, _, term_instance):
         term_dtype = term_instance.dtype
-        if term_dtype != dtype:
+        if term_dtype not in dtypes:
             raise TypeError(
                 message_template.format(
                     method_name=term_method.__name__,
-                    expected_dtype=dtype.name,
+                    expected_dtype=expected_dtype,
                     received_dtype=term_dtype,
                 )
             )
@@ -0,0 +1,301 @@
+"""
+Disk-backed caching of computed Pipeline terms.
+"""
+import errno
+from hashlib import sha1
+import os
+from tempfile import mkdtemp, NamedTemporaryFile
+from threading import Lock
+from shutil import move
+from types import CodeType, FunctionType
+from weakref import WeakKeyDictionary
+
+from numpy import dtype as dtype_class, int64, load, ndarray, save
+from six import iteritems, string_types
+
+from zipline._version import get_versions
+from zipline.assets import Asset
+from zipline.utils.paths import ensure_directory
+
+from .term import Term
+
+
+class TermCache(object):
+    """A size-bounded, disk-backed cache of computed pipeline terms.
+
+    Entries are keyed by the identity of the term (its class, params, inputs,
+    window_length and mask, recursively), the dates it was computed for and
+    the assets it was computed over.  Each entry is stored as a ``.npy`` file
+    which is memory-mapped when read, so cached terms are paged in lazily.
+
+    Parameters
+    ----------
+    path : str, optional
+        The directory in which to store cached terms.  If not provided, a new
+        temporary directory is used.
+    max_bytes : int, optional
+        The maximum number of bytes of term data to keep on disk.  When this
+        is exceeded, the least recently used entries are removed.
+
+    Notes
+    -----
+    The cache does not know about the data backing the loaders used to
+    compute a term.  It must be cleared (or a new ``path`` used) when that
+    data changes, e.g. after ingesting a new bundle.
+
+    Only terms producing plain numeric, boolean or datetime arrays are cached.
+    Terms with parameters that can't be described the same way in every
+    process, such as objects using the default ``repr``, are never cached.
+    Terms whose class defines ``compute`` (or the incremental ``reset``,
+    ``update`` and ``emit`` methods) are keyed on the bytecode of those
+    methods, so editing a ``CustomFactor`` invalidates its entries.
+
+    ``get`` and ``set`` may be called from several threads at once, as they
+    are when the cache is given to an engine with a thread pool.
+
+    See Also
+    --------
+    :class:`zipline.pipeline.engine.SimplePipelineEngine`
+    """
+    def __init__(self, path=None, max_bytes=2 ** 32):
+        self.path = path if path is not None else mkdtemp()
+        self.max_bytes = max_bytes
+        self._version = get_versions()['version']
+        self._fingerprints = WeakKeyDictionary()
+        # Guards ``_fingerprints`` and ``_nbytes``.
+        self._lock = Lock()
+
+        ensure_directory(self.path)
+        # The number of bytes we think are on disk.  This is only refreshed
+        # from the directory when we need to evict entries.
+        self._nbytes = sum(size for _, size, _ in self._entries())
+
+    def _keypath(self, key):
+        return os.path.join(self.path, key + '.npy')
+
+    def _key(self, term, dates, assets):
+        """The key for ``term``, or None if ``term`` can't be cached.
+        """
+        try:
+            with self._lock:
+                fingerprint = _fingerprint(term, self._fingerprints)
+        except _UnstableFingerprint:
+            return None
+        key = sha1(self._version.encode('utf-8'))
+        key.update(fingerprint.encode('utf-8'))
+        key.update(dates.values.view(int64).tobytes())
+        key.update(assets.values.astype(int64).tobytes())
+        return key.hexdigest()
+
+    def get(self, term, dates, assets):
+        """Get the cached result of computing ``term``.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.Term
+            The term to look up.
+        dates : pd.DatetimeIndex
+            The dates for which ``term`` was computed.
+        assets : pd.Int64Index
+            The assets over which ``term`` was computed.
+
+        Returns
+        -------
+        result : np.memmap
+            A copy-on-write view of the cached result.
+
+        Raises
+        ------
+        KeyError
+            Raised if ``term`` is not in the cache for ``dates`` and
+            ``assets``.
+        """
+        key = self._key(term, dates, assets)
+        if key is None:
+            raise KeyError(term)
+
+        path = self._keypath(key)
+        try:
+            result = load(path, mmap_mode='c')
+        except IOError as e:
+            if e.errno != errno.ENOENT:
+                raise
+            raise KeyError(term)
+
+        # Mark the entry as recently used for eviction.
+        try:
+            os.utime(path, None)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+        return result
+
+    def set(self, term, dates, assets, result):
+        """Store the result of computing ``term``.
+
+        Results which cannot be memory-mapped (for example, the
+        ``LabelArray`` results of string classifiers), and results of terms
+        which can't be keyed consistently across processes, are not stored.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.Term
+            The term that was computed.
+        dates : pd.DatetimeIndex
+            The dates for which ``term`` was computed.
+        assets : pd.Int64Index
+            The assets over which ``term`` was computed.
+        result : np.ndarray
+            The result of computing ``term``.
+        """
+        if type(result) is not ndarray or result.dtype.kind not in 'biufM':
+            return
+
+        key = self._key(term, dates, assets)
+        if key is None:
+            return
+
+        path = self._keypath(key)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+            replaced = 0
+
+        with NamedTemporaryFile(
+            dir=self.path,
+            suffix='.tmp',
+            delete=False,
+        ) as f:
+            save(f, result)
+        with self._lock:
+            self._nbytes += os.path.getsize(f.name) - replaced
+            move(f.name, path)
+
+            if self._nbytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """List the (mtime, size, path) of each entry on disk.
+        """
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith('.npy'):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                # Another thread or process may have evicted this entry.
+                if e.errno != errno.ENOENT:
+                    raise
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        """Remove the least recently used entries until we are within
+        ``max_bytes``.  Must be called with ``_lock`` held.
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+            total -= size
+        self._nbytes = total
+
+    def clear(self):
+        """Remove all entries from the cache.
+        """
+        with self._lock:
+            for name in os.listdir(self.path):
+                os.remove(os.path.join(self.path, name))
+            self._nbytes = 0
+
+
+class _UnstableFingerprint(Exception):
+    """
+    Raised by ``_fingerprint`` for objects which can't be described the same
+    way in every process.
+    """
+
+
+def _fingerprint(obj, memo):
+    """
+    Build a string uniquely describing ``obj`` which is stable across
+    processes, raising ``_UnstableFingerprint`` if there is no such string.
+
+    Terms are described by the identity they were memoized under in
+    ``Term.__new__``, and the descriptions are cached in ``memo``.
+    """
+    if isinstance(obj, Term):
+        try:
+            out = memo[obj]
+        except KeyError:
+            try:
+                out = sha1(
+                    _fingerprint(obj._identity, memo).encode('utf-8'),
+                ).hexdigest()
+            except _UnstableFingerprint:
+                out = None
+            memo[obj] = out
+        if out is None:
+            raise _UnstableFingerprint(obj)
+        return out
+    if isinstance(obj, type):
+        parts = [obj.__module__, obj.__name__]
+        for name in ('compute', '_compute', 'reset', 'update', 'emit'):
+            method = getattr(obj, name, None)
+            # Unbound methods on Python 2 wrap the underlying function.
+            method = getattr(method, '__func__', method)
+            code = getattr(method, '__code__', None)
+            if code is not None:
+                parts.append(_code_fingerprint(code))
+        return 'type(%s)' % ','.join(parts)
+    if isinstance(obj, FunctionType):
+        return 'function(%s,%s,%s)' % (
+            obj.__module__,
+            obj.__name__,
+            _code_fingerprint(obj.__code__),
+        )
+    if isinstance(obj, (tuple, list)):
+        return '(%s)' % ','.join(_fingerprint(e, memo) for e in obj)
+    if isinstance(obj, dict):
+        return '{%s}' % ','.join(
+            sorted(
+                '%s:%s' % (_fingerprint(k, memo), _fingerprint(v, memo))
+                for k, v in iteritems(obj)
+            )
+        )
+    if isinstance(obj, dtype_class):
+        return 'dtype(%s)' % obj.str
+    if isinstance(obj, Asset):
+        return 'Asset(%d)' % obj.sid
+
+    out = repr(obj)
+    # The default repr, and the reprs of things like bound methods, include
+    # the address of the object, which changes between processes.
+    if type(obj).__repr__ is object.__repr__ or (
+            not isinstance(obj, string_types) and ' at 0x' in out):
+        raise _UnstableFingerprint(obj)
+    return out
+
+
+def _code_fingerprint(code):
+    """
+    Hash the bytecode and constants of a code object.
+    """
+    out = sha1(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            out.update(_code_fingerprint(const).encode('utf-8'))
+        else:
+            out.update(repr(const).encode('utf-8'))
+    return out.hexdigest()
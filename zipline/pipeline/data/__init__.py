@@ -1,4 +1,4 @@
-from .equity_pricing import USEquityPricing
+from .equity_pricing import USEquityPricing, USEquityPricingFloat32
 from .dataset import DataSet, Column, BoundColumn
 
 __all__ = [
@@ -6,4 +6,5 @@ __all__ = [
     'Column',
     'DataSet',
     'USEquityPricing',
+    'USEquityPricingFloat32',
 ]
@@ -1,7 +1,7 @@
 """
 Dataset representing OHLCV data.
 """
-from zipline.utils.numpy_utils import float64_dtype
+from zipline.utils.numpy_utils import float32_dtype, float64_dtype
 
 from .dataset import Column, DataSet
 
@@ -15,3 +15,23 @@ class USEquityPricing(DataSet):
     low = Column(float64_dtype)
     close = Column(float64_dtype)
     volume = Column(float64_dtype)
+
+
+class USEquityPricingFloat32(DataSet):
+    """
+    Dataset representing daily trading prices and volumes, loaded as float32.
+
+    This holds the same data as :class:`USEquityPricing`, but it uses half as
+    much memory.  Factors computed only from float32 inputs produce float32
+    outputs, so large pipelines built on these columns stay in float32.
+
+    Notes
+    -----
+    float32 has about 7 significant decimal digits, so volumes larger than
+    2 ** 24 are rounded.
+    """
+    open = Column(float32_dtype)
+    high = Column(float32_dtype)
+    low = Column(float32_dtype)
+    close = Column(float32_dtype)
+    volume = Column(float32_dtype)
@@ -5,27 +5,36 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from sys import exc_info
+from timeit import default_timer
 from uuid import uuid4
 
 from six import (
     iteritems,
+    itervalues,
+    reraise,
     with_metaclass,
 )
-from numpy import array
-from pandas import DataFrame, MultiIndex
+from six.moves.queue import Queue
+from numpy import arange, array, array_split
+from pandas import DataFrame, MultiIndex, concat
 from toolz import groupby, juxt
 from toolz.curried.operator import getitem
 
 from zipline.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
 from zipline.errors import NoFurtherDataError
+from zipline.utils.input_validation import expect_bounded
 from zipline.utils.numpy_utils import (
     as_column,
     repeat_first_axis,
     repeat_last_axis,
 )
 from zipline.utils.pandas_utils import explode
+from zipline.utils.pool import SequentialPool
 
-from .term import AssetExists, InputDates, LoadableTerm
+from .graph import ExecutionPlan
+from .optimize import eliminate_common_subexpressions
+from .term import AssetExists, ComputableTerm, InputDates, LoadableTerm
 
 
 class PipelineEngine(with_metaclass(ABCMeta)):
@@ -62,6 +71,33 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError("run_pipeline")
 
+    def run_pipelines(self, pipelines, start_date, end_date):
+        """
+        Compute values for several pipelines between `start_date` and
+        `end_date`.
+
+        The default implementation runs each pipeline separately.  Engines
+        may override this to share work between pipelines.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> zipline.pipeline.Pipeline]
+            The pipelines to run, keyed by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            The result of ``run_pipeline`` for each entry in `pipelines`.
+        """
+        return {
+            name: self.run_pipeline(pipeline, start_date, end_date)
+            for name, pipeline in iteritems(pipelines)
+        }
+
 
 class NoEngineRegistered(Exception):
     """
@@ -96,20 +132,87 @@ class SimplePipelineEngine(object):
     asset_finder : zipline.assets.AssetFinder
         An AssetFinder instance.  We depend on the AssetFinder to determine
         which assets are in the top-level universe at any point in time.
+    pool : multiprocessing.pool.ThreadPool, optional
+        A pool used to compute independent terms concurrently.  Each term is
+        submitted with ``apply_async`` as soon as all of its dependencies have
+        been computed.  Work is shared with the pool by reference, so it must
+        run in the same process as the engine.  If not supplied, terms are
+        computed one at a time in topological order.
+
+        Loaders, ``hooks`` and ``term_cache`` are called from the pool's
+        threads, possibly several at once, so they must be thread-safe.
+        :class:`~zipline.pipeline.cache.TermCache` is.
+    term_cache : zipline.pipeline.cache.TermCache, optional
+        A cache of computed terms.  Terms found in the cache are not
+        recomputed, and neither are any of their inputs which aren't needed
+        by another term.  Newly computed terms are added to the cache.
+    hooks : zipline.pipeline.hooks.PipelineHooks, optional
+        An object to notify each time a group of terms is loaded or a term is
+        computed.  Pass a :class:`~zipline.pipeline.hooks.ProfilingHooks` to
+        get a per-term timing and memory report.
+    chunksize : int, optional
+        If supplied, ``run_pipeline`` splits its date range into blocks of at
+        most ``chunksize`` sessions and computes each block only over the
+        assets that existed during that block, then stitches the results
+        together.  This makes the work done scale with the number of live
+        asset-days rather than with dates times all assets, which helps long
+        runs over universes with many listings and delistings.  Each block
+        loads its own trailing window of data.
+    optimize_expressions : bool, optional
+        If True, rewrite arithmetic and comparison expressions in the
+        pipelines being run so that subexpressions they share are computed
+        once, and equivalent expressions built separately are computed as a
+        single term.  See
+        :func:`zipline.pipeline.optimize.eliminate_common_subexpressions`.
+        Default is False.
     """
     __slots__ = (
         '_get_loader',
         '_calendar',
         '_finder',
+        '_pool',
+        '_term_cache',
+        '_hooks',
+        '_chunksize',
+        '_optimize_expressions',
+        '_screen_name',
+        '_last_plan',
+        '_last_rewrite',
         '_root_mask_term',
         '_root_mask_dates_term',
         '__weakref__',
     )
 
-    def __init__(self, get_loader, calendar, asset_finder):
+    def __init__(self,
+                 get_loader,
+                 calendar,
+                 asset_finder,
+                 pool=None,
+                 term_cache=None,
+                 hooks=None,
+                 chunksize=None,
+                 optimize_expressions=False):
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(
+                "chunksize must be at least 1, got %r" % (chunksize,)
+            )
+
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
+        self._pool = pool
+        self._term_cache = term_cache
+        self._hooks = hooks
+        self._chunksize = chunksize
+        self._optimize_expressions = optimize_expressions
+
+        self._screen_name = uuid4().hex
+        # The key and ExecutionPlan for the most recently run set of terms.
+        # Running the same pipelines over a new date range reuses its graph.
+        self._last_plan = None, None
+        # The terms most recently passed to eliminate_common_subexpressions,
+        # and its result.  Chunks of the same run reuse the rewrite.
+        self._last_rewrite = None, None
 
         self._root_mask_term = AssetExists()
         self._root_mask_dates_term = InputDates()
@@ -152,7 +255,7 @@ class SimplePipelineEngine(object):
 
         5. Stick the values computed in (4) into a DataFrame and return it.
 
-        Step 0 is performed by ``Pipeline.to_graph``.
+        Step 0 is performed in ``SimplePipelineEngine.run_pipelines``.
         Step 1 is performed in ``SimplePipelineEngine._compute_root_mask``.
         Step 2 is performed in ``SimplePipelineEngine.compute_chunk``.
         Steps 3, 4, and 5 are performed in ``SimplePiplineEngine._to_narrow``.
@@ -161,20 +264,84 @@ class SimplePipelineEngine(object):
         --------
         PipelineEngine.run_pipeline
         """
+        return self.run_pipelines(
+            {None: pipeline},
+            start_date,
+            end_date,
+        )[None]
+
+    def run_pipelines(self, pipelines, start_date, end_date):
+        """
+        Compute several pipelines at once.
+
+        The terms of all of the pipelines are combined into a single execution
+        plan, so terms shared between pipelines (for example, a common
+        universe filter) are only loaded and computed once.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> zipline.pipeline.Pipeline]
+            The pipelines to run, keyed by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            Map from name to the result of running the pipeline with that
+            name.  Each frame is identical to the result of calling
+            ``run_pipeline`` with that pipeline alone.
+
+        See Also
+        --------
+        PipelineEngine.run_pipelines
+        """
         if end_date < start_date:
             raise ValueError(
                 "start_date must be before or equal to end_date \n"
                 "start_date=%s, end_date=%s" % (start_date, end_date)
             )
 
-        screen_name = uuid4().hex
-        graph = pipeline.to_execution_plan(
-            screen_name,
-            self._root_mask_term,
-            self._calendar,
-            start_date,
-            end_date,
-        )
+        chunksize = self._chunksize
+        if chunksize is None:
+            chunks = []
+        else:
+            chunks = self._session_chunks(start_date, end_date, chunksize)
+        if len(chunks) <= 1:
+            return self._run_pipelines_block(pipelines, start_date, end_date)
+
+        blocks = [
+            self._run_pipelines_block(pipelines, block_start, block_end)
+            for block_start, block_end in chunks
+        ]
+        return {
+            name: _concat_narrow([block[name] for block in blocks])
+            for name in pipelines
+        }
+
+    def _run_pipelines_block(self, pipelines, start_date, end_date):
+        """
+        Compute ``pipelines`` between ``start_date`` and ``end_date`` over the
+        assets that existed at some point in that range.
+        """
+        # Output terms are keyed by (pipeline name, column name) so that
+        # columns with the same name in different pipelines don't collide.
+        screen_name = self._screen_name
+        terms = {}
+        for name, pipeline in iteritems(pipelines):
+            pipeline_terms = pipeline._prepare_graph_terms(
+                screen_name,
+                self._root_mask_term,
+            )
+            for column, term in iteritems(pipeline_terms):
+                terms[name, column] = term
+
+        if self._optimize_expressions:
+            terms = self._eliminate_common_subexpressions(terms)
+
+        graph = self._execution_plan(terms, start_date, end_date)
         extra_rows = graph.extra_rows[self._root_mask_term]
         root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
         dates, assets, root_mask_values = explode(root_mask)
@@ -189,13 +356,131 @@ class SimplePipelineEngine(object):
             },
         )
 
-        return self._to_narrow(
-            graph.outputs,
-            results,
-            results.pop(screen_name),
-            dates[extra_rows:],
-            assets,
+        out = {}
+        for name, pipeline in iteritems(pipelines):
+            out[name] = self._to_narrow(
+                pipeline.columns,
+                {
+                    column: results[name, column]
+                    for column in pipeline.columns
+                },
+                results[name, screen_name],
+                dates[extra_rows:],
+                assets,
+            )
+        return out
+
+    def _eliminate_common_subexpressions(self, terms):
+        """
+        Rewrite ``terms`` with ``eliminate_common_subexpressions``, reusing
+        the previous rewrite if it was for the same terms.
+        """
+        last_terms, rewritten = self._last_rewrite
+        # Compare terms by identity because ``==`` on terms builds a new term.
+        if last_terms is None or not (
+                len(last_terms) == len(terms) and
+                all(last_terms.get(name) is term
+                    for name, term in iteritems(terms))):
+            rewritten = eliminate_common_subexpressions(terms)
+            self._last_rewrite = terms, rewritten
+        return rewritten
+
+    def _execution_plan(self, terms, start_date, end_date):
+        """
+        Build an ExecutionPlan for ``terms``, reusing the dependency graph of
+        the previous plan if it was built for the same terms.
+        """
+        # Key on the ids of the terms because ``==`` on terms builds a new
+        # term.  The ids can't be reused while the last plan holds its terms.
+        key = frozenset((name, id(term)) for name, term in iteritems(terms))
+        last_key, last_plan = self._last_plan
+        if key == last_key:
+            plan = last_plan.with_dates(self._calendar, start_date, end_date)
+        else:
+            plan = ExecutionPlan(terms, self._calendar, start_date, end_date)
+            self._last_plan = key, plan
+
+        # Load every column served by the same loader for as many rows as the
+        # column needing the most, so that each loader is only called once per
+        # chunk.  Terms needing fewer rows skip the rest through their offsets.
+        plan.share_extra_rows(
+            itervalues(groupby(self.get_loader, plan.loadable_terms)),
+            self._calendar,
+            start_date,
+            end_date,
         )
+        return plan
+
+    @expect_bounded(chunksize=(1, None))
+    def iter_pipeline(self, pipeline, start_date, end_date, chunksize):
+        """
+        Compute a pipeline in chunks of ``chunksize`` sessions, producing the
+        results for each chunk as soon as they are computed.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+        chunksize : int
+            The number of sessions to compute at a time.
+
+        Returns
+        -------
+        results : iterator[pd.DataFrame]
+            An iterator of frames with the same layout as the result of
+            ``run_pipeline``, one per chunk, in date order.  Each chunk is
+            only computed when it is requested, so only one chunk's results
+            need to be held in memory at a time.
+
+        Notes
+        -----
+        Each chunk loads its own trailing window of data, so smaller chunks
+        use less memory at the cost of reloading the lookback of windowed
+        terms for every chunk.
+
+        See Also
+        --------
+        PipelineEngine.run_pipeline
+        """
+        if end_date < start_date:
+            raise ValueError(
+                "start_date must be before or equal to end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+
+        return (
+            self.run_pipeline(pipeline, chunk_start, chunk_end)
+            for chunk_start, chunk_end in self._session_chunks(
+                start_date,
+                end_date,
+                chunksize,
+            )
+        )
+
+    def _session_chunks(self, start_date, end_date, chunksize):
+        """
+        Split the sessions between ``start_date`` and ``end_date`` into
+        consecutive runs of at most ``chunksize`` sessions.
+
+        Returns
+        -------
+        chunks : list[(pd.Timestamp, pd.Timestamp)]
+            The first and last session of each run, in date order.
+        """
+        sessions = self._calendar[
+            self._calendar.slice_indexer(start_date, end_date)
+        ]
+        return [
+            (
+                sessions[start],
+                sessions[min(start + chunksize, len(sessions)) - 1],
+            )
+            for start in range(0, len(sessions), chunksize)
+        ]
 
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
@@ -286,7 +571,7 @@ class SimplePipelineEngine(object):
             # AdjustedArray.
             for input_ in term.inputs:
                 adjusted_array = ensure_adjusted_array(
-                    workspace[input_], input_.missing_value,
+                    workspace[input_], input_.missing_value, input_.dtype,
                 )
                 out.append(
                     adjusted_array.traverse(
@@ -338,54 +623,65 @@ class SimplePipelineEngine(object):
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = initial_workspace.copy()
+        if self._term_cache is not None:
+            self._populate_from_cache(graph, workspace, dates, assets)
+
+        # Terms which are only needed by terms already in the workspace don't
+        # need to be computed at all.
+        required = graph.required_terms(workspace)
 
         # If loadable terms share the same loader and extra_rows, load them all
         # together.
         loader_group_key = juxt(get_loader, getitem(graph.extra_rows))
-        loader_groups = groupby(loader_group_key, graph.loadable_terms)
-
-        refcounts = graph.initial_refcounts(workspace)
-
-        for term in graph.ordered():
-            # `term` may have been supplied in `initial_workspace`, and in the
-            # future we may pre-compute loadable terms coming from the same
-            # dataset.  In either case, we will already have an entry for this
-            # term, which we shouldn't re-compute.
-            if term in workspace:
-                continue
-
-            # Asset labels are always the same, but date labels vary by how
-            # many extra rows are needed.
-            mask, mask_dates = self._mask_and_dates_for_term(
-                term, workspace, graph, dates
-            )
+        loader_groups = groupby(
+            loader_group_key,
+            (term for term in graph.loadable_terms if term in required),
+        )
 
+        def group_for_term(term):
             if isinstance(term, LoadableTerm):
-                to_load = sorted(
+                return sorted(
                     loader_groups[loader_group_key(term)],
                     key=lambda t: t.dataset
                 )
-                loader = get_loader(term)
-                loaded = loader.load_adjusted_array(
-                    to_load, mask_dates, assets, mask,
+            return [term]
+
+        # Skipped terms will never consume their inputs, so treat them like
+        # pre-computed terms when counting references.
+        refcounts = graph.initial_refcounts(
+            [term for term in graph if term not in required],
+        )
+
+        if self._pool is None:
+            for term in graph.ordered():
+                # `term` may have been supplied in `initial_workspace`, and in
+                # the future we may pre-compute loadable terms coming from the
+                # same dataset.  In either case, we will already have an entry
+                # for this term, which we shouldn't re-compute.
+                if term in workspace or term not in required:
+                    continue
+
+                group = group_for_term(term)
+                # Terms supplied in the initial workspace have already had
+                # their dependencies decref'ed by ``initial_refcounts``.
+                newly_computed = [t for t in group if t not in workspace]
+                task = self._prepare_task(
+                    term, group, workspace, graph, dates, assets,
                 )
-                workspace.update(loaded)
-            else:
-                workspace[term] = term._compute(
-                    self._inputs_for_term(term, workspace, graph),
-                    mask_dates,
-                    assets,
-                    mask,
+                workspace.update(task())
+                self._release_inputs(
+                    newly_computed, workspace, graph, refcounts,
                 )
-                if term.ndim == 2:
-                    assert workspace[term].shape == mask.shape
-                else:
-                    assert workspace[term].shape == (mask.shape[0], 1)
-
-                # Decref dependencies of ``term``, and clear any terms whose
-                # refcounts hit 0.
-                for garbage_term in graph.decref_dependencies(term, refcounts):
-                    del workspace[garbage_term]
+        else:
+            self._compute_concurrently(
+                graph,
+                group_for_term,
+                workspace,
+                refcounts,
+                required,
+                dates,
+                assets,
+            )
 
         out = {}
         graph_extra_rows = graph.extra_rows
@@ -394,6 +690,175 @@ class SimplePipelineEngine(object):
             out[name] = workspace[term][graph_extra_rows[term]:]
         return out
 
+    def _prepare_task(self, term, group, workspace, graph, dates, assets):
+        """
+        Build a thunk that computes ``term`` (and, for loadable terms, the
+        rest of ``group``) and returns a dict mapping terms to results.
+
+        All lookups into ``workspace`` happen here so that the returned thunk
+        can be run without touching shared state.
+        """
+        # Asset labels are always the same, but date labels vary by how
+        # many extra rows are needed.
+        mask, mask_dates = self._mask_and_dates_for_term(
+            term, workspace, graph, dates
+        )
+
+        hooks = self._hooks
+        extra_rows = graph.extra_rows[term]
+
+        if isinstance(term, LoadableTerm):
+            loader = self.get_loader(term)
+
+            def task():
+                start = default_timer()
+                loaded = loader.load_adjusted_array(
+                    group, mask_dates, assets, mask,
+                )
+                if hooks is not None:
+                    hooks.on_load(
+                        group, extra_rows, default_timer() - start, loaded,
+                    )
+                return loaded
+        else:
+            inputs = self._inputs_for_term(term, workspace, graph)
+            cache = self._term_cache
+
+            def task():
+                start = default_timer()
+                result = term._compute(inputs, mask_dates, assets, mask)
+                if hooks is not None:
+                    hooks.on_compute(
+                        term, extra_rows, default_timer() - start, result,
+                    )
+                if term.ndim == 2:
+                    assert result.shape == mask.shape
+                else:
+                    assert result.shape == (mask.shape[0], 1)
+                if cache is not None:
+                    cache.set(term, mask_dates, assets, result)
+                return {term: result}
+
+        return task
+
+    def _populate_from_cache(self, graph, workspace, dates, assets):
+        """
+        Read computable terms from ``self._term_cache`` into ``workspace``.
+
+        We search backwards from the outputs of ``graph``, so the inputs of a
+        term found in the cache are never looked up.
+        """
+        cache = self._term_cache
+        extra_rows = graph.extra_rows
+        root_extra_rows = extra_rows[self._root_mask_term]
+
+        seen = set()
+        stack = list(graph.outputs.values())
+        while stack:
+            term = stack.pop()
+            if term in seen or term in workspace:
+                continue
+            seen.add(term)
+
+            if isinstance(term, ComputableTerm):
+                term_dates = dates[root_extra_rows - extra_rows[term]:]
+                try:
+                    workspace[term] = cache.get(term, term_dates, assets)
+                    continue
+                except KeyError:
+                    pass
+
+            # Edges are tuple of (from, to).
+            stack.extend(parent for parent, _ in graph.in_edges([term]))
+
+    @staticmethod
+    def _release_inputs(terms, workspace, graph, refcounts):
+        """
+        Decref dependencies of the newly-computed ``terms``, and clear any
+        terms whose refcounts hit 0 from ``workspace``.
+
+        Loadable terms are decref'ed as well, so that masks used only to load
+        data (usually the root mask) are released once every term reading them
+        has been computed.  Outputs hold an extra reference and are never
+        released.
+        """
+        for term in terms:
+            for garbage_term in graph.decref_dependencies(term, refcounts):
+                del workspace[garbage_term]
+
+    def _compute_concurrently(self,
+                              graph,
+                              group_for_term,
+                              workspace,
+                              refcounts,
+                              required,
+                              dates,
+                              assets):
+        """
+        Compute the terms in ``graph`` on ``self._pool``, submitting each term
+        as soon as all of its dependencies are in ``workspace``.
+
+        Bookkeeping on ``workspace`` and ``refcounts`` only happens on the
+        calling thread; workers only ever run the thunks produced by
+        ``_prepare_task``.
+        """
+        pool = self._pool
+        finished = Queue()
+
+        def run(group, task):
+            try:
+                finished.put((group, task(), None))
+            except Exception:
+                finished.put((group, None, exc_info()))
+
+        # Number of dependencies of each term that haven't been computed yet.
+        unmet = {
+            term: sum(
+                parent not in workspace
+                for parent, _ in graph.in_edges([term])
+            )
+            for term in graph
+            if term in required and term not in workspace
+        }
+        ready = [term for term in graph.ordered() if unmet.get(term) == 0]
+        submitted = set()
+        in_flight = 0
+
+        while ready or in_flight:
+            for term in ready:
+                # Loadable terms are submitted along with the rest of their
+                # loader group, so they may already be in flight or finished.
+                if term in submitted:
+                    continue
+                group = group_for_term(term)
+                submitted.update(group)
+                pool.apply_async(
+                    run,
+                    (group, self._prepare_task(
+                        term, group, workspace, graph, dates, assets,
+                    )),
+                )
+                in_flight += 1
+            ready = []
+
+            group, results, error = finished.get()
+            in_flight -= 1
+            if error is not None:
+                reraise(*error)
+
+            # Terms supplied in the initial workspace were never counted as
+            # unmet dependencies, so they must not be counted as newly met.
+            newly_computed = [term for term in group if term in unmet]
+            workspace.update(results)
+            self._release_inputs(newly_computed, workspace, graph, refcounts)
+            for term in newly_computed:
+                for dependent in graph.successors(term):
+                    if dependent not in unmet:
+                        continue
+                    unmet[dependent] -= 1
+                    if unmet[dependent] == 0:
+                        ready.append(dependent)
+
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
         Convert raw computed pipeline results into a DataFrame for public APIs.
@@ -488,3 +953,114 @@ class SimplePipelineEngine(object):
                     implied=implied_shape,
                 )
             )
+
+
+@expect_bounded(shards=(1, None))
+def run_sharded_pipeline(make_engine,
+                         make_pipeline,
+                         calendar,
+                         start_date,
+                         end_date,
+                         shards,
+                         pool=SequentialPool()):
+    """
+    Compute a pipeline by splitting ``[start_date, end_date]`` into contiguous
+    date ranges and running each range as an independent call to
+    ``run_pipeline`` on ``pool``.
+
+    Parameters
+    ----------
+    make_engine : callable[() -> SimplePipelineEngine]
+        Function building the engine to use for a shard.  It is called once
+        per shard, so each worker gets its own loaders and asset finder.
+    make_pipeline : callable[() -> zipline.pipeline.Pipeline]
+        Function building the pipeline to run for a shard.
+    calendar : pd.DatetimeIndex
+        Trading sessions used to split the requested range.
+    start_date : pd.Timestamp
+        Start date of the computed matrix.
+    end_date : pd.Timestamp
+        End date of the computed matrix.
+    shards : int
+        Number of date ranges to split ``[start_date, end_date]`` into.  If
+        there are fewer sessions than ``shards``, each session is run on its
+        own.
+    pool : Pool, optional
+        The pool to run shards on.  This object must support ``map``.
+        To run shards in separate processes, pass a
+        :class:`multiprocessing.Pool`; in that case ``make_engine`` and
+        ``make_pipeline`` must be picklable, for example module-level
+        functions or ``functools.partial`` objects wrapping
+        :func:`zipline.pipeline.engine_from_files`.
+
+    Returns
+    -------
+    result : pd.DataFrame
+        The same frame that ``make_engine().run_pipeline`` would produce for
+        the whole range.  Each shard loads its own trailing window of data, so
+        terms are computed exactly as they would be in a single run.
+
+    See Also
+    --------
+    :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
+    :class:`zipline.utils.pool.SequentialPool`
+    """
+    if end_date < start_date:
+        raise ValueError(
+            "start_date must be before or equal to end_date \n"
+            "start_date=%s, end_date=%s" % (start_date, end_date)
+        )
+
+    sessions = calendar[calendar.slice_indexer(start_date, end_date)]
+    ranges = [
+        (make_engine, make_pipeline, sessions[locs[0]], sessions[locs[-1]])
+        for locs in array_split(
+            arange(len(sessions)),
+            min(shards, len(sessions)),
+        )
+    ]
+    return _concat_narrow(pool.map(_run_pipeline_shard, ranges))
+
+
+def _run_pipeline_shard(args):
+    """
+    Run a single shard for ``run_sharded_pipeline``.
+
+    This is a module-level function taking a single tuple so that it can be
+    sent to a :class:`multiprocessing.Pool`.
+    """
+    make_engine, make_pipeline, start_date, end_date = args
+    return make_engine().run_pipeline(make_pipeline(), start_date, end_date)
+
+
+def _concat_narrow(frames):
+    """
+    Stitch together narrow pipeline results for consecutive date ranges.
+
+    Categorical columns are recoded onto the union of their categories before
+    concatenating, since the shards may not have seen the same labels.
+    Empty shards are dropped, since ``_to_narrow`` doesn't build categoricals
+    for them.
+    """
+    nonempty = [frame for frame in frames if len(frame)]
+    if not nonempty:
+        return frames[0]
+    if len(nonempty) == 1:
+        return nonempty[0]
+
+    for name in nonempty[0].columns:
+        if not any(frame[name].dtype.name == 'category' for frame in nonempty):
+            continue
+        # Keep categories in order of first appearance so that the first
+        # shard's codes don't change.
+        categories = []
+        seen = set()
+        for frame in nonempty:
+            for category in frame[name].cat.categories:
+                if category not in seen:
+                    seen.add(category)
+                    categories.append(category)
+        for frame in nonempty:
+            frame[name] = frame[name].cat.set_categories(categories)
+
+    return concat(nonempty)
@@ -11,6 +11,7 @@ from numpy import (
     full,
     inf,
 )
+from toolz import unique
 
 from zipline.pipeline.term import Term, ComputableTerm
 
@@ -230,7 +231,9 @@ class NumericalExpression(ComputableTerm):
         Compute our stored expression string with numexpr.
         """
         out = full(mask.shape, self.missing_value, dtype=self.dtype)
-        # This writes directly into our output buffer.
+        # This writes directly into our output buffer.  'same_kind' casting
+        # lets float32 expressions containing float64 constants write into a
+        # float32 buffer.
         numexpr.evaluate(
             self._expr,
             local_dict={
@@ -239,6 +242,7 @@ class NumericalExpression(ComputableTerm):
             },
             global_dict={'inf': inf},
             out=out,
+            casting='same_kind',
         )
         return out
 
@@ -276,7 +280,9 @@ class NumericalExpression(ComputableTerm):
 
         Returns a tuple of (new_self_expr, new_other_expr, new_inputs)
         """
-        new_inputs = tuple(set(self.inputs).union(other.inputs))
+        # Keep the inputs in order of first appearance so that combining the
+        # same expressions always produces the same term.
+        new_inputs = tuple(unique(chain(self.inputs, other.inputs)))
         new_self_expr = self._rebind_variables(new_inputs)
         new_other_expr = other._rebind_variables(new_inputs)
         return new_self_expr, new_other_expr, new_inputs
@@ -1,7 +1,7 @@
 """
 factor.py
 """
-from functools import wraps
+from functools import partial, wraps
 from operator import attrgetter
 from numbers import Number
 
@@ -9,7 +9,12 @@ from numpy import empty_like, inf, nan, where
 from scipy.stats import rankdata
 
 from zipline.errors import UnknownRankMethod
-from zipline.lib.normalize import naive_grouped_rowwise_apply
+from zipline.lib.normalize import (
+    grouped_rowwise_demean,
+    grouped_rowwise_rank,
+    grouped_rowwise_zscore,
+    naive_grouped_rowwise_apply,
+)
 from zipline.lib.rank import masked_rankdata_2d, rankdata_1d_descending
 from zipline.pipeline.api_utils import restrict_to_dtype
 from zipline.pipeline.classifiers import Classifier, Everything, Quantiles
@@ -30,6 +35,7 @@ from zipline.pipeline.filters import (
     PercentileFilter,
     NotNullFilter,
     NullFilter,
+    RankFilter,
 )
 from zipline.pipeline.mixins import (
     CustomTermMixin,
@@ -50,6 +56,7 @@ from zipline.utils.numpy_utils import (
     categorical_dtype,
     coerce_to_dtype,
     datetime64ns_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
 )
@@ -116,16 +123,39 @@ def binop_return_dtype(op, left, right):
             )
         return bool_dtype
 
-    elif left != float64_dtype or right != float64_dtype:
+    elif left not in FLOAT_FACTOR_DTYPES or right not in FLOAT_FACTOR_DTYPES:
         raise TypeError(
             "Don't know how to compute {left} {op} {right}.\n"
             "Arithmetic operators are only supported between Factors of "
-            "dtype 'float64'.".format(
+            "dtype 'float32' or 'float64'.".format(
                 left=left.name,
                 op=op,
                 right=right.name,
             )
         )
+    return float_result_dtype(left, right)
+
+
+def float_result_dtype(*dtypes):
+    """
+    Compute the dtype of a floating point computation over inputs of
+    ``dtypes``.
+
+    The result is float32 if all of the inputs are float32, and float64
+    otherwise.  Mixing float32 and float64 inputs promotes to float64, as in
+    numpy.
+
+    Parameters
+    ----------
+    *dtypes : numpy.dtype
+        The dtypes of the inputs to the computation.
+
+    Returns
+    -------
+    outdtype : numpy.dtype
+    """
+    if all(dtype == float32_dtype for dtype in dtypes):
+        return float32_dtype
     return float64_dtype
 
 
@@ -243,12 +273,12 @@ def unary_operator(op):
     @with_doc("Unary Operator: '%s'" % op)
     @with_name(unary_op_name(op))
     def unary_operator(self):
-        if self.dtype != float64_dtype:
+        if self.dtype not in FLOAT_FACTOR_DTYPES:
             raise TypeError(
                 "Can't apply unary operator {op!r} to instance of "
                 "{typename!r} with dtype {dtypename!r}.\n"
                 "{op!r} is only supported for Factors of dtype "
-                "'float64'.".format(
+                "'float32' or 'float64'.".format(
                     op=op,
                     typename=type(self).__name__,
                     dtypename=self.dtype.name,
@@ -262,13 +292,13 @@ def unary_operator(op):
             return NumExprFactor(
                 "{op}({expr})".format(op=op, expr=self._expr),
                 self.inputs,
-                dtype=float64_dtype,
+                dtype=self.dtype,
             )
         else:
             return NumExprFactor(
                 "{op}x_0".format(op=op),
                 (self,),
-                dtype=float64_dtype,
+                dtype=self.dtype,
             )
     return unary_operator
 
@@ -283,24 +313,27 @@ def function_application(func):
 
     @with_name(func)
     def mathfunc(self):
+        # Math functions of float32 Factors stay in float32.  Everything else
+        # is computed in float64.
+        dtype = float_result_dtype(self.dtype)
         if isinstance(self, NumericalExpression):
             return NumExprFactor(
                 "{func}({expr})".format(func=func, expr=self._expr),
                 self.inputs,
-                dtype=float64_dtype,
+                dtype=dtype,
             )
         else:
             return NumExprFactor(
                 "{func}(x_0)".format(func=func),
                 (self,),
-                dtype=float64_dtype,
+                dtype=dtype,
             )
     return mathfunc
 
 
 # Decorators for Factor methods.
-if_not_float64_tell_caller_to_use_isnull = restrict_to_dtype(
-    dtype=float64_dtype,
+if_not_float_tell_caller_to_use_isnull = restrict_to_dtype(
+    dtype=(float32_dtype, float64_dtype),
     message_template=(
         "{method_name}() was called on a factor of dtype {received_dtype}.\n"
         "{method_name}() is only defined for dtype {expected_dtype}."
@@ -316,7 +349,8 @@ float64_only = restrict_to_dtype(
     )
 )
 
-FACTOR_DTYPES = frozenset([datetime64ns_dtype, float64_dtype, int64_dtype])
+FLOAT_FACTOR_DTYPES = frozenset([float32_dtype, float64_dtype])
+FACTOR_DTYPES = FLOAT_FACTOR_DTYPES.union([datetime64ns_dtype, int64_dtype])
 
 
 class Factor(RestrictedDTypeMixin, ComputableTerm):
@@ -951,8 +985,20 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         Returns
         -------
         filter : zipline.pipeline.filters.Filter
+
+        Notes
+        -----
+        The result is the same as
+        ``self.rank(ascending=False, mask=mask, groupby=groupby) <= N``, but
+        is computed with a selection algorithm instead of a sort.
         """
-        return self.rank(ascending=False, mask=mask, groupby=groupby) <= N
+        return RankFilter(
+            self,
+            N=N,
+            ascending=False,
+            mask=mask,
+            groupby=groupby,
+        )
 
     def bottom(self, N, mask=NotSpecified, groupby=NotSpecified):
         """
@@ -975,8 +1021,20 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         Returns
         -------
         filter : zipline.pipeline.Filter
+
+        Notes
+        -----
+        The result is the same as
+        ``self.rank(ascending=True, mask=mask, groupby=groupby) <= N``, but
+        is computed with a selection algorithm instead of a sort.
         """
-        return self.rank(ascending=True, mask=mask, groupby=groupby) <= N
+        return RankFilter(
+            self,
+            N=N,
+            ascending=True,
+            mask=mask,
+            groupby=groupby,
+        )
 
     def percentile_between(self,
                            min_percentile,
@@ -1020,14 +1078,14 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         """
         A Filter producing True for values where this Factor has missing data.
 
-        Equivalent to self.isnan() when ``self.dtype`` is float64.
+        Equivalent to self.isnan() when ``self.dtype`` is float32 or float64.
         Otherwise equivalent to ``self.eq(self.missing_value)``.
 
         Returns
         -------
         filter : zipline.pipeline.filters.Filter
         """
-        if self.dtype == float64_dtype:
+        if self.dtype in FLOAT_FACTOR_DTYPES:
             # Using isnan is more efficient when possible because we can fold
             # the isnan computation with other NumExpr expressions.
             return self.isnan()
@@ -1038,12 +1096,13 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         """
         A Filter producing True for values where this Factor has complete data.
 
-        Equivalent to ``~self.isnan()` when ``self.dtype`` is float64.
+        Equivalent to ``~self.isnan()` when ``self.dtype`` is float32 or
+        float64.
         Otherwise equivalent to ``(self != self.missing_value)``.
         """
         return NotNullFilter(self)
 
-    @if_not_float64_tell_caller_to_use_isnull
+    @if_not_float_tell_caller_to_use_isnull
     def isnan(self):
         """
         A Filter producing True for all values where this Factor is NaN.
@@ -1054,7 +1113,7 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         """
         return self != self
 
-    @if_not_float64_tell_caller_to_use_isnull
+    @if_not_float_tell_caller_to_use_isnull
     def notnan(self):
         """
         A Filter producing True for values where this Factor is not NaN.
@@ -1065,7 +1124,7 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         """
         return ~self.isnan()
 
-    @if_not_float64_tell_caller_to_use_isnull
+    @if_not_float_tell_caller_to_use_isnull
     def isfinite(self):
         """
         A Filter producing True for values where this Factor is anything but
@@ -1197,17 +1256,20 @@ class GroupedRowTransform(Factor):
 
         # Make a copy with the null code written to masked locations.
         group_labels = where(mask, group_labels, null_label)
-        return where(
-            group_labels != null_label,
+
+        out = empty_like(data, dtype=self.dtype)
+        vectorized = _VECTORIZED_TRANSFORMS.get(self._transform)
+        if vectorized is not None:
+            vectorized(data, group_labels, *self._transform_args, out=out)
+        else:
             naive_grouped_rowwise_apply(
                 data=data,
                 group_labels=group_labels,
                 func=self._transform,
                 func_args=self._transform_args,
-                out=empty_like(data, dtype=self.dtype),
-            ),
-            self.missing_value,
-        )
+                out=out,
+            )
+        return where(group_labels != null_label, out, self.missing_value)
 
     @property
     def transform_name(self):
@@ -1362,6 +1424,34 @@ class CustomFactor(PositiveWindowLengthMixin, CustomTermMixin, Factor):
     3rd, 2014, the column of input data for asset A will have 9 leading NaNs
     for the preceding days on which data was not yet available.
 
+    Factors whose value can be updated as rows enter and leave the window can
+    avoid re-reading the whole window every day by setting
+    ``incremental = True`` and implementing three more methods:
+
+    .. code-block:: python
+
+        def reset(self, *windows):
+            ...  # Return a state summarizing complete windows.
+
+        def update(self, state, entering, leaving):
+            ...  # Return the state after one day, or None to call reset.
+
+        def emit(self, state, out):
+            ...  # Write the values described by state into out.
+
+    ``entering`` and ``leaving`` are tuples holding, for each input, the row
+    which was added to the window and the row which was dropped from it.
+    Params are passed to all three methods as keyword arguments.  ``reset`` is
+    called on the first day, whenever an adjustment (e.g. a split) changes
+    rows that were already seen, and every ``window_length`` days to discard
+    accumulated rounding error.  The state and the inputs cover every asset,
+    not just those in ``mask``, so incremental factors must compute each
+    column independently of the others.  ``compute`` is still used when the
+    factor is downsampled or has 1-dimensional inputs, so it should be
+    implemented as well.  Subclasses of an incremental factor which override
+    ``compute`` are computed with their own ``compute`` unless they also set
+    ``incremental = True``.
+
     Examples
     --------
 
@@ -1524,3 +1614,14 @@ def demean(row):
 
 def zscore(row):
     return (row - nanmean(row)) / nanstd(row)
+
+
+# Vectorized implementations of the transforms above, used by
+# GroupedRowTransform in place of naive_grouped_rowwise_apply.  Each is called
+# as ``f(data, group_labels, *transform_args, out=out)``.
+_VECTORIZED_TRANSFORMS = {
+    demean: grouped_rowwise_demean,
+    zscore: grouped_rowwise_zscore,
+    rankdata: grouped_rowwise_rank,
+    rankdata_1d_descending: partial(grouped_rowwise_rank, ascending=False),
+}
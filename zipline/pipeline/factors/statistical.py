@@ -1,10 +1,17 @@
 
-from numpy import broadcast_arrays
-from scipy.stats import (
-    linregress,
-    pearsonr,
-    spearmanr,
+from numpy import (
+    abs as np_abs,
+    arange,
+    argsort,
+    clip,
+    empty,
+    errstate,
+    maximum,
+    minimum,
+    sqrt,
+    where,
 )
+from scipy.stats import t as t_dist
 
 from zipline.errors import IncompatibleTerms
 from zipline.pipeline.factors import CustomFactor
@@ -76,13 +83,9 @@ class RollingPearson(_RollingCorrelation):
     instance of this class.
     """
     def compute(self, today, assets, out, base_data, target_data):
-        # If `target_data` is a Slice or single column of data, broadcast it
-        # out to the same shape as `base_data`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        target_data = broadcast_arrays(target_data, base_data)[0]
-        for i in range(len(out)):
-            out[i] = pearsonr(base_data[:, i], target_data[:, i])[0]
+        # If `target_data` is a Slice or single column of data, it broadcasts
+        # against every column of `base_data`.
+        out[:] = vectorized_pearson_r(base_data, target_data)
 
 
 class RollingSpearman(_RollingCorrelation):
@@ -120,13 +123,13 @@ class RollingSpearman(_RollingCorrelation):
     instance of this class.
     """
     def compute(self, today, assets, out, base_data, target_data):
-        # If `target_data` is a Slice or single column of data, broadcast it
-        # out to the same shape as `base_data`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        target_data = broadcast_arrays(target_data, base_data)[0]
-        for i in range(len(out)):
-            out[i] = spearmanr(base_data[:, i], target_data[:, i])[0]
+        # Spearman correlation is the pearson correlation of the ranks.  If
+        # `target_data` is a Slice or single column of data, we only need to
+        # rank it once and it broadcasts against every column of `base_data`.
+        out[:] = vectorized_pearson_r(
+            rankdata_columns(base_data),
+            rankdata_columns(target_data),
+        )
 
 
 class RollingLinearRegression(CustomFactor, SingleInputMixin):
@@ -186,29 +189,15 @@ class RollingLinearRegression(CustomFactor, SingleInputMixin):
         )
 
     def compute(self, today, assets, out, dependent, independent):
-        alpha = out.alpha
-        beta = out.beta
-        r_value = out.r_value
-        p_value = out.p_value
-        stderr = out.stderr
-
-        def regress(y, x):
-            regr_results = linregress(y=y, x=x)
-            # `linregress` returns its results in the following order:
-            # slope, intercept, r-value, p-value, stderr
-            alpha[i] = regr_results[1]
-            beta[i] = regr_results[0]
-            r_value[i] = regr_results[2]
-            p_value[i] = regr_results[3]
-            stderr[i] = regr_results[4]
-
-        # If `independent` is a Slice or single column of data, broadcast it
-        # out to the same shape as `dependent`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        independent = broadcast_arrays(independent, dependent)[0]
-        for i in range(len(out)):
-            regress(y=dependent[:, i], x=independent[:, i])
+        # If `independent` is a Slice or single column of data, it broadcasts
+        # against every column of `dependent`.
+        (
+            out.beta[:],
+            out.alpha[:],
+            out.r_value[:],
+            out.p_value[:],
+            out.stderr[:],
+        ) = vectorized_linregress(y=dependent, x=independent)
 
 
 class RollingPearsonOfReturns(RollingPearson):
@@ -469,3 +458,128 @@ class RollingLinearRegressionOfReturns(RollingLinearRegression):
             regression_length=regression_length,
             mask=mask,
         )
+
+
+def vectorized_pearson_r(x, y):
+    """
+    Compute the pearson correlation coefficient between each column of ``x``
+    and the corresponding column of ``y``.
+
+    This is equivalent to calling :func:`scipy.stats.pearsonr` on each pair
+    of columns and taking the first result.
+
+    Parameters
+    ----------
+    x, y : np.ndarray[ndim=2]
+        Arrays of observations.  Columns of length 1 are broadcast against the
+        columns of the other array.
+
+    Returns
+    -------
+    r : np.ndarray[float64, ndim=1]
+    """
+    x_demeaned = x - x.mean(axis=0)
+    y_demeaned = y - y.mean(axis=0)
+    with errstate(divide='ignore', invalid='ignore'):
+        r = (x_demeaned * y_demeaned).sum(axis=0) / sqrt(
+            (x_demeaned ** 2).sum(axis=0) * (y_demeaned ** 2).sum(axis=0)
+        )
+    # Guard against numerical error pushing us out of the valid range, the
+    # same way scipy does.
+    return clip(r, -1.0, 1.0)
+
+
+def vectorized_linregress(y, x):
+    """
+    Perform an ordinary least-squares regression of each column of ``y`` on
+    the corresponding column of ``x``.
+
+    This is equivalent to calling :func:`scipy.stats.linregress` on each pair
+    of columns.
+
+    Parameters
+    ----------
+    y : np.ndarray[ndim=2]
+        The dependent variables.
+    x : np.ndarray[ndim=2]
+        The independent variables.  Columns of length 1 are broadcast against
+        the columns of ``y``.
+
+    Returns
+    -------
+    slope, intercept, r_value, p_value, stderr : np.ndarray[float64, ndim=1]
+        The same outputs as ``linregress``, computed for each column.
+    """
+    # Avoid division by exactly zero in the t-statistic, as scipy does.
+    TINY = 1.0e-20
+
+    nobs = len(y)
+    x_mean = x.mean(axis=0)
+    y_mean = y.mean(axis=0)
+    x_demeaned = x - x_mean
+    y_demeaned = y - y_mean
+
+    # Biased (population) moments, matching ``np.cov(x, y, bias=1)``.
+    ssxm = (x_demeaned ** 2).mean(axis=0)
+    ssym = (y_demeaned ** 2).mean(axis=0)
+    ssxym = (x_demeaned * y_demeaned).mean(axis=0)
+
+    with errstate(divide='ignore', invalid='ignore'):
+        r_den = sqrt(ssxm * ssym)
+        r = clip(where(r_den == 0.0, 0.0, ssxym / r_den), -1.0, 1.0)
+
+        df = nobs - 2
+        t = r * sqrt(df / ((1.0 - r + TINY) * (1.0 + r + TINY)))
+        p_value = 2 * t_dist.sf(np_abs(t), df)
+
+        slope = ssxym / ssxm
+        intercept = y_mean - slope * x_mean
+        stderr = sqrt((1 - r * r) * ssym / ssxm / df)
+
+    return slope, intercept, r, p_value, stderr
+
+
+def rankdata_columns(data):
+    """
+    Rank the values in each column of ``data``, assigning tied values the
+    average of their ranks.
+
+    This is equivalent to applying :func:`scipy.stats.rankdata` with the
+    default ``method='average'`` to each column, including its treatment of
+    NaNs.
+
+    Parameters
+    ----------
+    data : np.ndarray[ndim=2]
+
+    Returns
+    -------
+    ranks : np.ndarray[float64, ndim=2]
+    """
+    nrows, ncols = data.shape
+    columns = arange(ncols)
+    positions = arange(nrows).reshape(nrows, 1)
+
+    # mergesort for consistency with rankdata.
+    sorter = argsort(data, axis=0, kind='mergesort')
+    sorted_data = data[sorter, columns]
+
+    # For each sorted position, find the first and last positions of the run
+    # of values equal to it.
+    changed = sorted_data[1:] != sorted_data[:-1]
+    run_starts = empty((nrows, ncols), dtype=bool)
+    run_starts[0] = True
+    run_starts[1:] = changed
+    run_ends = empty((nrows, ncols), dtype=bool)
+    run_ends[-1] = True
+    run_ends[:-1] = changed
+
+    first = maximum.accumulate(where(run_starts, positions, 0), axis=0)
+    last = minimum.accumulate(
+        where(run_ends, positions, nrows)[::-1],
+        axis=0,
+    )[::-1]
+
+    ranks = empty((nrows, ncols), dtype=float)
+    ranks[sorter, columns] = (first + last) / 2.0 + 1
+    return ranks
@@ -8,19 +8,27 @@ from numbers import Number
 from numpy import (
     abs,
     arange,
+    asarray,
     average,
     clip,
     diff,
+    dot,
     dstack,
     exp,
+    float64,
     fmax,
     full,
     inf,
+    isfinite,
+    isinf,
     isnan,
     log,
+    maximum,
+    nan,
     NINF,
     sqrt,
     sum as np_sum,
+    where,
 )
 from numexpr import evaluate
 
@@ -40,6 +48,41 @@ from zipline.utils.math_utils import (
 from .factor import CustomFactor
 
 
+def _nansum_and_count(data):
+    """
+    Column-wise sum and count of the non-nan values in ``data``.
+
+    This is the state of the incremental factors below.  The sum is always
+    accumulated in float64.
+    """
+    present = ~isnan(data)
+    return (
+        where(present, data, 0).sum(axis=0, dtype=float64),
+        present.sum(axis=0),
+    )
+
+
+def _roll_nansum_and_count(state, entering, leaving):
+    """
+    Update a ``(sum, count)`` pair produced by ``_nansum_and_count`` in place
+    for a window that gained the row ``entering`` and lost the row
+    ``leaving``.
+
+    Returns None if either row contains an infinity, since an infinity can't
+    be subtracted back out of a running sum.
+    """
+    if isinf(entering).any() or isinf(leaving).any():
+        return None
+    total, count = state
+    entering_present = ~isnan(entering)
+    leaving_present = ~isnan(leaving)
+    total += where(entering_present, entering, 0)
+    total -= where(leaving_present, leaving, 0)
+    count += entering_present
+    count -= leaving_present
+    return total, count
+
+
 class Returns(CustomFactor):
     """
     Calculates the percent change in close price over the given window_length.
@@ -97,10 +140,21 @@ class SimpleMovingAverage(CustomFactor, SingleInputMixin):
     # nans, but they still returns the desired value (nan), so we ignore the
     # warning.
     ctx = ignore_nanwarnings()
+    incremental = True
 
     def compute(self, today, assets, out, data):
         out[:] = nanmean(data, axis=0)
 
+    def reset(self, data):
+        return _nansum_and_count(data)
+
+    def update(self, state, entering, leaving):
+        return _roll_nansum_and_count(state, entering[0], leaving[0])
+
+    def emit(self, state, out):
+        total, count = state
+        out[:] = where(count > 0, total / maximum(count, 1), nan)
+
 
 class WeightedAverageValue(CustomFactor):
     """
@@ -110,9 +164,29 @@ class WeightedAverageValue(CustomFactor):
 
     **Default Window Length:** None
     """
+    incremental = True
+
     def compute(self, today, assets, out, base, weight):
         out[:] = nansum(base * weight, axis=0) / nansum(weight, axis=0)
 
+    def reset(self, base, weight):
+        return _nansum_and_count(base * weight), _nansum_and_count(weight)
+
+    def update(self, state, entering, leaving):
+        (base_in, weight_in), (base_out, weight_out) = entering, leaving
+        products = _roll_nansum_and_count(
+            state[0], base_in * weight_in, base_out * weight_out,
+        )
+        weights = _roll_nansum_and_count(state[1], weight_in, weight_out)
+        if products is None or weights is None:
+            return None
+        return products, weights
+
+    def emit(self, state, out):
+        (products, _), (weights, count) = state
+        # nansum of an all-nan column is 0, so those columns are 0 / 0.
+        out[:] = where(count > 0, products / weights, nan)
+
 
 class VWAP(WeightedAverageValue):
     """
@@ -155,10 +229,24 @@ class AverageDollarVolume(CustomFactor):
     **Default Window Length:** None
     """
     inputs = [USEquityPricing.close, USEquityPricing.volume]
+    incremental = True
 
     def compute(self, today, assets, out, close, volume):
         out[:] = nansum(close * volume, axis=0) / len(close)
 
+    def reset(self, close, volume):
+        return _nansum_and_count(close * volume)
+
+    def update(self, state, entering, leaving):
+        (close_in, volume_in), (close_out, volume_out) = entering, leaving
+        return _roll_nansum_and_count(
+            state, close_in * volume_in, close_out * volume_out,
+        )
+
+    def emit(self, state, out):
+        total, count = state
+        out[:] = where(count > 0, total, 0) / self.window_length
+
 
 class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
     """
@@ -190,6 +278,11 @@ class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
     from_center_of_mass
     """
     params = ('decay_rate',)
+    incremental = True
+
+    # Number of weighted power sums (of data, data ** 2, ...) in the state
+    # used by ``reset`` and ``update``.
+    _moments = 1
 
     @staticmethod
     def weights(length, decay_rate):
@@ -199,6 +292,50 @@ class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
         """
         return full(length, decay_rate, float) ** arange(length + 1, 1, -1)
 
+    def reset(self, data, decay_rate):
+        weights = self.weights(len(data), decay_rate)
+        missing = isnan(data)
+
+        # The sums are taken over deviations from a value in each column, so
+        # that the one-pass variance doesn't lose the precision of data with a
+        # large mean relative to its spread.  Any finite value in the column
+        # will do.
+        finite = isfinite(data)
+        first_finite = data[finite.argmax(axis=0), arange(data.shape[1])]
+        shift = where(finite.any(axis=0), first_finite, 0)
+
+        data = where(missing, 0, asarray(data, dtype=float64) - shift)
+        return (
+            np_sum(weights),
+            np_sum(weights ** 2),
+            missing.sum(axis=0),
+            shift,
+            [dot(weights, data ** k) for k in range(1, self._moments + 1)],
+        )
+
+    def update(self, state, entering, leaving, decay_rate):
+        (new,), (old,) = entering, leaving
+        if isinf(new).any() or isinf(old).any():
+            return None
+        missing, shift, sums = state[2:]
+        new_missing = isnan(new)
+        old_missing = isnan(old)
+        new = where(new_missing, 0, asarray(new, dtype=float64) - shift)
+        old = where(old_missing, 0, asarray(old, dtype=float64) - shift)
+
+        # Every row in the window ages by one day, which multiplies its weight
+        # by decay_rate.  The oldest row had the largest exponent,
+        # window_length + 1, and the newest row enters with an exponent of 2.
+        oldest = decay_rate ** (self.window_length + 1)
+        newest = decay_rate ** 2
+        for k, total in enumerate(sums, 1):
+            total -= oldest * old ** k
+            total *= decay_rate
+            total += newest * new ** k
+        missing += new_missing
+        missing -= old_missing
+        return state
+
     @classmethod
     @expect_types(span=Number)
     def from_span(cls, inputs, window_length, span, **kwargs):
@@ -371,6 +508,10 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
             weights=self.weights(len(data), decay_rate),
         )
 
+    def emit(self, state, out, decay_rate):
+        weight_sum, _, missing, shift, (total,) = state
+        out[:] = where(missing > 0, nan, total / weight_sum + shift)
+
 
 class LinearWeightedMovingAverage(CustomFactor, SingleInputMixin):
     """
@@ -444,6 +585,28 @@ class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
         )
         out[:] = sqrt(variance * bias_correction)
 
+    _moments = 2
+
+    def emit(self, state, out, decay_rate):
+        weight_sum, sum_of_squared_weights, missing, _, sums = state
+        total, squares = sums
+        # The variance doesn't depend on the shift, so we can use the mean of
+        # the shifted data.
+        mean = total / weight_sum
+        # Rounding can make the difference of the two terms slightly negative
+        # when the variance is zero.
+        variance = maximum(squares / weight_sum - mean ** 2, 0)
+
+        squared_weight_sum = weight_sum ** 2
+        bias_correction = (
+            squared_weight_sum / (squared_weight_sum - sum_of_squared_weights)
+        )
+        out[:] = where(
+            missing > 0,
+            nan,
+            sqrt(variance * bias_correction),
+        )
+
 
 # Convenience aliases.
 EWMA = ExponentialWeightedMovingAverage
@@ -7,6 +7,7 @@ from .filter import (
     NullFilter,
     NumExprFilter,
     PercentileFilter,
+    RankFilter,
     SingleAsset,
 )
 from .smoothing import All, Any, AtLeastN
@@ -23,5 +24,6 @@ __all__ = [
     'NullFilter',
     'NumExprFilter',
     'PercentileFilter',
+    'RankFilter',
     'SingleAsset',
 ]
@@ -5,9 +5,15 @@ from itertools import chain
 from operator import attrgetter
 
 from numpy import (
+    arange,
+    argsort,
     float64,
+    full,
+    isnan,
     nan,
-    nanpercentile,
+    percentile,
+    unique,
+    where,
 )
 
 from zipline.errors import (
@@ -16,7 +22,8 @@ from zipline.errors import (
     UnsupportedDataType,
 )
 from zipline.lib.labelarray import LabelArray
-from zipline.lib.rank import is_missing
+from zipline.lib.normalize import grouped_rowwise_top_n
+from zipline.lib.rank import is_missing, masked_top_n_2d
 from zipline.pipeline.expression import (
     BadBinaryOperator,
     FILTER_BINOPS,
@@ -31,10 +38,16 @@ from zipline.pipeline.mixins import (
     RestrictedDTypeMixin,
     SingleInputMixin,
 )
+from zipline.pipeline.sentinels import NotSpecified
 from zipline.pipeline.term import ComputableTerm, Term
 from zipline.utils.input_validation import expect_types
 from zipline.utils.memoize import classlazyval
-from zipline.utils.numpy_utils import bool_dtype, repeat_first_axis
+from zipline.utils.numpy_utils import (
+    bool_dtype,
+    categorical_dtype,
+    int64_dtype,
+    repeat_first_axis,
+)
 
 
 def concat_tuples(*tuples):
@@ -342,23 +355,144 @@ class PercentileFilter(SingleInputMixin, Filter):
         data = arrays[0].copy().astype(float64)
         data[~mask] = nan
 
-        # FIXME: np.nanpercentile **should** support computing multiple bounds
-        # at once, but there's a bug in the logic for multiple bounds in numpy
-        # 1.9.2.  It will be fixed in 1.10.
-        # c.f. https://github.com/numpy/numpy/pull/5981
-        lower_bounds = nanpercentile(
-            data,
-            self._min_percentile,
-            axis=1,
-            keepdims=True,
+        # Move the non-nan values of each row to its front, keeping their
+        # order.  Rows with the same number of values can then be passed to
+        # np.percentile together, which partitions them all at once and gives
+        # the same bounds as calling np.nanpercentile on each row.
+        missing = isnan(data)
+        order = argsort(missing, axis=1, kind='mergesort')
+        packed = data[arange(len(data))[:, None], order]
+        counts = missing.shape[1] - missing.sum(axis=1)
+
+        lower_bounds = full((len(data), 1), nan)
+        upper_bounds = full((len(data), 1), nan)
+        for count in unique(counts):
+            if count == 0:
+                # All the bounds of an empty row are nan.
+                continue
+            rows = where(counts == count)[0]
+            values = packed[rows, :count]
+            lower_bounds[rows, 0] = percentile(
+                values,
+                self._min_percentile,
+                axis=1,
+            )
+            upper_bounds[rows, 0] = percentile(
+                values,
+                self._max_percentile,
+                axis=1,
+            )
+        return (lower_bounds <= data) & (data <= upper_bounds)
+
+
+class RankFilter(Filter):
+    """
+    A Filter matching the assets ranked in the first N places of each row of a
+    Factor, or of each group of a Classifier within each row.
+
+    Parameters
+    ----------
+    factor : zipline.pipeline.Factor
+        The factor to rank.
+    N : int
+        The number of assets to match in each row or group.
+    ascending : bool
+        Whether to match the assets with the smallest values (True) or the
+        largest values (False).
+    mask : zipline.pipeline.Filter
+        Assets to consider when ranking.
+    groupby : zipline.pipeline.Classifier, optional
+        A classifier defining partitions over which to rank.
+
+    Notes
+    -----
+    This produces the same result as::
+
+        factor.rank(ascending=ascending, mask=mask, groupby=groupby) <= N
+
+    including the way ties and missing values are ranked, but each row (or
+    group) is partitioned around its Nth value instead of being sorted.
+
+    Most users should call Factor.top or Factor.bottom rather than construct
+    an instance of this class directly.
+
+    See Also
+    --------
+    :meth:`zipline.pipeline.factors.Factor.top`
+    :meth:`zipline.pipeline.factors.Factor.bottom`
+    """
+    window_length = 0
+
+    def __new__(cls, factor, N, ascending, mask, groupby=NotSpecified):
+        if groupby is NotSpecified:
+            inputs = (factor,)
+        else:
+            # Mirror the mask used by GroupedRowTransform.
+            inputs = (factor, groupby)
+            if mask is NotSpecified:
+                mask = factor.mask
+            else:
+                mask = mask & factor.mask
+
+        return super(RankFilter, cls).__new__(
+            cls,
+            inputs=inputs,
+            mask=mask,
+            N=N,
+            ascending=ascending,
         )
-        upper_bounds = nanpercentile(
+
+    def _init(self, N, ascending, *args, **kwargs):
+        self._N = N
+        self._ascending = ascending
+        return super(RankFilter, self)._init(*args, **kwargs)
+
+    @classmethod
+    def _static_identity(cls, N, ascending, *args, **kwargs):
+        return (
+            super(RankFilter, cls)._static_identity(*args, **kwargs),
+            N,
+            ascending,
+        )
+
+    def _compute(self, arrays, dates, assets, mask):
+        data = arrays[0]
+        if len(arrays) == 1:
+            return masked_top_n_2d(
+                data,
+                mask,
+                self.inputs[0].missing_value,
+                self._N,
+                self._ascending,
+            )
+
+        groupby_expr = self.inputs[1]
+        if groupby_expr.dtype == int64_dtype:
+            group_labels = arrays[1]
+            null_label = groupby_expr.missing_value
+        elif groupby_expr.dtype == categorical_dtype:
+            group_labels = arrays[1].as_int_array()
+            null_label = arrays[1].missing_value_code
+        else:
+            raise TypeError(
+                "Unexpected groupby dtype: %s." % groupby_expr.dtype
+            )
+
+        return grouped_rowwise_top_n(
             data,
-            self._max_percentile,
-            axis=1,
-            keepdims=True,
+            group_labels,
+            self._N,
+            self._ascending,
+            mask=mask & (group_labels != null_label),
+        )
+
+    def __repr__(self):
+        return "{type}({input_}, N={N}, ascending={ascending})".format(
+            type=type(self).__name__,
+            input_=self.inputs[0],
+            N=self._N,
+            ascending=self._ascending,
         )
-        return (lower_bounds <= data) & (data <= upper_bounds)
 
 
 class CustomFilter(PositiveWindowLengthMixin, CustomTermMixin, Filter):
@@ -119,6 +119,36 @@ class TermGraph(DiGraph):
     def _repr_png_(self):
         return self.png.data
 
+    def required_terms(self, initial_terms):
+        """
+        Calculate the terms that must be computed to produce ``self.outputs``.
+
+        Parameters
+        ----------
+        initial_terms : iterable[Term]
+            An iterable of terms that were pre-computed before graph execution.
+
+        Returns
+        -------
+        required : set[Term]
+            Terms that are not in ``initial_terms`` and are needed, directly
+            or transitively, by an output that is not in ``initial_terms``.
+        """
+        initial_terms = set(initial_terms)
+        required = set()
+        stack = [t for t in self.outputs.values() if t not in initial_terms]
+        while stack:
+            term = stack.pop()
+            if term in required:
+                continue
+            required.add(term)
+            # Edges are tuple of (from, to).
+            stack.extend(
+                parent for parent, _ in self.in_edges([term])
+                if parent not in initial_terms
+            )
+        return required
+
     def initial_refcounts(self, initial_terms):
         """
         Calculate initial refcounts for execution of this graph.
@@ -201,6 +231,10 @@ class ExecutionPlan(TermGraph):
     -------
     ordered()
         Return a topologically-sorted iterator over the terms in self.
+    with_dates(all_dates, start_date, end_date)
+        Build an ExecutionPlan for the same terms over a new date range.
+    share_extra_rows(groups, all_dates, start_date, end_date)
+        Compute the same number of extra rows for each term of a group.
     """
     def __init__(self,
                  terms,
@@ -209,14 +243,72 @@ class ExecutionPlan(TermGraph):
                  end_date,
                  min_extra_rows=0):
         super(ExecutionPlan, self).__init__(terms)
+        self._set_all_extra_rows(
+            all_dates,
+            start_date,
+            end_date,
+            min_extra_rows,
+        )
+
+    def with_dates(self, all_dates, start_date, end_date, min_extra_rows=0):
+        """
+        Build an ExecutionPlan for the same terms as ``self`` over a new date
+        range.
 
-        for term in terms.values():
+        The edges of ``self`` are copied into the new plan without revisiting
+        the dependencies of each term, and its topological ordering is shared,
+        so only the date-dependent ``extra_rows`` are recomputed.
+
+        Parameters
+        ----------
+        all_dates : pd.DatetimeIndex
+            An index of all known trading days for which the terms will be
+            computed.
+        start_date : pd.Timestamp
+            The first date for which output is requested.
+        end_date : pd.Timestamp
+            The last date for which output is requested.
+        min_extra_rows : int, optional
+            The minimum number of extra rows to compute for each output.
+
+        Returns
+        -------
+        plan : ExecutionPlan
+            A new plan for the requested dates.
+        """
+        plan = type(self).__new__(type(self))
+        DiGraph.__init__(plan)
+
+        # Node attributes hold ``extra_rows``, so only the structure of the
+        # graph is copied.
+        plan.add_nodes_from(self)
+        plan.add_edges_from(self.edges())
+        plan._outputs = self._outputs
+        plan._ordered = self._ordered
+        plan._frozen = True
+
+        plan._set_all_extra_rows(
+            all_dates,
+            start_date,
+            end_date,
+            min_extra_rows,
+        )
+        return plan
+
+    def _set_all_extra_rows(self,
+                            all_dates,
+                            start_date,
+                            end_date,
+                            min_extra_rows):
+        seen = set()
+        for term in itervalues(self.outputs):
             self.set_extra_rows(
                 term,
                 all_dates,
                 start_date,
                 end_date,
                 min_extra_rows=min_extra_rows,
+                seen=seen,
             )
 
     def set_extra_rows(self,
@@ -224,10 +316,21 @@ class ExecutionPlan(TermGraph):
                        all_dates,
                        start_date,
                        end_date,
-                       min_extra_rows):
+                       min_extra_rows,
+                       seen=None):
         """
         Compute ``extra_rows`` for transitive dependencies of ``root_terms``
+
+        ``seen`` is a set of (term, min_extra_rows) pairs which have already
+        been visited.  Revisiting a pair can't change the result, so shared
+        subgraphs are only traversed once per distinct ``min_extra_rows``.
         """
+        if seen is None:
+            seen = set()
+        if (term, min_extra_rows) in seen:
+            return
+        seen.add((term, min_extra_rows))
+
         # A term can require that additional extra rows beyond the minimum be
         # computed.  This is most often used with downsampled terms, which need
         # to ensure that the first date is a computation date.
@@ -253,8 +356,49 @@ class ExecutionPlan(TermGraph):
                 start_date,
                 end_date,
                 min_extra_rows=extra_rows_for_term + additional_extra_rows,
+                seen=seen,
             )
 
+    def share_extra_rows(self, groups, all_dates, start_date, end_date):
+        """
+        Compute as many extra rows for each term in ``groups`` as are needed
+        by the term of its group needing the most.
+
+        This lets terms which are loaded together, such as columns served by
+        the same loader, be read with a single load.  Terms needing fewer rows
+        truncate the extra rows off through ``offset``, as they do for any
+        input computed for a longer window.
+
+        This must be called before ``extra_rows`` or ``offset`` are read.
+
+        Parameters
+        ----------
+        groups : iterable[iterable[Term]]
+            Groups of terms in ``self`` which should share ``extra_rows``.
+        all_dates : pd.DatetimeIndex
+            An index of all known trading days for which the terms will be
+            computed.
+        start_date : pd.Timestamp
+            The first date for which output is requested.
+        end_date : pd.Timestamp
+            The last date for which output is requested.
+        """
+        seen = set()
+        for group in groups:
+            group = list(group)
+            most_extra_rows = max(
+                self.node[term]['extra_rows'] for term in group
+            )
+            for term in group:
+                self.set_extra_rows(
+                    term,
+                    all_dates,
+                    start_date,
+                    end_date,
+                    min_extra_rows=most_extra_rows,
+                    seen=seen,
+                )
+
     @lazyval
     def offset(self):
         """
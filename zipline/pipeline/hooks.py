@@ -0,0 +1,161 @@
+"""
+Instrumentation hooks for the Pipeline API.
+"""
+from pandas import DataFrame
+from six import iteritems
+
+from zipline.lib.adjusted_array import ensure_ndarray
+from zipline.utils.pandas_utils import sort_values
+
+from .term import LoadableTerm
+
+
+class PipelineHooks(object):
+    """
+    Base class for objects that observe a PipelineEngine as it runs.
+
+    The default implementations of all methods do nothing, so subclasses only
+    need to override the events they are interested in.
+
+    See Also
+    --------
+    :class:`zipline.pipeline.hooks.ProfilingHooks`
+    :class:`zipline.pipeline.engine.SimplePipelineEngine`
+    """
+    def on_load(self, terms, extra_rows, seconds, results):
+        """
+        Called after a group of loadable terms has been loaded.
+
+        Parameters
+        ----------
+        terms : list[zipline.pipeline.data.BoundColumn]
+            The terms that were loaded together.
+        extra_rows : int
+            The number of extra rows loaded for each term in ``terms``.
+        seconds : float
+            The wall time spent in ``load_adjusted_array``.
+        results : dict[BoundColumn -> AdjustedArray]
+            The data produced by the loader.
+        """
+
+    def on_compute(self, term, extra_rows, seconds, result):
+        """
+        Called after a term has been computed.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.ComputableTerm
+            The term that was computed.
+        extra_rows : int
+            The number of extra rows computed for ``term``.
+        seconds : float
+            The wall time spent in ``term._compute``.
+        result : np.ndarray
+            The computed result.
+        """
+
+
+class ProfilingHooks(PipelineHooks):
+    """
+    PipelineHooks that record how long each term took to load or compute and
+    how large its output was.
+
+    Attributes
+    ----------
+    records : list[dict]
+        One entry per loaded or computed term, in the order they finished.
+
+    Methods
+    -------
+    report()
+        Build a DataFrame summarizing ``records``.
+    clear()
+        Forget all records.
+
+    Notes
+    -----
+    Loaders produce all of the terms in a group with a single call, so the
+    time spent loading a group is divided evenly between its terms.
+    """
+    def __init__(self):
+        self.records = []
+
+    def on_load(self, terms, extra_rows, seconds, results):
+        for term in terms:
+            self._record(
+                'load',
+                term,
+                extra_rows,
+                seconds / len(terms),
+                ensure_ndarray(results[term]),
+            )
+
+    def on_compute(self, term, extra_rows, seconds, result):
+        self._record('compute', term, extra_rows, seconds, result)
+
+    def _record(self, kind, term, extra_rows, seconds, array):
+        self.records.append({
+            'term': term,
+            'kind': kind,
+            'seconds': seconds,
+            'nbytes': array.nbytes,
+            'shape': array.shape,
+            'window_length': (
+                0 if isinstance(term, LoadableTerm) else term.window_length
+            ),
+            'extra_rows': extra_rows,
+        })
+
+    def report(self):
+        """
+        Summarize the recorded terms.
+
+        Returns
+        -------
+        report : pd.DataFrame
+            A frame with one row per recorded term, sorted by descending
+            ``seconds``.  The columns are:
+
+            - term : The repr of the term.
+            - kind : 'load' or 'compute'.
+            - seconds : Wall time spent loading or computing the term.
+            - nbytes : Size of the term's output, including extra rows.
+            - shape : Shape of the term's output.
+            - window_length : Window length of the term (0 for loaded terms).
+            - extra_rows : Number of rows computed before the requested
+              start date.
+
+            Use ``report().to_json()`` for a JSON version of the report.
+        """
+        columns = [
+            'term',
+            'kind',
+            'seconds',
+            'nbytes',
+            'shape',
+            'window_length',
+            'extra_rows',
+        ]
+        frame = DataFrame(self.records, columns=columns)
+        frame['term'] = frame['term'].map(repr)
+        return sort_values(frame, 'seconds', ascending=False)
+
+    def clear(self):
+        """
+        Forget all records.
+        """
+        del self.records[:]
+
+    def __repr__(self):
+        totals = {}
+        for record in self.records:
+            totals[record['kind']] = (
+                totals.get(record['kind'], 0) + record['seconds']
+            )
+        return '<%s: %s>' % (
+            type(self).__name__,
+            ', '.join(
+                '%s=%.3fs' % (kind, seconds)
+                for kind, seconds in sorted(iteritems(totals))
+            ),
+        )
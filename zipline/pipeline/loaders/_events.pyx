@@ -0,0 +1,79 @@
+"""
+Compiled kernels for the event indexers in zipline.pipeline.loaders.utils.
+"""
+cimport cython
+from numpy cimport int64_t, intp_t, ndarray
+from numpy import full, intp
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fill_next_event_indexer(ndarray[int64_t, ndim=2] out,
+                            ndarray[intp_t, ndim=1] sid_ixs,
+                            ndarray[intp_t, ndim=1] ts_ixs,
+                            ndarray[intp_t, ndim=1] dt_ixs):
+    """
+    Write the index of each event into ``out`` in the rows from its timestamp
+    up to (but not including) the row after its event date.
+
+    Events are written in reverse order so that, where the windows of two
+    events for the same sid overlap, the earlier event wins.
+
+    Parameters
+    ----------
+    out : ndarray[int64, ndim=2]
+        The indexer to fill, of shape (len(all_dates), len(all_sids)).
+    sid_ixs : ndarray[intp]
+        The column of each event in ``out``.  Must be in bounds.
+    ts_ixs : ndarray[intp]
+        The first row in which each event is known.
+    dt_ixs : ndarray[intp]
+        One past the last row in which each event is the next event.
+    """
+    cdef:
+        Py_ssize_t i, row
+        intp_t sid_ix
+
+    for i in range(sid_ixs.shape[0] - 1, -1, -1):
+        sid_ix = sid_ixs[i]
+        for row in range(ts_ixs[i], dt_ixs[i]):
+            out[row, sid_ix] = i
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fill_previous_event_indexer(ndarray[int64_t, ndim=2] out,
+                                ndarray[intp_t, ndim=1] sid_ixs,
+                                ndarray[intp_t, ndim=1] dt_ixs):
+    """
+    Write the index of each event into ``out`` in the rows from the later of
+    its event date and timestamp up to the first row written for the next
+    event of the same sid.
+
+    Parameters
+    ----------
+    out : ndarray[int64, ndim=2]
+        The indexer to fill, of shape (len(all_dates), len(all_sids)).
+    sid_ixs : ndarray[intp]
+        The column of each event in ``out``.  Must be in bounds.
+    dt_ixs : ndarray[intp]
+        The first row in which each event is the previous event.
+    """
+    cdef:
+        Py_ssize_t i, row
+        intp_t sid_ix, dt_ix
+        Py_ssize_t nrows = out.shape[0]
+        # The first row written for each sid so far.  Rows from there to the
+        # end of the column belong to later events.
+        ndarray[intp_t, ndim=1] last_written = full(
+            out.shape[1],
+            nrows,
+            dtype=intp,
+        )
+
+    for i in range(sid_ixs.shape[0] - 1, -1, -1):
+        sid_ix = sid_ixs[i]
+        dt_ix = dt_ixs[i]
+        for row in range(dt_ix, last_written[sid_ix]):
+            out[row, sid_ix] = i
+        last_written[sid_ix] = dt_ix
@@ -1185,6 +1185,7 @@ class BlazeLoader(dict):
                     sparse_deltas,
                 ),
                 column.missing_value,
+                dtype=column.dtype,
             )
             for column_idx, column in enumerate(columns)
         }
@@ -11,10 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from numpy import (
-    iinfo,
-    uint32,
-)
+from numpy import iinfo, uint32
 
 from zipline.data.us_equity_pricing import (
     BcolzDailyBarReader,
@@ -34,6 +31,13 @@ class USEquityPricingLoader(PipelineLoader):
     PipelineLoader for US Equity Pricing data
 
     Delegates loading of baselines and adjustments.
+
+    Notes
+    -----
+    Each distinct column name is read once per call, and the buffer is shared
+    by every requested column of that name, dtype and missing value.  The
+    engine requests all the columns it needs from a loader in one call, so each
+    column is read once per chunk.
     """
 
     def __init__(self, raw_price_loader, adjustments_loader):
@@ -72,26 +76,45 @@ class USEquityPricingLoader(PipelineLoader):
         start_date, end_date = _shift_dates(
             self._all_sessions, dates[0], dates[-1], shift=1,
         )
-        colnames = [c.name for c in columns]
-        raw_arrays = self.raw_price_loader.load_raw_arrays(
+        colnames = sorted({c.name for c in columns})
+        raw_arrays = dict(zip(
             colnames,
-            start_date,
-            end_date,
-            assets,
-        )
-        adjustments = self.adjustments_loader.load_adjustments(
+            self.raw_price_loader.load_raw_arrays(
+                colnames,
+                start_date,
+                end_date,
+                assets,
+            ),
+        ))
+        adjustments = dict(zip(
             colnames,
-            dates,
-            assets,
-        )
+            self.adjustments_loader.load_adjustments(
+                colnames,
+                dates,
+                assets,
+            ),
+        ))
 
         out = {}
-        for c, c_raw, c_adjs in zip(columns, raw_arrays, adjustments):
+        converted = {}
+        for c in columns:
+            # Masked locations are filled with ``missing_value`` in place, so
+            # a raw array can only be shared by columns filling it alike.
+            key = c.name, c.dtype, c.missing_value
+            try:
+                c_data = converted[key]
+            except KeyError:
+                c_data = converted[key] = raw_arrays[c.name].astype(
+                    c.dtype,
+                    copy=any(name == c.name for name, _, _ in converted),
+                )
             out[c] = AdjustedArray(
-                c_raw.astype(c.dtype),
+                c_data,
                 mask,
-                c_adjs,
+                adjustments[c.name],
                 c.missing_value,
+                copy=False,
+                dtype=c.dtype,
             )
         return out
 
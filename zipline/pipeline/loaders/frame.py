@@ -173,5 +173,6 @@ class DataFrameLoader(PipelineLoader):
                 mask=(good_assets & as_column(good_dates)) & mask,
                 adjustments=self.format_adjustments(dates, assets),
                 missing_value=column.missing_value,
+                dtype=column.dtype,
             ),
         }
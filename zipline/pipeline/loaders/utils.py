@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 from zipline.utils.pandas_utils import mask_between_time
 
+from ._events import fill_next_event_indexer, fill_previous_event_indexer
+
 
 def is_sorted_ascending(a):
     """Check if a numpy array is sorted."""
@@ -57,7 +59,7 @@ def next_event_indexer(all_dates,
     validate_event_metadata(event_dates, event_timestamps, event_sids)
     out = np.full((len(all_dates), len(all_sids)), -1, dtype=np.int64)
 
-    sid_ixs = all_sids.searchsorted(event_sids)
+    sid_ixs = _sid_indices(all_sids, event_sids)
     # side='right' here ensures that we include the event date itself
     # if it's in all_dates.
     dt_ixs = all_dates.searchsorted(event_dates, side='right')
@@ -68,11 +70,7 @@ def next_event_indexer(all_dates,
     # correctness on the fact that event_dates is sorted in ascending order,
     # because we need to overwrite later events with earlier ones if their
     # eligible windows overlap.
-    for i in range(len(event_sids) - 1, -1, -1):
-        start_ix = ts_ixs[i]
-        end_ix = dt_ixs[i]
-        out[start_ix:end_ix, sid_ixs[i]] = i
-
+    fill_next_event_indexer(out, sid_ixs, ts_ixs, dt_ixs)
     return out
 
 
@@ -112,7 +110,7 @@ def previous_event_indexer(all_dates,
     out = np.full((len(all_dates), len(all_sids)), -1, dtype=np.int64)
 
     eff_dts = np.maximum(event_dates, event_timestamps)
-    sid_ixs = all_sids.searchsorted(event_sids)
+    sid_ixs = _sid_indices(all_sids, event_sids)
     dt_ixs = all_dates.searchsorted(eff_dts)
 
     # Walk backwards through the events, writing the index of the event into
@@ -120,15 +118,28 @@ def previous_event_indexer(all_dates,
     # previously-written event.  This depends for correctness on the fact that
     # event_dates is sorted in ascending order, because we need to have written
     # later events so we know where to stop forward-filling earlier events.
-    last_written = {}
-    for i in range(len(event_dates) - 1, -1, -1):
-        sid_ix = sid_ixs[i]
-        dt_ix = dt_ixs[i]
-        out[dt_ix:last_written.get(sid_ix, None), sid_ix] = i
-        last_written[sid_ix] = dt_ix
+    fill_previous_event_indexer(out, sid_ixs, dt_ixs)
     return out
 
 
+def _sid_indices(all_sids, event_sids):
+    """
+    Find the column of each event in an indexer with columns ``all_sids``.
+
+    The compiled indexer kernels don't check bounds, so raise here if an
+    event would be written past the last column.
+    """
+    sid_ixs = all_sids.searchsorted(event_sids)
+    if len(sid_ixs) and sid_ixs.max() >= len(all_sids):
+        raise IndexError(
+            "index %d is out of bounds for axis 1 with size %d" % (
+                sid_ixs.max(),
+                len(all_sids),
+            )
+        )
+    return sid_ixs
+
+
 def normalize_data_query_time(dt, time, tz):
     """Apply the correct time and timezone to a date.
 
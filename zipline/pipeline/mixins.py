@@ -96,6 +96,23 @@ class RestrictedDTypeMixin(object):
             )
 
 
+def _is_incremental(cls):
+    """
+    Whether instances of ``cls`` should be computed with `reset`, `update` and
+    `emit` rather than `compute`.
+
+    ``incremental`` is inherited along with the other methods, but a subclass
+    overriding `compute` below the class which set it expects that `compute`
+    to be called.
+    """
+    if not cls.incremental:
+        return False
+    mro = cls.__mro__
+    declared_by = next(c for c in mro if 'incremental' in vars(c))
+    compute_defined_by = next(c for c in mro if 'compute' in vars(c))
+    return issubclass(declared_by, compute_defined_by)
+
+
 class CustomTermMixin(object):
     """
     Mixin for user-defined rolling-window Terms.
@@ -103,9 +120,16 @@ class CustomTermMixin(object):
     Implements `_compute` in terms of a user-defined `compute` function, which
     is mapped over the input windows.
 
+    Terms which set ``incremental = True`` are instead computed with the
+    `reset`, `update` and `emit` methods, which maintain a running summary of
+    each window rather than re-reading every row of it on every day.  A
+    subclass which overrides `compute` without setting ``incremental`` again
+    is computed with its own `compute`.
+
     Used by CustomFactor, CustomFilter, CustomClassifier, etc.
     """
     ctx = nullctx()
+    incremental = False
 
     def __new__(cls,
                 inputs=NotSpecified,
@@ -145,6 +169,55 @@ class CustomTermMixin(object):
         """
         raise NotImplementedError()
 
+    def reset(self, *windows):
+        """
+        Build the state of an incremental term from complete windows.
+
+        Called with one ``(window_length, num_assets)`` array per input on the
+        first day of a computation, whenever an adjustment changes rows that
+        were already seen, whenever `update` returns None, and every
+        ``window_length`` days to discard accumulated rounding error.  Params
+        are passed as keyword arguments.
+
+        Returns
+        -------
+        state : object
+            The state to pass to `update` and `emit`.
+        """
+        raise NotImplementedError()
+
+    def update(self, state, entering, leaving):
+        """
+        Advance the state of an incremental term by one day.
+
+        Parameters
+        ----------
+        state : object
+            The state returned by the previous call to `reset` or `update`.
+            It may be modified in place.
+        entering : tuple[np.ndarray]
+            For each input, the row which was added to the window.
+        leaving : tuple[np.ndarray]
+            For each input, the row which was dropped from the window.
+
+        Params are passed as keyword arguments.
+
+        Returns
+        -------
+        state : object or None
+            The new state, or None to rebuild it by calling `reset` with the
+            complete windows.
+        """
+        raise NotImplementedError()
+
+    def emit(self, state, out):
+        """
+        Write the values described by ``state`` into ``out``.
+
+        Params are passed as keyword arguments.
+        """
+        raise NotImplementedError()
+
     def _allocate_output(self, windows, shape):
         """
         Allocate an output array whose rows should be passed to `self.compute`.
@@ -190,6 +263,9 @@ class CustomTermMixin(object):
         Call the user's `compute` function on each window with a pre-built
         output array.
         """
+        if self.ndim == 2 and _is_incremental(type(self)):
+            return self._compute_incremental(windows, dates, assets, mask)
+
         format_inputs = self._format_inputs
         compute = self.compute
         params = self.params
@@ -214,6 +290,55 @@ class CustomTermMixin(object):
                 out[idx][out_mask] = out_row
         return out
 
+    def _compute_incremental(self, windows, dates, assets, mask):
+        """
+        Compute an incremental term by updating its state with the rows that
+        enter and leave each window.
+
+        The state always covers every asset, so incremental terms must treat
+        each column independently.  ``mask`` is only applied to the output.
+        """
+        reset = self.reset
+        update = self.update
+        emit = self.emit
+        params = self.params
+        window_length = self.window_length
+
+        out = self._allocate_output(windows, mask.shape)
+        row = self._allocate_output(windows, mask.shape[1:])
+
+        state = previous = None
+        updates = 0
+        with self.ctx:
+            for idx in range(len(dates)):
+                current = [next(w) for w in windows]
+
+                # The rows we've already seen are only still valid if no
+                # adjustments were applied to them.  Rebuild from scratch
+                # every window_length days so that rounding errors in the
+                # running state don't accumulate.
+                adjusted = any(getattr(w, 'adjusted', True) for w in windows)
+                if adjusted or updates == window_length:
+                    state = None
+                elif state is not None:
+                    state = update(
+                        state,
+                        tuple(window[-1] for window in current),
+                        tuple(window[0] for window in previous),
+                        **params
+                    )
+                    updates += 1
+
+                if state is None:
+                    state = reset(*current, **params)
+                    updates = 0
+
+                emit(state, row, **params)
+                out_mask = mask[idx]
+                out[idx][out_mask] = row[out_mask]
+                previous = current
+        return out
+
     def short_repr(self):
         return type(self).__name__ + '(%d)' % self.window_length
 
@@ -0,0 +1,457 @@
+"""
+Rewrites of Pipeline term graphs that make them cheaper to compute.
+"""
+import ast
+from collections import Counter
+from numbers import Number
+import sys
+
+from six import iteritems
+
+from zipline.utils.numpy_utils import bool_dtype, float64_dtype
+
+from .cache import _fingerprint, _UnstableFingerprint
+from .expression import NumericalExpression
+from .factors.factor import NumExprFactor, float_result_dtype
+from .filters.filter import NumExprFilter
+from .graph import TermGraph
+
+# Relative cost of one pass over a (dates x assets) array, in units of the
+# cost of applying a cheap arithmetic operator to every element.  numexpr
+# evaluates expressions blockwise, so the operators in an expression are
+# nearly free compared with reading and writing full arrays.
+PASS_COST = 4
+
+# Cost of applying operators that aren't cheap arithmetic.
+_EXPENSIVE_OP_COST = 8
+_EXPENSIVE_OPS = frozenset(['**', '%'])
+
+_BINOPS = {
+    ast.Add: '+',
+    ast.Sub: '-',
+    ast.Mult: '*',
+    ast.Div: '/',
+    ast.Mod: '%',
+    ast.Pow: '**',
+    ast.BitAnd: '&',
+    ast.BitOr: '|',
+    ast.BitXor: '^',
+}
+_UNARYOPS = {
+    ast.USub: '-',
+    ast.UAdd: '+',
+    ast.Invert: '~',
+}
+_COMPARISONS = {
+    ast.Lt: '<',
+    ast.LtE: '<=',
+    ast.Eq: '==',
+    ast.NotEq: '!=',
+    ast.GtE: '>=',
+    ast.Gt: '>',
+}
+# Comparisons that are rewritten as their mirror image with swapped operands,
+# so that ``a > b`` and ``b < a`` have the same canonical form.
+_MIRRORED = {'>': '<', '>=': '<='}
+_COMMUTATIVE = frozenset(['+', '*', '&', '|', '^', '==', '!='])
+_BOOLEAN_OPS = frozenset(['&', '|', '^', '~', '<', '<=', '==', '!='])
+
+# Dtypes of the inputs of expressions we rewrite.  Materializing a float32
+# subexpression would round it before it is combined with other values,
+# which numexpr doesn't do when evaluating it inline.
+_EXACT_DTYPES = frozenset([bool_dtype, float64_dtype])
+
+# Python 3.8+ parses numbers as ``ast.Constant`` and deprecates ``ast.Num``.
+if sys.version_info >= (3, 8):
+    _CONSTANT_TYPES = (ast.Constant,)
+else:
+    _CONSTANT_TYPES = (ast.Num,)
+
+
+class _Unsupported(Exception):
+    """
+    Raised when an expression contains syntax we don't know how to rewrite.
+    """
+
+
+def eliminate_common_subexpressions(terms):
+    """
+    Rewrite the NumericalExpressions in ``terms`` so that subexpressions
+    shared between them are computed once.
+
+    Each output expression is parsed into a canonical tree in which the
+    operands of commutative operators are sorted and ``>``/``>=`` are
+    mirrored into ``<``/``<=``, so equivalent expressions built separately
+    compare equal.  Subexpressions that occur more than once across the
+    outputs are then considered, largest first, and replaced by a reference
+    to a single term when that is cheaper than evaluating them inline:
+
+    - If an equivalent expression is already computed elsewhere in the graph,
+      it is always reused.
+    - Otherwise, a new term is materialized if the cost of evaluating the
+      subexpression in every user exceeds the cost of computing it once,
+      writing it out, and reading it back in each user.  See ``PASS_COST``.
+
+    Parameters
+    ----------
+    terms : dict[object -> zipline.pipeline.term.Term]
+        The output terms of a pipeline, as passed to ``TermGraph``.
+
+    Returns
+    -------
+    rewritten : dict[object -> zipline.pipeline.term.Term]
+        ``terms`` with its NumericalExpressions replaced by equivalent
+        expressions over shared subexpressions.
+
+    Notes
+    -----
+    Only outputs which no other term depends on are rewritten.  Expressions
+    consumed by other terms are left as they are, but their results can still
+    be reused by the rewritten outputs.
+
+    Only expressions whose inputs are all float64 factors or filters are
+    considered.  Operators are never reassociated, so rewritten expressions
+    produce the same values as the originals.
+
+    Operands of commutative operators are ordered by a description of their
+    terms which is the same in every process, so the same pipeline is always
+    rewritten to the same expressions.  Expressions over terms which can't be
+    described that way (see :class:`~zipline.pipeline.cache.TermCache`) are
+    left as they are.
+    """
+    graph = TermGraph(terms)
+    keys = _term_keys(graph)
+
+    # Canonical trees of the outputs we're allowed to rewrite, and of the
+    # expressions that will be computed regardless of what we do.
+    original = {}
+    existing = {}
+    for term in graph:
+        if not isinstance(term, NumericalExpression):
+            continue
+        try:
+            tree = _canonical_tree(term._expr, term.inputs, keys)
+        except _Unsupported:
+            continue
+        if graph.out_degree(term):
+            existing.setdefault(tree, term)
+        else:
+            original[term] = tree
+
+    # Outputs equivalent to an expression computed elsewhere just reuse it.
+    resolved = {
+        term: existing[tree]
+        for term, tree in iteritems(original)
+        if tree in existing
+    }
+    roots = {
+        term: tree
+        for term, tree in iteritems(original)
+        if term not in resolved
+    }
+
+    # Dtypes of the outputs and of the subexpressions we've decided to
+    # materialize, keyed by their (rewritten) trees.
+    dtypes = {tree: term.dtype for term, tree in iteritems(roots)}
+
+    while True:
+        counts = Counter()
+        for tree in dtypes:
+            _count_subtrees(tree, counts, is_root=True)
+
+        for subtree, uses in sorted(
+            iteritems(counts),
+            key=lambda item: -_size(item[0]),
+        ):
+            if not _leaves(subtree):
+                # Leave constant folding to numexpr.
+                continue
+            if subtree in existing:
+                replacement = ('term', existing[subtree])
+            elif subtree in dtypes:
+                replacement = ('sub', subtree)
+            elif _should_materialize(subtree, uses):
+                replacement = ('sub', subtree)
+            else:
+                continue
+            break
+        else:
+            break
+
+        dtypes = {
+            _replace(tree, subtree, replacement, is_root=True): dtype
+            for tree, dtype in iteritems(dtypes)
+        }
+        if replacement[0] == 'sub' and subtree not in dtypes:
+            dtypes[subtree] = _infer_dtype(subtree, dtypes)
+        roots = {
+            term: _replace(tree, subtree, replacement, is_root=True)
+            for term, tree in iteritems(roots)
+        }
+
+    # Outputs that weren't changed keep their original terms, and outputs
+    # with the same canonical tree share a single term.
+    by_tree = {
+        (tree, term.dtype): term for tree, term in iteritems(existing)
+    }
+    for term, tree in iteritems(roots):
+        if tree == original[term]:
+            by_tree.setdefault((tree, term.dtype), term)
+    for term, tree in iteritems(roots):
+        resolved[term] = _build(tree, term.dtype, dtypes, by_tree)
+
+    return {
+        name: resolved.get(term, term) for name, term in iteritems(terms)
+    }
+
+
+def _should_materialize(tree, uses):
+    """
+    Decide whether computing ``tree`` once is cheaper than computing it in
+    each of its ``uses``.
+    """
+    ops = _op_cost(tree)
+    nleaves = len(_leaves(tree))
+    inline = uses * (ops + PASS_COST * nleaves)
+    # Read the leaves once, write the result, then read it in each user.
+    materialized = ops + PASS_COST * (nleaves + 1 + uses)
+    return materialized < inline
+
+
+def _canonical_tree(expr, inputs, keys):
+    """
+    Parse a numexpr expression string into a canonical tree.
+
+    Leaves of the tree are ``('term', term)`` for the inputs of the
+    expression and ``('const', literal)`` for constants.  Interior nodes are
+    ``('binop', op, left, right)``, ``('unary', op, operand)`` and
+    ``('call', funcname, arg, ...)``.
+
+    ``keys`` maps the terms which may appear in the tree to the strings used
+    to order them.
+    """
+    try:
+        node = ast.parse(expr.strip(), mode='eval').body
+    except SyntaxError:
+        raise _Unsupported(expr)
+    return _canonicalize(node, inputs, keys)
+
+
+def _canonicalize(node, inputs, keys):
+    if isinstance(node, ast.BinOp):
+        op = _binop_symbol(_BINOPS, node.op)
+        return _canonical_binop(
+            op,
+            _canonicalize(node.left, inputs, keys),
+            _canonicalize(node.right, inputs, keys),
+            keys,
+        )
+    elif isinstance(node, ast.Compare):
+        if len(node.ops) != 1:
+            raise _Unsupported(node)
+        op = _binop_symbol(_COMPARISONS, node.ops[0])
+        left = _canonicalize(node.left, inputs, keys)
+        right = _canonicalize(node.comparators[0], inputs, keys)
+        if op in _MIRRORED:
+            op, left, right = _MIRRORED[op], right, left
+        return _canonical_binop(op, left, right, keys)
+    elif isinstance(node, ast.UnaryOp):
+        op = _binop_symbol(_UNARYOPS, node.op)
+        return ('unary', op, _canonicalize(node.operand, inputs, keys))
+    elif isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise _Unsupported(node)
+        return ('call', node.func.id) + tuple(
+            _canonicalize(arg, inputs, keys) for arg in node.args
+        )
+    elif isinstance(node, ast.Name):
+        if node.id == 'inf':
+            return ('const', 'inf')
+        if not node.id.startswith('x_'):
+            raise _Unsupported(node)
+        term = inputs[int(node.id[2:])]
+        if term.dtype not in _EXACT_DTYPES or term not in keys:
+            raise _Unsupported(term)
+        return ('term', term)
+    elif isinstance(node, _CONSTANT_TYPES):
+        value = node.value if sys.version_info >= (3, 8) else node.n
+        if isinstance(value, bool) or not isinstance(value, Number):
+            raise _Unsupported(node)
+        return ('const', repr(value))
+    raise _Unsupported(node)
+
+
+def _binop_symbol(symbols, op):
+    try:
+        return symbols[type(op)]
+    except KeyError:
+        raise _Unsupported(op)
+
+
+def _canonical_binop(op, left, right, keys):
+    if op in _COMMUTATIVE and _sort_key(right, keys) < _sort_key(left, keys):
+        left, right = right, left
+    return ('binop', op, left, right)
+
+
+def _sort_key(tree, keys):
+    """
+    A string that orders canonical trees the same way in every process.
+    """
+    kind = tree[0]
+    if kind == 'term':
+        return 't' + keys[tree[1]]
+    elif kind == 'const':
+        return 'c' + tree[1]
+    elif kind == 'sub':
+        return 's(%s)' % _sort_key(tree[1], keys)
+    return '%s%s(%s)' % (
+        kind,
+        tree[1],
+        ','.join(_sort_key(child, keys) for child in tree[2:]),
+    )
+
+
+def _term_keys(graph):
+    """
+    Describe the terms of ``graph`` the same way in every process, omitting
+    terms which can't be.
+    """
+    memo = {}
+    keys = {}
+    for term in graph:
+        try:
+            keys[term] = _fingerprint(term, memo)
+        except _UnstableFingerprint:
+            pass
+    return keys
+
+
+def _is_leaf(tree):
+    return tree[0] in ('term', 'const', 'sub')
+
+
+def _children(tree):
+    return () if _is_leaf(tree) else tree[2:]
+
+
+def _size(tree):
+    return 1 + sum(_size(child) for child in _children(tree))
+
+
+def _leaves(tree, out=None):
+    """
+    The distinct non-constant leaves of ``tree``.
+    """
+    if out is None:
+        out = set()
+    if tree[0] in ('term', 'sub'):
+        out.add(tree)
+    for child in _children(tree):
+        _leaves(child, out)
+    return out
+
+
+def _op_cost(tree):
+    if _is_leaf(tree):
+        return 0
+    if tree[0] == 'call' or tree[1] in _EXPENSIVE_OPS:
+        cost = _EXPENSIVE_OP_COST
+    else:
+        cost = 1
+    return cost + sum(_op_cost(child) for child in _children(tree))
+
+
+def _count_subtrees(tree, counts, is_root=False):
+    """
+    Count the occurrences of each interior node below ``tree``.
+    """
+    if _is_leaf(tree):
+        return
+    if not is_root:
+        counts[tree] += 1
+    for child in _children(tree):
+        _count_subtrees(child, counts)
+
+
+def _replace(tree, old, new, is_root=False):
+    """
+    Replace every occurrence of ``old`` below ``tree`` with ``new``.
+
+    References to materialized subexpressions are rewritten the same way as
+    the subexpressions themselves, so they stay valid keys.
+    """
+    if not is_root and tree == old:
+        return new
+    if tree[0] == 'sub':
+        return ('sub', _replace(tree[1], old, new, is_root=True))
+    if _is_leaf(tree):
+        return tree
+    return tree[:2] + tuple(
+        _replace(child, old, new) for child in _children(tree)
+    )
+
+
+def _infer_dtype(tree, dtypes):
+    """
+    Compute the dtype of a subexpression we're going to materialize.
+    """
+    if tree[0] in ('binop', 'unary') and tree[1] in _BOOLEAN_OPS:
+        return bool_dtype
+    return float_result_dtype(*(
+        leaf[1].dtype if leaf[0] == 'term' else dtypes[leaf[1]]
+        for leaf in _leaves(tree)
+    ))
+
+
+def _build(tree, dtype, dtypes, by_tree):
+    """
+    Get or build the term computing ``tree``, recording it in ``by_tree``.
+    """
+    try:
+        return by_tree[tree, dtype]
+    except KeyError:
+        pass
+
+    binds = []
+    expr = _render(tree, binds)
+    inputs = tuple(
+        leaf[1] if leaf[0] == 'term' else
+        _build(leaf[1], dtypes[leaf[1]], dtypes, by_tree)
+        for leaf in binds
+    )
+    if dtype == bool_dtype:
+        term = NumExprFilter.create(expr, inputs)
+    else:
+        term = NumExprFactor(expr, inputs, dtype=dtype)
+    by_tree[tree, dtype] = term
+    return term
+
+
+def _render(tree, binds):
+    """
+    Render ``tree`` as a numexpr expression string, appending its leaves to
+    ``binds`` in order of first appearance.
+    """
+    kind = tree[0]
+    if kind in ('term', 'sub'):
+        try:
+            idx = binds.index(tree)
+        except ValueError:
+            idx = len(binds)
+            binds.append(tree)
+        return 'x_%d' % idx
+    elif kind == 'const':
+        return tree[1]
+    elif kind == 'binop':
+        return '(%s) %s (%s)' % (
+            _render(tree[2], binds),
+            tree[1],
+            _render(tree[3], binds),
+        )
+    elif kind == 'unary':
+        return '%s(%s)' % (tree[1], _render(tree[2], binds))
+    return '%s(%s)' % (
+        tree[1],
+        ', '.join(_render(arg, binds) for arg in tree[2:]),
+    )
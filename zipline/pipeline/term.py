@@ -129,6 +129,9 @@ class Term(with_metaclass(ABCMeta, object)):
                     params=params,
                     *args, **kwargs
                 )
+            # Remember the identity so that it can be used to build keys
+            # that are stable across processes (see TermCache).
+            new_instance._identity = identity
             return new_instance
 
     @classmethod
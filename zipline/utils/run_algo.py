@@ -18,7 +18,7 @@ from zipline.algorithm import TradingAlgorithm
 from zipline.data.bundles.core import load
 from zipline.data.data_portal import DataPortal
 from zipline.finance.trading import TradingEnvironment
-from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.data import USEquityPricing, USEquityPricingFloat32
 from zipline.pipeline.loaders import USEquityPricingLoader
 from zipline.utils.calendars import get_calendar
 from zipline.utils.factory import create_simulation_parameters
@@ -58,6 +58,7 @@ def _run(handle_data,
          data,
          bundle,
          bundle_timestamp,
+         adjustments_in_memory,
          start,
          end,
          output,
@@ -117,6 +118,7 @@ def _run(handle_data,
             bundle,
             environ,
             bundle_timestamp,
+            adjustments_in_memory,
         )
 
         prefix, connstr = re.split(
@@ -145,8 +147,12 @@ def _run(handle_data,
             bundle_data.adjustment_reader,
         )
 
+        pricing_columns = (
+            USEquityPricing.columns | USEquityPricingFloat32.columns
+        )
+
         def choose_loader(column):
-            if column in USEquityPricing.columns:
+            if column in pricing_columns:
                 return pipeline_loader
             raise ValueError(
                 "No PipelineLoader registered for column %s." % column
@@ -252,6 +258,7 @@ def run_algorithm(start,
                   data=None,
                   bundle=None,
                   bundle_timestamp=None,
+                  adjustments_in_memory=False,
                   default_extension=True,
                   extensions=(),
                   strict_extensions=True,
@@ -296,6 +303,10 @@ def run_algorithm(start,
         The datetime to lookup the bundle data for. This defaults to the
         current time.
         This argument is mutually exclusive with ``data``.
+    adjustments_in_memory : bool, optional
+        Read the bundle's splits, mergers and dividends into memory on first
+        use instead of querying the adjustments database for every asset.
+        Only used with ``bundle``.
     default_extension : bool, optional
         Should the default zipline extension be loaded. This is found at
         ``$ZIPLINE_ROOT/extension.py``
@@ -353,6 +364,7 @@ def run_algorithm(start,
         data=data,
         bundle=bundle,
         bundle_timestamp=bundle_timestamp,
+        adjustments_in_memory=adjustments_in_memory,
         start=start,
         end=end,
         output=os.devnull,